@@ -5,13 +5,12 @@ from typing import Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.core.security import verify_password
+from app.api.core.cache import MISSING, principal_cache
 from app.api import dependencies 
 from app.models import user_model
-from app.schemas import token_schema
+from app.schemas import token_schema, user_schema
 from app.api.services import user_service
 
 # --- Configuração do JWT ---
@@ -21,7 +20,11 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+# O jose (e o backend de criptografia) é importado só quando um token é emitido ou
+# validado pela primeira vez, para não pesar na inicialização dos workers.
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
+    from jose import jwt
+
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.now(timezone.utc) + expires_delta
@@ -31,10 +34,17 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-def get_current_user(
+async def get_current_user(
     token: str = Depends(oauth2_scheme), 
-    db: Session = Depends(dependencies.get_db) 
+    db: AsyncSession = Depends(dependencies.get_async_db) 
 ):
+    # Token já validado recentemente: dispensa decode do JWT e consulta ao banco
+    cached_user = principal_cache.get(token)
+    if cached_user is not MISSING:
+        return cached_user
+
+    from jose import JWTError, jwt
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -49,7 +59,10 @@ def get_current_user(
     except JWTError:
         raise credentials_exception
     
-    user = user_service.get_user_by_username(db, username=token_data.username)
+    user = await user_service.get_user_by_username_async(db, username=token_data.username)
     if user is None:
         raise credentials_exception
-    return user
\ No newline at end of file
+
+    principal = user_schema.User.model_validate(user)
+    principal_cache.set(token, principal, expires_at=payload.get("exp", 0))
+    return principal
\ No newline at end of file
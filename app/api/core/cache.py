@@ -0,0 +1,132 @@
+# app/api/core/cache.py
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from app.api.core.config import settings
+
+# Marcador para diferenciar "não está no cache" de um valor None guardado no cache
+MISSING = object()
+
+
+class LRUCache:
+    """
+    Cache em memória, thread-safe, com tamanho máximo (despejo LRU) e TTL por entrada.
+    Mantém contadores de acertos, faltas e despejos para ajudar a dimensioná-lo.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """Retorna o valor guardado, ou 'default' se a chave não existir ou tiver expirado."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Guarda um valor. 'ttl' sobrescreve o TTL padrão apenas para esta entrada."""
+        if self.maxsize <= 0:
+            return
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable) -> None:
+        """Remove uma chave do cache, se existir."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def pop_where(self, predicate: Callable[[Hashable, Any], bool]) -> int:
+        """Remove todas as entradas para as quais predicate(chave, valor) é verdadeiro."""
+        with self._lock:
+            keys = [key for key, (value, _) in self._data.items() if predicate(key, value)]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """Esvazia o cache e zera os contadores."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        """Retorna os contadores do cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_ratio": (self.hits / lookups) if lookups else 0.0,
+            }
+
+
+
+class PrincipalCache:
+    """
+    Cache dos usuários autenticados, indexado pelo token JWT. Um acerto dispensa a
+    verificação da assinatura e a consulta do usuário no banco. Cada entrada vive no
+    máximo 'ttl' segundos e nunca além do 'exp' do próprio token.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.ttl = ttl
+        self._cache = LRUCache(maxsize=maxsize, ttl=ttl)
+
+    def get(self, token: str) -> Any:
+        """Retorna o usuário do token, ou MISSING."""
+        return self._cache.get(token)
+
+    def set(self, token: str, user: Any, expires_at: float) -> None:
+        """Guarda o usuário do token; 'expires_at' é o 'exp' do token (epoch, em segundos)."""
+        ttl = min(self.ttl, expires_at - time.time())
+        if ttl > 0:
+            self._cache.set(token, user, ttl=ttl)
+
+    def invalidate_user(self, user_id: int) -> int:
+        """Remove todos os tokens em cache de um usuário (após update ou delete)."""
+        return self._cache.pop_where(lambda token, user: user.id == user_id)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return self._cache.stats()
+
+
+principal_cache = PrincipalCache(maxsize=settings.principal_cache_maxsize, ttl=settings.principal_cache_ttl)
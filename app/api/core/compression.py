@@ -0,0 +1,219 @@
+# app/api/core/compression.py
+
+import zlib
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import Response
+
+from app.api.core.cache import LRUCache, MISSING
+from app.api.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # brotli é opcional: sem ele, só gzip
+    brotli = None
+
+# Cache das respostas grandes de coleção já serializadas e comprimidas, por
+# (chave da resposta, codificação). A chave inclui o contador de versões dos santos
+# (só cresce, em todos os workers): uma escrita faz as entradas antigas simplesmente
+# não serem mais usadas.
+collection_cache = LRUCache(maxsize=settings.collection_cache_maxsize, ttl=settings.collection_cache_ttl)
+
+
+def supported_encodings() -> Tuple[str, ...]:
+    """Codificações disponíveis, em ordem de preferência (brotli comprime mais que gzip)."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate(accept_encoding: Optional[str], available: Optional[Tuple[str, ...]] = None) -> Optional[str]:
+    """
+    Escolhe a codificação da resposta a partir do cabeçalho Accept-Encoding
+    (ex.: 'gzip, br;q=0.9'), respeitando os pesos q. None = sem compressão.
+    'available' restringe as opções (ex.: as cópias pré-comprimidas existentes).
+    """
+    if not settings.compression_enabled or not accept_encoding:
+        return None
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name.strip().lower()] = weight
+
+    best, best_weight = None, 0.0
+    for encoding in available if available is not None else supported_encodings():
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+class _Compressor:
+    """Compressão incremental (para respostas em streaming) em gzip ou brotli."""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=settings.compression_brotli_quality)
+        else:
+            self._zlib = zlib.compressobj(settings.compression_gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, chunk: bytes, flush: bool = False) -> bytes:
+        """Comprime um pedaço; com 'flush', tudo que já foi recebido sai agora (streaming)."""
+        if self.encoding == "br":
+            data = self._brotli.process(chunk)
+            return data + self._brotli.flush() if flush else data
+        data = self._zlib.compress(chunk)
+        return data + self._zlib.flush(zlib.Z_SYNC_FLUSH) if flush else data
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._brotli.finish()
+        return self._zlib.flush()
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    compressor = _Compressor(encoding)
+    return compressor.compress(body) + compressor.finish()
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    """Se o tipo de conteúdo está na lista dos que valem a pena comprimir."""
+    return bool(content_type) and content_type.startswith(settings.compression_content_types)
+
+
+def weaken_etag(headers: MutableHeaders) -> None:
+    """
+    Troca um ETag forte pelo fraco equivalente (W/"..."): o corpo comprimido pelo
+    middleware não é, byte a byte, o que a rota descreveu com o ETag forte.
+    """
+    etag = headers.get("etag")
+    if etag is not None and not etag.startswith("W/"):
+        headers["ETag"] = "W/" + etag
+
+
+async def cached_collection_response(
+    key: Hashable,
+    encoding: Optional[str],
+    render: Callable[[], Awaitable[Tuple[bytes, Dict[str, str]]]],
+    media_type: str = "application/json",
+) -> Response:
+    """
+    Resposta de uma coleção grande servida do cache já comprimida. 'key' identifica
+    a resposta e a versão dos dados (as partes do ETag, menos a codificação: cada
+    codificação tem seu próprio ETag, que o chamador põe na resposta); 'render'
+    serializa o corpo e devolve também os cabeçalhos que dependem dele (ex.: o cursor
+    da próxima página), e só é chamado na falta. O corpo sem compressão também fica
+    guardado, para as demais codificações não precisarem serializar de novo. Respostas
+    menores que o mínimo de compressão não são guardadas.
+    """
+    cached = collection_cache.get((key, encoding))
+    if cached is MISSING:
+        raw = collection_cache.get((key, None))
+        if raw is MISSING:
+            raw = await render()
+            if len(raw[0]) >= settings.compression_min_size:
+                collection_cache.set((key, None), raw)
+        body, headers = raw
+        if encoding is not None and len(body) >= settings.compression_min_size:
+            cached = (compress(body, encoding), {**headers, "Content-Encoding": encoding})
+            collection_cache.set((key, encoding), cached)
+        else:
+            cached = raw
+
+    body, headers = cached
+    return Response(body, media_type=media_type, headers={**headers, "Vary": "Accept-Encoding"})
+
+
+class CompressionMiddleware:
+    """
+    Middleware ASGI que comprime as respostas (brotli ou gzip, conforme o Accept-Encoding)
+    acima de um tamanho mínimo e de tipos de conteúdo da lista permitida. Respostas em
+    streaming são comprimidas pedaço a pedaço. Respostas que já têm Content-Encoding
+    (ex.: vindas do cache comprimido) passam direto, assim como as que aceitam Range
+    (arquivos): os intervalos de bytes se referem ao corpo sem esta compressão.
+    O ETag forte de uma resposta comprimida aqui vira fraco, e o de um 304 também
+    (ele revalida a cópia que pode ter sido comprimida), exceto quando a rota já
+    varia por Accept-Encoding e põe a codificação no próprio ETag.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start = None
+        compressor: Optional[_Compressor] = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start, compressor, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                headers = Headers(raw=message["headers"])
+                passthrough = (
+                    "content-encoding" in headers
+                    or "accept-ranges" in headers
+                    or "content-range" in headers
+                    or message["status"] in (204, 206, 304)
+                    or not is_compressible(headers.get("content-type"))
+                )
+                if passthrough:
+                    if message["status"] == 304 and "accept-encoding" not in headers.get("vary", "").lower():
+                        weaken_etag(MutableHeaders(raw=message["headers"]))
+                    await send(message)
+                return
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] != "http.response.body":
+                # Ex.: http.response.pathsend, sem corpo para comprimir
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is None:
+                # Primeiro pedaço do corpo: decide se comprime
+                if not more_body and len(body) < settings.compression_min_size:
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+                compressor = _Compressor(encoding)
+                headers = MutableHeaders(raw=start["headers"])
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                weaken_etag(headers)
+                if more_body:
+                    del headers["Content-Length"]
+                    await send(start)
+                else:
+                    body = compress(body, encoding)
+                    headers["Content-Length"] = str(len(body))
+                    await send(start)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+
+            if more_body:
+                chunk = compressor.compress(body, flush=True)
+            else:
+                chunk = compressor.compress(body) + compressor.finish()
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,175 @@
+# app/api/core/config.py
+
+import os
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, default))
+
+
+def _env_float(name: str, default: float) -> float:
+    return float(os.getenv(name, default))
+
+
+def _env_str(name: str, default: str) -> str:
+    return os.getenv(name, default)
+
+
+def _env_budgets(name: str, default: str = "") -> dict:
+    """Orçamentos de consultas por rota: 'GET /santos/=3,GET /santos/{id_or_name}=2'."""
+    budgets = {}
+    for item in os.getenv(name, default).split(","):
+        if "=" in item:
+            route, limit = item.rsplit("=", 1)
+            budgets[route.strip()] = int(limit)
+    return budgets
+
+
+def _env_rate(name: str, default: str) -> Optional[Tuple[int, float]]:
+    """Limite 'N/S' (N requisições a cada S segundos); '0' ou 'off' desliga o limite."""
+    value = os.getenv(name, default).strip().lower()
+    if value in ("", "0", "off"):
+        return None
+    requests, seconds = value.split("/", 1)
+    return int(requests), float(seconds)
+
+
+def _async_url(url: str) -> str:
+    """URL equivalente para o driver assíncrono (sqlite:// -> sqlite+aiosqlite://)."""
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url[len("sqlite://"):]
+    return url
+
+
+# Configurações da aplicação, lidas das variáveis de ambiente com valores padrão
+@dataclass
+class Settings:
+    # Banco de dados
+    database_url: str = field(default_factory=lambda: _env_str("DATABASE_URL", "sqlite:///./app/db/saintdoom.db"))
+    async_database_url: str = field(default_factory=lambda: _env_str("ASYNC_DATABASE_URL", ""))
+    db_pool_size: int = field(default_factory=lambda: _env_int("DB_POOL_SIZE", 5))
+    db_max_overflow: int = field(default_factory=lambda: _env_int("DB_MAX_OVERFLOW", 10))
+    db_pool_timeout: float = field(default_factory=lambda: _env_float("DB_POOL_TIMEOUT", 30.0))
+    # Leituras (GETs): engine própria, só leitura, com o próprio pool. Vazio = o mesmo
+    # arquivo de DATABASE_URL; num nó de leitura, a URL da cópia do banco (réplica)
+    read_database_url: str = field(default_factory=lambda: _env_str("READ_DATABASE_URL", ""))
+    async_read_database_url: str = field(default_factory=lambda: _env_str("ASYNC_READ_DATABASE_URL", ""))
+    db_read_pool_size: int = field(default_factory=lambda: _env_int("DB_READ_POOL_SIZE", 2 * (os.cpu_count() or 1)))
+    db_read_max_overflow: int = field(default_factory=lambda: _env_int("DB_READ_MAX_OVERFLOW", 20))
+
+    # PRAGMAs aplicados a cada conexão SQLite
+    sqlite_journal_mode: str = field(default_factory=lambda: _env_str("SQLITE_JOURNAL_MODE", "WAL"))
+    sqlite_synchronous: str = field(default_factory=lambda: _env_str("SQLITE_SYNCHRONOUS", "NORMAL"))
+    sqlite_busy_timeout_ms: int = field(default_factory=lambda: _env_int("SQLITE_BUSY_TIMEOUT_MS", 5000))
+    # Negativo = tamanho em KiB (padrão: 64 MiB de cache de páginas por conexão)
+    sqlite_cache_size: int = field(default_factory=lambda: _env_int("SQLITE_CACHE_SIZE", -65536))
+    sqlite_mmap_size: int = field(default_factory=lambda: _env_int("SQLITE_MMAP_SIZE", 268435456))
+    sqlite_temp_store: str = field(default_factory=lambda: _env_str("SQLITE_TEMP_STORE", "MEMORY"))
+
+    # Respostas de leitura de santos serializadas direto com orjson (sem revalidar o response_model)
+    fast_json: bool = field(default_factory=lambda: _env_str("FAST_JSON", "0").lower() in ("1", "true", "yes"))
+
+    # Compressão das respostas (gzip, e brotli se instalado)
+    compression_enabled: bool = field(default_factory=lambda: _env_str("COMPRESSION", "1").lower() in ("1", "true", "yes"))
+    compression_min_size: int = field(default_factory=lambda: _env_int("COMPRESSION_MIN_SIZE", 1024))
+    compression_gzip_level: int = field(default_factory=lambda: _env_int("COMPRESSION_GZIP_LEVEL", 6))
+    compression_brotli_quality: int = field(default_factory=lambda: _env_int("COMPRESSION_BROTLI_QUALITY", 5))
+    # Prefixos dos tipos de conteúdo comprimidos
+    compression_content_types: Tuple[str, ...] = field(
+        default_factory=lambda: tuple(
+            prefix.strip()
+            for prefix in _env_str("COMPRESSION_CONTENT_TYPES", "application/json,application/x-ndjson,text/").split(",")
+            if prefix.strip()
+        )
+    )
+    # Respostas de coleção já comprimidas (ver compression.cached_collection_response)
+    collection_cache_maxsize: int = field(default_factory=lambda: _env_int("COLLECTION_CACHE_MAXSIZE", 128))
+    collection_cache_ttl: float = field(default_factory=lambda: _env_float("COLLECTION_CACHE_TTL", 3600.0))
+
+    # Snapshot estático do catálogo (JSON + cópias pré-comprimidas), servido direto do disco
+    snapshot_enabled: bool = field(default_factory=lambda: _env_str("SNAPSHOT", "1").lower() in ("1", "true", "yes"))
+    snapshot_dir: str = field(default_factory=lambda: _env_str("SNAPSHOT_DIR", "./app/db/snapshot"))
+    # Regera o snapshot N segundos depois da última escrita (e no máximo M segundos depois da primeira)
+    snapshot_debounce_seconds: float = field(default_factory=lambda: _env_float("SNAPSHOT_DEBOUNCE_SECONDS", 2.0))
+    snapshot_max_delay_seconds: float = field(default_factory=lambda: _env_float("SNAPSHOT_MAX_DELAY_SECONDS", 30.0))
+    snapshot_gzip_level: int = field(default_factory=lambda: _env_int("SNAPSHOT_GZIP_LEVEL", 9))
+    snapshot_brotli_quality: int = field(default_factory=lambda: _env_int("SNAPSHOT_BROTLI_QUALITY", 9))
+
+    # Cache de leitura de santos (por id e por nome)
+    santo_cache_maxsize: int = field(default_factory=lambda: _env_int("SANTO_CACHE_MAXSIZE", 1024))
+    santo_cache_ttl: float = field(default_factory=lambda: _env_float("SANTO_CACHE_TTL", 300.0))
+    # Confere cada acerto com a versão do santo no banco (uma busca por índice). O cache
+    # é de cada worker e só é invalidado pelas escritas do próprio worker; com vários
+    # workers (app.server liga por padrão), as escritas dos outros também são vistas
+    santo_cache_validate: bool = field(
+        default_factory=lambda: _env_str("SANTO_CACHE_VALIDATE", "0").lower() in ("1", "true", "yes")
+    )
+
+    # Índice de sugestões de nomes: a cada N segundos, traz as escritas dos outros workers (0 = nunca)
+    suggest_refresh_seconds: float = field(default_factory=lambda: _env_float("SUGGEST_REFRESH_SECONDS", 30.0))
+
+    # Cache de usuários autenticados, por token (o TTL nunca passa do 'exp' do token).
+    # Também é de cada worker: um usuário alterado/deletado em outro worker continua
+    # valendo aqui por até TTL segundos (app.server usa 5 s com vários workers)
+    principal_cache_maxsize: int = field(default_factory=lambda: _env_int("PRINCIPAL_CACHE_MAXSIZE", 4096))
+    principal_cache_ttl: float = field(default_factory=lambda: _env_float("PRINCIPAL_CACHE_TTL", 60.0))
+
+    # Pool de processos do bcrypt (0 = sem processos, usa o threadpool do event loop)
+    hash_pool_workers: int = field(default_factory=lambda: _env_int("HASH_POOL_WORKERS", os.cpu_count() or 1))
+    # Máximo de hashes/verificações em andamento ao mesmo tempo; o restante espera na fila
+    hash_max_concurrency: int = field(
+        default_factory=lambda: _env_int("HASH_MAX_CONCURRENCY", 2 * (os.cpu_count() or 1))
+    )
+
+    # Observabilidade do SQL: máximo de comandos por requisição (padrão e por rota,
+    # 'MÉTODO /caminho') e tempo a partir do qual um comando é considerado lento
+    query_budget: int = field(default_factory=lambda: _env_int("QUERY_BUDGET", 20))
+    query_budgets: dict = field(default_factory=lambda: _env_budgets("QUERY_BUDGETS"))
+    slow_query_ms: float = field(default_factory=lambda: _env_float("SLOW_QUERY_MS", 100.0))
+    # Parâmetros dos comandos no log (podem ter e-mails e hashes de senha): só para depuração
+    log_sql_parameters: bool = field(
+        default_factory=lambda: _env_str("LOG_SQL_PARAMETERS", "0").lower() in ("1", "true", "yes")
+    )
+    # Planos (EXPLAIN QUERY PLAN) registrados junto dos comandos lentos ou acima do orçamento
+    explain_slow_queries: bool = field(
+        default_factory=lambda: _env_str("EXPLAIN_SLOW_QUERIES", "1").lower() in ("1", "true", "yes")
+    )
+
+    # Limites de tentativas (token bucket, em memória, por worker) das rotas de autenticação,
+    # no formato 'N/S': N tentativas a cada S segundos, por usuário e por IP. Cada worker
+    # conta as suas: com N workers, o limite efetivo chega a N vezes o configurado
+    rate_limit_enabled: bool = field(
+        default_factory=lambda: _env_str("RATE_LIMIT_ENABLED", "1").lower() in ("1", "true", "yes")
+    )
+    rate_limit_max_keys: int = field(default_factory=lambda: _env_int("RATE_LIMIT_MAX_KEYS", 100_000))
+    login_rate_limit_username: Optional[Tuple[int, float]] = field(
+        default_factory=lambda: _env_rate("LOGIN_RATE_LIMIT_USERNAME", "5/60")
+    )
+    login_rate_limit_ip: Optional[Tuple[int, float]] = field(
+        default_factory=lambda: _env_rate("LOGIN_RATE_LIMIT_IP", "20/60")
+    )
+    signup_rate_limit_ip: Optional[Tuple[int, float]] = field(
+        default_factory=lambda: _env_rate("SIGNUP_RATE_LIMIT_IP", "10/60")
+    )
+
+    # Servidor de produção (python -m app.server)
+    web_host: str = field(default_factory=lambda: _env_str("HOST", "0.0.0.0"))
+    web_port: int = field(default_factory=lambda: _env_int("PORT", 8000))
+    web_workers: int = field(default_factory=lambda: _env_int("WEB_CONCURRENCY", os.cpu_count() or 1))
+    # Recicla o worker após N requisições (0 = nunca), com variação aleatória entre workers
+    web_max_requests: int = field(default_factory=lambda: _env_int("MAX_REQUESTS", 0))
+    web_max_requests_jitter: int = field(default_factory=lambda: _env_int("MAX_REQUESTS_JITTER", 0))
+    web_graceful_timeout: int = field(default_factory=lambda: _env_int("GRACEFUL_TIMEOUT", 30))
+
+    def __post_init__(self):
+        if not self.async_database_url:
+            self.async_database_url = _async_url(self.database_url)
+        if not self.read_database_url:
+            self.read_database_url = self.database_url
+        if not self.async_read_database_url:
+            self.async_read_database_url = _async_url(self.read_database_url)
+
+
+settings = Settings()
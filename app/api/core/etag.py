@@ -0,0 +1,27 @@
+# app/api/core/etag.py
+
+import hashlib
+from typing import Optional
+
+
+def make_etag(*parts: object) -> str:
+    """ETag forte (entre aspas) a partir das partes que identificam a versão da resposta."""
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+
+def hash_query(query: str) -> str:
+    """Resumo curto da query string, para respostas que variam com os parâmetros."""
+    return hashlib.blake2b(query.encode("utf-8"), digest_size=6).hexdigest()
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Verifica o cabeçalho If-None-Match (lista separada por vírgulas, ou '*').
+    Na comparação para GET condicional os prefixos 'W/' são ignorados (RFC 9110).
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
@@ -0,0 +1,250 @@
+# app/api/core/metrics.py
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from app.api.core import sql_tracker
+from app.api.core.sql_tracker import route_template
+
+# Limites (em segundos) dos buckets dos histogramas de latência
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Limites dos buckets do histograma de comandos SQL por requisição
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    """Base das métricas: nome, descrição e valores por conjunto de rótulos, com lock."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str):
+        self.name = name
+        self.documentation = documentation
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(labels: Dict[str, str]) -> Labels:
+        return tuple(sorted(labels.items()))
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str):
+        super().__init__(name, documentation)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(k)} {_format_value(v)}" for k, v in items]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, buckets: Iterable[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation)
+        self.buckets = tuple(sorted(buckets))
+        # Por rótulos: [contagem por bucket (não cumulativa; o último é +Inf), soma, total]
+        self._values: Dict[Labels, list] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            entry = self._values.get(self._key(labels))
+            return entry[2] if entry else 0
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((k, ([*v[0]], v[1], v[2])) for k, v in self._values.items())
+        lines = []
+        for labels, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, float("inf")), counts):
+                cumulative += bucket_count
+                bucket_labels = labels + (("le", _format_value(float(bound))),)
+                lines.append(f"{self.name}_bucket{_format_labels(bucket_labels)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {count}")
+        return lines
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class MetricsRegistry:
+    """
+    Conjunto de métricas exportadas em /metrics (formato texto do Prometheus).
+    Além das métricas atualizadas pelo código, aceita coletores: funções chamadas na
+    hora da exportação que devolvem (nome, descrição, tipo, [(rótulos, valor)]).
+    Os valores são do processo: com vários workers, cada um exporta só os seus.
+    """
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], Iterable[tuple]]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, documentation: str) -> Counter:
+        return self.register(Counter(name, documentation))
+
+    def gauge(self, name: str, documentation: str) -> Gauge:
+        return self.register(Gauge(name, documentation))
+
+    def histogram(self, name: str, documentation: str, buckets: Iterable[float] = LATENCY_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, buckets))
+
+    def add_collector(self, collector: Callable[[], Iterable[tuple]]) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.header())
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            for name, documentation, kind, samples in collector():
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    lines.append(f"{name}{_format_labels(tuple(sorted(labels.items())))} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """Zera as métricas atualizadas pelo código (os coletores leem o estado atual)."""
+        for metric in self._metrics:
+            metric.clear()
+
+
+registry = MetricsRegistry()
+
+http_requests_total = registry.counter(
+    "http_requests_total", "Requisições HTTP atendidas, por método, rota e status."
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds", "Latência das requisições HTTP, por método e rota."
+)
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight", "Requisições HTTP em andamento."
+)
+db_queries_total = registry.counter(
+    "db_queries_total", "Comandos SQL executados durante requisições, por método e rota."
+)
+db_query_duration_seconds = registry.histogram(
+    "db_request_query_duration_seconds", "Tempo total gasto no SQLite por requisição, por método e rota."
+)
+db_queries_per_request = registry.histogram(
+    "db_queries_per_request", "Comandos SQL por requisição, por método e rota.", QUERY_COUNT_BUCKETS
+)
+app_startup_seconds = registry.gauge(
+    "app_startup_seconds", "Tempo de inicialização do worker, por fase (import, schema, total)."
+)
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI que mede cada requisição HTTP: latência e status por rota,
+    requisições em andamento e, via sql_tracker, quantos comandos SQL ela executou
+    e quanto tempo passou no banco.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        method = scope["method"]
+        http_requests_in_flight.inc()
+        started = time.perf_counter()
+        try:
+            with sql_tracker.track_queries(scope) as queries:
+                await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_requests_in_flight.dec()
+            route = route_template(scope)
+            http_requests_total.inc(method=method, route=route, status=str(status_code))
+            http_request_duration_seconds.observe(elapsed, method=method, route=route)
+            db_queries_total.inc(queries.count, method=method, route=route)
+            db_query_duration_seconds.observe(queries.total_seconds, method=method, route=route)
+            db_queries_per_request.observe(queries.count, method=method, route=route)
@@ -0,0 +1,27 @@
+# app/api/core/pagination.py
+
+import base64
+import json
+from typing import Tuple
+
+
+def encode_cursor(nome: str, santo_id: int) -> str:
+    """Gera um cursor opaco a partir da chave de ordenação (nome, id) do último item da página."""
+    raw = json.dumps([nome, santo_id], ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """
+    Converte um cursor opaco de volta para a chave (nome, id).
+    Levanta ValueError se o cursor for inválido.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        nome, santo_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception as exc:
+        raise ValueError("Cursor inválido") from exc
+
+    if not isinstance(nome, str) or not isinstance(santo_id, int):
+        raise ValueError("Cursor inválido")
+    return nome, santo_id
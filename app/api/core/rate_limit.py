@@ -0,0 +1,163 @@
+# app/api/core/rate_limit.py
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, Request, status
+
+from app.api.core import metrics
+from app.api.core.config import settings
+
+rate_limited_total = metrics.registry.counter(
+    "rate_limited_total", "Requisições recusadas (429) pelo limite de tentativas, por rota e chave."
+)
+
+
+class TokenBucketLimiter:
+    """
+    Token buckets em memória: cada chave (usuário, IP) tem até 'capacity' fichas, que
+    voltam à taxa de capacity/period por segundo; cada tentativa consome uma.
+
+    Os buckets ficam num OrderedDict na ordem da última atualização (busca O(1)).
+    Um bucket parado há 'period' segundos já está cheio de novo, equivalente a não
+    existir: a varredura a cada chamada remove esses do início da fila, e se ainda
+    houver mais que 'max_keys' os mais antigos são descartados (memória limitada).
+    Os buckets são do processo: com vários workers, cada um conta as próprias
+    tentativas e o limite efetivo é multiplicado pelo número de workers.
+    """
+
+    def __init__(self, capacity: int, period: float, max_keys: int = 100_000,
+                 clock: Callable[[], float] = time.monotonic):
+        self.capacity = capacity
+        self.period = period
+        self.rate = capacity / period
+        self.max_keys = max_keys
+        self.clock = clock
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.allowed = 0
+        self.rejected = 0
+
+    def _sweep(self, now: float) -> None:
+        while self._buckets:
+            tokens, updated = next(iter(self._buckets.values()))
+            if now - updated < self.period and len(self._buckets) <= self.max_keys:
+                break
+            self._buckets.popitem(last=False)
+
+    def hit(self, key: str) -> float:
+        """
+        Consome uma ficha da chave. Retorna 0 se a tentativa é permitida, ou quantos
+        segundos faltam para a próxima ficha se o bucket está vazio.
+        """
+        now = self.clock()
+        with self._lock:
+            self._sweep(now)
+            bucket = self._buckets.pop(key, None)
+            if bucket is None:
+                tokens = float(self.capacity)
+            else:
+                tokens = min(float(self.capacity), bucket[0] + (now - bucket[1]) * self.rate)
+
+            if tokens >= 1:
+                self._buckets[key] = [tokens - 1, now]
+                self.allowed += 1
+                return 0.0
+            self._buckets[key] = [tokens, now]
+            self.rejected += 1
+            return (1 - tokens) / self.rate
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+            self.allowed = 0
+            self.rejected = 0
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+async def form_username(request: Request) -> Optional[str]:
+    """Usuário de um formulário OAuth2 (POST /token). O FastAPI já leu o corpo: vem do cache."""
+    return (await request.form()).get("username")
+
+
+async def json_username(request: Request) -> Optional[str]:
+    """Usuário de um corpo JSON (POST /users/)."""
+    try:
+        body = await request.json()
+    except ValueError:
+        return None
+    return body.get("username") if isinstance(body, dict) else None
+
+
+_route_limits: List["RouteRateLimit"] = []
+
+
+class RouteRateLimit:
+    """
+    Dependência do FastAPI que limita as tentativas numa rota, por IP e (opcionalmente)
+    por usuário. Usada em 'dependencies=[Depends(...)]' da rota, ela roda antes do
+    handler: uma tentativa recusada responde 429 com Retry-After sem consultar o
+    banco nem calcular hash. Os limites valem por processo (worker).
+    """
+
+    def __init__(
+        self,
+        route: str,
+        ip: Optional[Tuple[int, float]] = None,
+        username: Optional[Tuple[int, float]] = None,
+        username_from: Optional[Callable[[Request], Awaitable[Optional[str]]]] = None,
+    ):
+        self.route = route
+        self.username_from = username_from
+        self.limiters: Dict[str, TokenBucketLimiter] = {}
+        self.configure(ip=ip, username=username)
+        _route_limits.append(self)
+
+    def configure(self, ip: Optional[Tuple[int, float]] = None, username: Optional[Tuple[int, float]] = None) -> None:
+        """(Re)define os limites ('None' desliga o limite daquela chave)."""
+        self.limiters = {
+            kind: TokenBucketLimiter(*limit, max_keys=settings.rate_limit_max_keys)
+            for kind, limit in (("ip", ip), ("username", username))
+            if limit is not None
+        }
+
+    async def __call__(self, request: Request) -> None:
+        if not settings.rate_limit_enabled or not self.limiters:
+            return
+
+        keys = {"ip": request.client.host if request.client else "desconhecido"}
+        if "username" in self.limiters and self.username_from is not None:
+            username = await self.username_from(request)
+            if username:
+                keys["username"] = username.strip().casefold()
+
+        wait = 0.0
+        for kind, key in keys.items():
+            limiter = self.limiters.get(kind)
+            if limiter is None:
+                continue
+            retry_after = limiter.hit(key)
+            if retry_after:
+                rate_limited_total.inc(route=self.route, key=kind)
+                wait = max(wait, retry_after)
+        if wait:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Muitas tentativas. Tente novamente mais tarde.",
+                headers={"Retry-After": str(math.ceil(wait))},
+            )
+
+    def clear(self) -> None:
+        for limiter in self.limiters.values():
+            limiter.clear()
+
+
+def reset_rate_limits() -> None:
+    """Esvazia os buckets de todas as rotas limitadas (usado nos testes)."""
+    for route_limit in _route_limits:
+        route_limit.clear()
@@ -0,0 +1,32 @@
+# app/api/core/responses.py
+
+import json
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # orjson é opcional: sem ele, cai no encoder padrão
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """Serializa em JSON (bytes UTF-8) com orjson, ou com o encoder padrão na falta dele."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(
+        jsonable_encoder(content), ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    Resposta JSON serializada com orjson, que codifica date/datetime nativamente.
+    Pensada para conteúdo já confiável (linhas do banco convertidas em dicionários),
+    sem passar pela revalidação do response_model.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
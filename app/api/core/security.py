@@ -1,13 +1,143 @@
 # app/api/core/security.py
 
-from passlib.context import CryptContext
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.api.core.config import settings
+
+@lru_cache(maxsize=None)
+def get_pwd_context():
+    """
+    Contexto do passlib, criado no primeiro uso: importar passlib/bcrypt é caro
+    e a maioria das requisições (e dos workers recém-criados) não precisa dele.
+    """
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verifica se a senha fornecida corresponde ao hash armazenado."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
     """Gera o hash de uma senha."""
-    return pwd_context.hash(password)
\ No newline at end of file
+    return get_pwd_context().hash(password)
+
+
+class HashingPool:
+    """
+    Executa o bcrypt (hash e verificação) fora do event loop, num pool de processos,
+    para que um pico de logins use todos os núcleos sem segurar o GIL do worker.
+    Limita quantas operações rodam ao mesmo tempo e mede fila e latência.
+    """
+
+    def __init__(self, workers: int, max_concurrency: int):
+        self.workers = workers
+        self.max_concurrency = max(1, max_concurrency)
+        self._executor: Optional[Executor] = None
+        self._executor_lock = threading.Lock()
+        # asyncio.Semaphore pertence a um event loop; guardamos um por loop
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._stats_lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def _get_executor(self) -> Optional[Executor]:
+        # Criado sob demanda: só quem faz login/cadastro paga o custo de subir os processos.
+        # 'spawn' porque fazer fork de um processo com threads (servidor) não é seguro.
+        if self.workers <= 0:
+            return None
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Executa 'fn(*args)' no pool, respeitando o limite de concorrência."""
+        with self._stats_lock:
+            self.queued += 1
+        acquired = False
+        try:
+            async with self._get_semaphore():
+                acquired = True
+                with self._stats_lock:
+                    self.queued -= 1
+                    self.running += 1
+                started = time.perf_counter()
+                try:
+                    loop = asyncio.get_running_loop()
+                    return await loop.run_in_executor(self._get_executor(), fn, *args)
+                finally:
+                    elapsed = time.perf_counter() - started
+                    with self._stats_lock:
+                        self.running -= 1
+                        self.completed += 1
+                        self.total_seconds += elapsed
+                        self.max_seconds = max(self.max_seconds, elapsed)
+        finally:
+            # Cancelado enquanto ainda esperava na fila
+            if not acquired:
+                with self._stats_lock:
+                    self.queued -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Profundidade da fila e latência das operações de hash."""
+        with self._stats_lock:
+            return {
+                "workers": self.workers,
+                "max_concurrency": self.max_concurrency,
+                "queued": self.queued,
+                "running": self.running,
+                "completed": self.completed,
+                "avg_seconds": (self.total_seconds / self.completed) if self.completed else 0.0,
+                "max_seconds": self.max_seconds,
+            }
+
+    def reset_after_fork(self) -> None:
+        """No filho de um fork: os processos e locks herdados são do pai; recomeça do zero."""
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._semaphores = weakref.WeakKeyDictionary()
+        self.queued = self.running = 0
+
+    def shutdown(self) -> None:
+        """Encerra os processos do pool (se tiverem sido criados)."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+hashing_pool = HashingPool(workers=settings.hash_pool_workers, max_concurrency=settings.hash_max_concurrency)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=hashing_pool.reset_after_fork)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Versão assíncrona de verify_password, executada no pool de hashing."""
+    return await hashing_pool.run(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """Versão assíncrona de get_password_hash, executada no pool de hashing."""
+    return await hashing_pool.run(get_password_hash, password)
@@ -0,0 +1,179 @@
+# app/api/core/sql_tracker.py
+
+import contextvars
+import logging
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.api.core.config import settings
+
+logger = logging.getLogger("app.sql")
+
+# Quantos comandos de uma requisição ficam guardados para o relatório (os demais só contam)
+MAX_RECORDED_STATEMENTS = 200
+# Comandos para os quais o SQLite aceita EXPLAIN QUERY PLAN
+_EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE", "INSERT")
+
+
+@dataclass
+class QueryRecord:
+    statement: str
+    parameters: Any
+    seconds: float
+
+
+def route_template(scope) -> str:
+    """Caminho declarado da rota (ex.: /santos/{id_or_name}), para não criar um rótulo por URL."""
+    route = (scope or {}).get("route")
+    path = getattr(route, "path", None)
+    return path if path else "unmatched"
+
+
+class RequestQueries:
+    """Comandos SQL executados durante uma requisição: quantidade, tempo total e os próprios comandos."""
+
+    def __init__(self, scope=None):
+        self.scope = scope
+        self.count = 0
+        self.total_seconds = 0.0
+        self.statements: List[QueryRecord] = []
+
+    @property
+    def route(self) -> str:
+        """Rota no formato 'MÉTODO /caminho', a chave dos orçamentos por rota."""
+        method = (self.scope or {}).get("method", "")
+        return f"{method} {route_template(self.scope)}".strip()
+
+    @property
+    def budget(self) -> int:
+        # A rota só é conhecida depois do roteamento, então é resolvida a cada consulta
+        return settings.query_budgets.get(self.route, settings.query_budget)
+
+    def record(self, statement: str, parameters: Any, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        if len(self.statements) < MAX_RECORDED_STATEMENTS:
+            self.statements.append(QueryRecord(statement, parameters, seconds))
+
+    def summary(self) -> str:
+        """Comandos mais repetidos, para achar N+1 no log."""
+        repeated = Counter(record.statement for record in self.statements).most_common(3)
+        return "; ".join(f"{count}x {statement}" for statement, count in repeated)
+
+
+_current: "contextvars.ContextVar[Optional[RequestQueries]]" = contextvars.ContextVar(
+    "sql_tracker_current", default=None
+)
+_watchers: List[List[RequestQueries]] = []
+_watchers_lock = threading.Lock()
+
+
+@contextmanager
+def track_queries(scope=None) -> Iterator[RequestQueries]:
+    """
+    Conta os comandos SQL executados dentro do bloco (uma requisição). O contexto é
+    herdado pelo greenlet das sessões assíncronas, então vale para os dois caminhos.
+    """
+    queries = RequestQueries(scope)
+    token = _current.set(queries)
+    try:
+        yield queries
+    finally:
+        _current.reset(token)
+        if queries.count > queries.budget:
+            logger.warning(
+                "%s executou %d comandos SQL (orçamento: %d, %.1f ms no banco): %s",
+                queries.route, queries.count, queries.budget,
+                queries.total_seconds * 1000, queries.summary(),
+            )
+        with _watchers_lock:
+            for finished in _watchers:
+                finished.append(queries)
+
+
+@contextmanager
+def watch_requests() -> Iterator[List[RequestQueries]]:
+    """Coleta os RequestQueries das requisições concluídas dentro do bloco (usado nos testes)."""
+    finished: List[RequestQueries] = []
+    with _watchers_lock:
+        _watchers.append(finished)
+    try:
+        yield finished
+    finally:
+        with _watchers_lock:
+            _watchers.remove(finished)
+
+
+def explain(conn, statement: str, parameters: Any) -> Optional[List[str]]:
+    """
+    Plano de execução (EXPLAIN QUERY PLAN) de um comando, executado num cursor
+    separado da mesma conexão DBAPI (não dispara os eventos do SQLAlchemy).
+    Retorna None se não for possível obter o plano.
+    """
+    if conn.dialect.name != "sqlite" or not statement.lstrip().upper().startswith(_EXPLAINABLE):
+        return None
+    try:
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute("EXPLAIN QUERY PLAN " + statement, parameters or ())
+            return [row[-1] for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+    except Exception:
+        return None
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("sql_tracker_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["sql_tracker_started"].pop()
+    queries = _current.get()
+    if queries is None:
+        return
+    elapsed = time.perf_counter() - started
+    queries.record(statement, parameters, elapsed)
+
+    slow = elapsed * 1000 >= settings.slow_query_ms
+    # Só o comando que estoura o orçamento é detalhado; o resumo sai no fim da requisição
+    over_budget = queries.count == queries.budget + 1
+    if not (slow or over_budget):
+        return
+    plan = explain(conn, statement, parameters) if settings.explain_slow_queries and not executemany else None
+    logger.warning(
+        "%s em %s (%.1f ms, comando nº %d, orçamento %d): %s | parâmetros: %s | plano: %s",
+        "Consulta lenta" if slow else "Orçamento de consultas excedido",
+        queries.route, elapsed * 1000, queries.count, queries.budget,
+        statement, _loggable(parameters), " / ".join(plan) if plan else "-",
+    )
+
+
+def _loggable(parameters: Any) -> str:
+    """Parâmetros como vão para o log: omitidos, a menos que LOG_SQL_PARAMETERS esteja ligado."""
+    if settings.log_sql_parameters:
+        return repr(parameters)
+    return "(omitidos)" if parameters else "-"
+
+
+def _handle_error(exception_context):
+    # Comando que falhou não passa pelo after_cursor_execute: descarta o início guardado
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("sql_tracker_started"):
+        conn.info["sql_tracker_started"].pop()
+
+
+def instrument_engine(engine: Engine) -> Engine:
+    """Registra os eventos de cursor que alimentam o sql_tracker (idempotente)."""
+    if not event.contains(engine, "after_cursor_execute", _after_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
+    return engine
@@ -0,0 +1,245 @@
+# app/api/core/suggest.py
+
+import heapq
+import threading
+from bisect import bisect_left, insort
+from collections import Counter
+from itertools import groupby
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# Chave de ordenação de um nome nas listas de ocorrências: (tamanho, nome normalizado,
+# id, nome). Uma única tupla por nome, compartilhada por todas as listas das suas palavras.
+SuggestionKey = Tuple[int, str, int, str]
+
+
+def trigrams(word: str) -> Set[str]:
+    """Trigramas de uma palavra, com as bordas marcadas ('  f', ' fr', ..., 'co ')."""
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class _TrieNode:
+    __slots__ = ("children", "word")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.word: Optional[str] = None
+
+
+class SuggestionIndex:
+    """
+    Índice em memória para sugestões de nomes enquanto se digita (type-ahead).
+
+    Os nomes são normalizados (sem acentos, casefold) e quebrados em palavras. Cada
+    palavra do vocabulário fica numa trie (expansão de prefixos), no índice de trigramas
+    (tolerância a erros de digitação) e tem uma lista de ocorrências ordenada pela
+    chave de ordenação dos nomes (mais curtos primeiro, depois alfabética).
+
+    Cada palavra da consulta casa com as palavras do vocabulário que começam com ela;
+    se nenhuma começa, com as mais parecidas por trigramas (com uma penalidade). As
+    listas da palavra mais seletiva são percorridas já em ordem (heapq.merge) e a busca
+    para assim que tem 'limit' nomes que casam com as demais palavras sem penalidade
+    maior possível: o custo depende de k, não do tamanho do catálogo.
+    """
+
+    def __init__(self, normalize: Callable[[str], str], similarity: float = 0.3, max_fuzzy_words: int = 5):
+        self.normalize = normalize
+        self.similarity = similarity
+        self.max_fuzzy_words = max_fuzzy_words
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keys: Dict[int, SuggestionKey] = {}
+            self._words: Dict[int, Tuple[str, ...]] = {}
+            self._postings: Dict[str, List[SuggestionKey]] = {}
+            self._trie = _TrieNode()
+            self._trigrams: Dict[str, Set[str]] = {}
+            # Maior versão de santo já refletida no índice (ver saint_service.sync_name_index)
+            self.version = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def stats(self) -> dict:
+        return {"names": len(self._keys), "words": len(self._postings), "trigrams": len(self._trigrams)}
+
+    # --- Escrita ---
+
+    def load(self, names: Iterable[Tuple[int, str, Optional[str]]], version: int = 0) -> int:
+        """
+        Reconstrói o índice a partir de tuplas (id, nome, nome normalizado), aproveitando
+        a normalização já gravada no banco. Retorna quantos nomes foram indexados.
+        """
+        self.clear()
+        with self._lock:
+            for santo_id, nome, normalized in names:
+                self._add(santo_id, nome, normalized, sort=False)
+            for keys in self._postings.values():
+                keys.sort()
+            self.version = version
+            return len(self._keys)
+
+    def add(self, santo_id: int, nome: Optional[str], normalized: Optional[str] = None) -> None:
+        """Indexa (ou reindexa, se o nome mudou) um santo."""
+        with self._lock:
+            self._remove(santo_id)
+            self._add(santo_id, nome, normalized)
+
+    def remove(self, santo_id: int) -> None:
+        with self._lock:
+            self._remove(santo_id)
+
+    def _add(self, santo_id: int, nome: Optional[str], normalized: Optional[str] = None, sort: bool = True) -> None:
+        if not nome:
+            return
+        if normalized is None:
+            normalized = self.normalize(nome)
+        words = tuple(dict.fromkeys(normalized.split()))
+        if not words:
+            return
+        key = (len(normalized), normalized, santo_id, nome)
+        self._keys[santo_id] = key
+        self._words[santo_id] = words
+        for word in words:
+            keys = self._postings.get(word)
+            if keys is None:
+                self._postings[word] = [key]
+                self._add_word(word)
+            elif sort:
+                insort(keys, key)
+            else:
+                keys.append(key)
+
+    def _remove(self, santo_id: int) -> None:
+        key = self._keys.pop(santo_id, None)
+        if key is None:
+            return
+        for word in self._words.pop(santo_id):
+            keys = self._postings[word]
+            del keys[bisect_left(keys, key)]
+            if not keys:
+                del self._postings[word]
+                self._remove_word(word)
+
+    def _add_word(self, word: str) -> None:
+        node = self._trie
+        for char in word:
+            node = node.children.setdefault(char, _TrieNode())
+        node.word = word
+        for trigram in trigrams(word):
+            self._trigrams.setdefault(trigram, set()).add(word)
+
+    def _remove_word(self, word: str) -> None:
+        path = [self._trie]
+        for char in word:
+            path.append(path[-1].children[char])
+        path[-1].word = None
+        # Poda os nós que ficaram sem palavra e sem filhos
+        for depth in range(len(word), 0, -1):
+            node = path[depth]
+            if node.word is not None or node.children:
+                break
+            del path[depth - 1].children[word[depth - 1]]
+        for trigram in trigrams(word):
+            words = self._trigrams[trigram]
+            words.discard(word)
+            if not words:
+                del self._trigrams[trigram]
+
+    # --- Consulta ---
+
+    def _prefix_words(self, prefix: str) -> List[str]:
+        """Palavras do vocabulário que começam com 'prefix'."""
+        node = self._trie
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        words, stack = [], [node]
+        while stack:
+            node = stack.pop()
+            if node.word is not None:
+                words.append(node.word)
+            stack.extend(node.children.values())
+        return words
+
+    def _fuzzy_words(self, token: str) -> Dict[str, float]:
+        """
+        Palavras parecidas com 'token' (similaridade de Jaccard dos trigramas acima do
+        limite), com a penalidade 1 - similaridade.
+        """
+        grams = trigrams(token)
+        shared: Counter = Counter()
+        for trigram in grams:
+            shared.update(self._trigrams.get(trigram, ()))
+        scored = []
+        for word, common in shared.items():
+            score = common / (len(grams) + len(trigrams(word)) - common)
+            if score >= self.similarity:
+                scored.append((score, word))
+        best = heapq.nlargest(self.max_fuzzy_words, scored)
+        return {word: 1.0 - score for score, word in best}
+
+    def _penalty(self, santo_id: int, matches: Dict[str, float]) -> Optional[float]:
+        """Menor penalidade entre as palavras do nome que casam com uma palavra da consulta."""
+        penalties = [matches[word] for word in self._words[santo_id] if word in matches]
+        return min(penalties) if penalties else None
+
+    def suggest(self, q: str, limit: int = 10) -> List[Tuple[int, str]]:
+        """
+        Até 'limit' pares (id, nome) cujos nomes casam com todas as palavras de 'q'
+        (como prefixo ou, se nenhuma palavra começa com ela, por semelhança), do menor
+        para o maior total de penalidades; em caso de empate, os nomes mais curtos.
+        """
+        tokens = list(dict.fromkeys(self.normalize(q).split()))
+        if not tokens or limit <= 0:
+            return []
+
+        with self._lock:
+            matches: List[Dict[str, float]] = []
+            for token in tokens:
+                words = dict.fromkeys(self._prefix_words(token), 0.0) or self._fuzzy_words(token)
+                if not words:
+                    return []
+                matches.append(words)
+
+            # A palavra com menos ocorrências conduz a busca; as demais só filtram
+            driver = min(matches, key=lambda words: sum(len(self._postings[word]) for word in words))
+            others = [words for words in matches if words is not driver]
+            others_floor = sum(min(words.values()) for words in others)
+
+            best: List[Tuple[float, SuggestionKey]] = []
+            seen: Set[int] = set()
+            # Palavras do vocabulário em faixas de penalidade crescente (sem erro de
+            # digitação, uma faixa só); dentro da faixa, os nomes em ordem (heapq.merge)
+            tiers = groupby(sorted(driver, key=driver.__getitem__), key=driver.__getitem__)
+            # Sem erro de digitação nas demais palavras, basta saber se o nome tem alguma delas
+            exact_others = [words.keys() for words in others if not any(words.values())]
+            fuzzy_others = [words for words in others if any(words.values())]
+            for penalty, tier in tiers:
+                floor = penalty + others_floor
+                if len(best) == limit and best[-1][0] < floor:
+                    break
+                at_floor = 0
+                for key in heapq.merge(*(self._postings[word] for word in tier)):
+                    santo_id = key[2]
+                    if santo_id in seen:
+                        continue
+                    seen.add(santo_id)
+                    name_words = self._words[santo_id]
+                    if any(words.isdisjoint(name_words) for words in exact_others):
+                        continue
+                    extra = [self._penalty(santo_id, words) for words in fuzzy_others]
+                    if None in extra:
+                        continue
+                    total = penalty + sum(extra)
+                    insort(best, (total, key))
+                    del best[limit:]
+                    # Os próximos desta faixa não têm penalidade menor e vêm depois na ordem
+                    if total == floor:
+                        at_floor += 1
+                        if at_floor == limit:
+                            break
+            return [(key[2], key[3]) for _, key in best]
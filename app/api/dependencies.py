@@ -1,4 +1,4 @@
-from app.db.database import SessionLocal
+from app.db.database import AsyncReadSessionLocal, AsyncSessionLocal, SessionLocal
 
 # Injeção de dependências do fastapi
 # Aqui o fastapi injeta a funcionalidade de acesso ao banco de dados em cada rota
@@ -14,4 +14,20 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+# Versão assíncrona de get_db, usada pelas rotas 'async def'.
+# Nos testes ela é sobrescrita por uma Session síncrona (ver tests/conftest.py),
+# o que funciona porque os services assíncronos aceitam os dois tipos de sessão.
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# Sessão só de leitura, usada pelas rotas GET: engine e pool próprios (ver
+# database.AsyncReadSessionLocal), então as leituras não disputam conexões com as
+# escritas. Também é sobrescrita nos testes pela mesma Session síncrona.
+async def get_read_db():
+    async with AsyncReadSessionLocal() as db:
+        yield db
@@ -1,39 +1,58 @@
 from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status, Response
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import auth, dependencies
+from app.api.core.config import settings
+from app.api.core.rate_limit import RouteRateLimit, form_username, json_username
+from app.api.core.security import verify_password_async
 from app.api.services import user_service
 from app.schemas import user_schema
 
 router = APIRouter(tags=["Authentication"])
 
-@router.post("/users/", response_model=user_schema.User, status_code=status.HTTP_201_CREATED)
-def create_user_endpoint(user: user_schema.UserCreate, db: Session = Depends(dependencies.get_db)):
+# Limites de tentativas: recusam rajadas (credential stuffing, cadastros em massa)
+# antes de qualquer consulta ao banco ou bcrypt
+signup_rate_limit = RouteRateLimit("POST /users/", ip=settings.signup_rate_limit_ip, username_from=json_username)
+login_rate_limit = RouteRateLimit(
+    "POST /token",
+    ip=settings.login_rate_limit_ip,
+    username=settings.login_rate_limit_username,
+    username_from=form_username,
+)
+
+@router.post(
+    "/users/",
+    response_model=user_schema.User,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(signup_rate_limit)],
+)
+async def create_user_endpoint(user: user_schema.UserCreate, db: AsyncSession = Depends(dependencies.get_async_db)):
     """Endpoint público para criar um novo usuário."""
     # Verifica se o username já existe
-    db_user = user_service.get_user_by_username(db, username=user.username)
+    db_user = await user_service.get_user_by_username_async(db, username=user.username)
     if db_user:
         raise HTTPException(status_code=400, detail="Username already registered")
     
-    db_email = user_service.get_user_by_email(db, email=user.email)
+    db_email = await user_service.get_user_by_email_async(db, email=user.email)
     if db_email:
         raise HTTPException(status_code=400, detail="Email already registered")
         
-    return user_service.create_user(db=db, user=user)
+    return await user_service.create_user_async(db=db, user=user)
 
-@router.post("/token")
-def login_for_access_token(
+@router.post("/token", dependencies=[Depends(login_rate_limit)])
+async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(dependencies.get_db)
+    db: AsyncSession = Depends(dependencies.get_async_db)
 ):
     """
     Endpoint de login. Recebe username/password via form data,
     autentica e retorna um token de acesso.
     """
-    user = user_service.get_user_by_username(db, username=form_data.username)
-    if not user or not auth.verify_password(form_data.password, user.hashed_password):
+    user = await user_service.get_user_by_username_async(db, username=form_data.username)
+    # O bcrypt é pesado em CPU: roda no pool de hashing para não travar o event loop
+    if not user or not await verify_password_async(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -46,10 +65,10 @@ def login_for_access_token(
     return {"access_token": access_token, "token_type": "bearer"}
 
 @router.patch("/users/{user_id}", response_model=user_schema.User)
-def update_user_endpoint(
+async def update_user_endpoint(
     user_id: int,
     user_data: user_schema.UserUpdate,
-    db: Session = Depends(dependencies.get_db),
+    db: AsyncSession = Depends(dependencies.get_async_db),
     current_user: user_schema.User = Depends(auth.get_current_user)
 ):
     """Atualiza os dados do próprio usuário. Requer autenticação."""
@@ -60,7 +79,7 @@ def update_user_endpoint(
             detail="Não tem permissão para modificar este usuário."
         )
 
-    updated_user = user_service.update_user(db=db, user_id=user_id, user_update=user_data)
+    updated_user = await user_service.update_user_async(db=db, user_id=user_id, user_update=user_data)
     if updated_user is None:
         raise HTTPException(status_code=404, detail="Usuário não encontrado")
     
@@ -68,9 +87,9 @@ def update_user_endpoint(
 
 
 @router.delete("/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_user_endpoint(
+async def delete_user_endpoint(
     user_id: int,
-    db: Session = Depends(dependencies.get_db),
+    db: AsyncSession = Depends(dependencies.get_async_db),
     current_user: user_schema.User = Depends(auth.get_current_user)
 ):
     """Deleta o próprio usuário. Requer autenticação."""
@@ -81,8 +100,8 @@ def delete_user_endpoint(
             detail="Não tem permissão para deletar este usuário."
         )
 
-    deleted_user = user_service.delete_user(db=db, user_id=user_id)
+    deleted_user = await user_service.delete_user_async(db=db, user_id=user_id)
     if deleted_user is None:
         raise HTTPException(status_code=404, detail="Usuário não encontrado")
 
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,60 @@
+# app/api/routes/metrics.py
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.api.core.cache import principal_cache
+from app.api.core.compression import collection_cache
+from app.api.core.metrics import registry
+from app.api.core.security import hashing_pool
+from app.api.services import saint_service
+
+router = APIRouter(tags=["Metrics"])
+
+# Tipo de conteúdo do formato texto de exposição do Prometheus
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_CACHE_COUNTERS = ("hits", "misses", "evictions", "expirations")
+_HASH_GAUGES = ("queued", "running", "avg_seconds", "max_seconds")
+
+
+def _runtime_collector():
+    """Estado atual dos caches e do pool de hashing, lido na hora da exportação."""
+    caches = {
+        "santos": saint_service.santo_cache.stats(),
+        "principal": principal_cache.stats(),
+        "colecao": collection_cache.stats(),
+    }
+    for counter in _CACHE_COUNTERS:
+        yield (
+            f"cache_{counter}_total", f"Cache em memória: {counter}.", "counter",
+            [({"cache": name}, stats[counter]) for name, stats in caches.items()],
+        )
+    yield (
+        "cache_entries", "Entradas ocupadas em cada cache em memória.", "gauge",
+        [({"cache": name}, stats["size"]) for name, stats in caches.items()],
+    )
+
+    index = saint_service.name_index.stats()
+    yield (
+        "suggest_index_size", "Tamanho do índice de sugestões de nomes.", "gauge",
+        [({"kind": kind}, total) for kind, total in index.items()],
+    )
+
+    hashing = hashing_pool.stats()
+    yield ("password_hash_completed_total", "Operações de bcrypt concluídas.", "counter", [({}, hashing["completed"])])
+    for gauge in _HASH_GAUGES:
+        yield (f"password_hash_{gauge}", f"Pool de hashing: {gauge}.", "gauge", [({}, hashing[gauge])])
+
+
+registry.add_collector(_runtime_collector)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint():
+    """
+    Métricas da aplicação no formato texto do Prometheus: latência e status por rota,
+    requisições em andamento, comandos SQL e tempo no banco por requisição,
+    caches e pool de hashing. Os valores são do worker que atendeu a requisição.
+    """
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,19 +1,31 @@
 # app/api/routes/santos_route.py
 
-from fastapi import APIRouter, Depends, HTTPException, status, Response
-from sqlalchemy.orm import Session
-from typing import List
+from datetime import date
+from enum import Enum
+
+from fastapi import APIRouter, Depends, File, Header, HTTPException, Query, Request, UploadFile, status, Response
+from fastapi.responses import FileResponse, StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 
 # Importa os componentes específicos dos Santos
-from app.api.services import saint_service
+from app.api.services import import_service, saint_service, snapshot_service, stats_service
 from app.schemas import saint_schema
 
-# Importa a dependência do banco de dados
-from app.api.dependencies import get_db
+# Importa as dependências do banco de dados (sessões assíncronas): as rotas GET usam
+# a sessão só de leitura, com engine e pool próprios; as escritas, a principal
+from app.api.dependencies import get_async_db, get_read_db
 
-# Dependências de autentificação
-from app.api import auth # Importe o módulo de autenticação
-from app.schemas import user_schema # Importe o schema do usuário
+# Cursores opacos da paginação por keyset
+from app.api.core.pagination import decode_cursor, encode_cursor
+# ETags e GET condicional (If-None-Match)
+from app.api.core.etag import etag_matches, hash_query, make_etag
+# Caminho rápido de serialização (opcional, FAST_JSON=1)
+from app.api.core.config import settings
+from app.api.core.responses import FastJSONResponse, dumps
+# Compressão e cache das coleções já comprimidas
+from app.api.core.compression import cached_collection_response, negotiate
 
 # Cria um novo roteador.
 # O 'prefix' garante que todos os endpoints aqui comecem com /santos.
@@ -22,20 +34,298 @@ router = APIRouter(
     tags=["Santos"]
 )
 
+def _parse_fields(fields: Optional[str]):
+    """Valida o sparse fieldset ('fields=id,nome,...'); campos desconhecidos resultam em 400."""
+    try:
+        return saint_service.parse_fields(fields)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+FIELDS_DESCRIPTION = "Campos a retornar, separados por vírgula (ex.: id,nome,festa_liturgica)"
+
+def _santos_response(santos, response: Response, headers: dict, fields=None):
+    """
+    Resposta de uma lista de santos. Com FAST_JSON ligado, as linhas do banco vão direto
+    para o orjson, sem revalidar o response_model; senão, segue o caminho padrão do FastAPI.
+    Com um sparse fieldset, só os campos pedidos são serializados.
+    """
+    if fields is not None:
+        return FastJSONResponse(
+            [saint_service.santo_fields_as_dict(santo, fields) for santo in santos], headers=headers
+        )
+    if settings.fast_json:
+        return FastJSONResponse([saint_service.santo_as_dict(santo) for santo in santos], headers=headers)
+    response.headers.update(headers)
+    return santos
+
+def santos_filters(
+    veneracao: Optional[List[str]] = Query(None, description="Veneração (repita o parâmetro para vários valores)"),
+    protecao: Optional[List[str]] = Query(None, description="Proteção (repita o parâmetro para vários valores)"),
+    morte_de: Optional[date] = Query(None, description="Data de morte a partir de (AAAA-MM-DD)"),
+    morte_ate: Optional[date] = Query(None, description="Data de morte até (AAAA-MM-DD, inclusive)"),
+    nascimento_de: Optional[date] = Query(None, description="Data de nascimento a partir de (AAAA-MM-DD)"),
+    nascimento_ate: Optional[date] = Query(None, description="Data de nascimento até (AAAA-MM-DD, inclusive)"),
+) -> saint_schema.SantosFilters:
+    """Dependência com os filtros da listagem; intervalos invertidos resultam em 400."""
+    for parametro, inicio, fim in (("morte", morte_de, morte_ate), ("nascimento", nascimento_de, nascimento_ate)):
+        if inicio is not None and fim is not None and inicio > fim:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"'{parametro}_de' deve ser anterior ou igual a '{parametro}_ate'"
+            )
+    return saint_schema.SantosFilters(
+        veneracao=veneracao, protecao=protecao, morte_de=morte_de, morte_ate=morte_ate,
+        nascimento_de=nascimento_de, nascimento_ate=nascimento_ate,
+    )
+
+_SANTOS_LIST = TypeAdapter(List[saint_schema.Santos])
+
+def _render_santos(santos, fields=None) -> bytes:
+    """Corpo JSON de uma lista de santos, com as mesmas regras de _santos_response."""
+    if fields is not None:
+        return dumps([saint_service.santo_fields_as_dict(santo, fields) for santo in santos])
+    if settings.fast_json:
+        return dumps([saint_service.santo_as_dict(santo) for santo in santos])
+    return _SANTOS_LIST.dump_json(_SANTOS_LIST.validate_python(santos, from_attributes=True))
+
+# Tamanho de página padrão e máximo da listagem
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
 @router.get("/", response_model=List[saint_schema.Santos])
-def get_all_santos_endpoint(db: Session = Depends(get_db)):
+async def get_all_santos_endpoint(
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    filters: saint_schema.SantosFilters = Depends(santos_filters),
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Recupera os Santos cadastrados no banco de dados, ordenados por nome, uma página por vez.
+    Se houver mais resultados, o cursor da próxima página vem no cabeçalho 'X-Next-Cursor'.
+    A resposta traz um ETag da coleção; com If-None-Match igual, responde 304 sem ler as linhas.
+    Com 'fields', só as colunas pedidas são lidas do banco (ex.: sem a história).
+    Filtros opcionais por veneração, proteção e intervalos de data de morte/nascimento.
+    Páginas grandes são servidas de um cache já comprimido, até a próxima escrita.
+    """
+    selected = _parse_fields(fields)
+    versao, total = await saint_service.get_collection_version_async(db)
+    key = ("santos", versao, total, hash_query(request.url.query))
+    # Cada codificação é uma representação diferente: o ETag inclui a escolhida
+    encoding = negotiate(accept_encoding)
+    etag = make_etag(*key, encoding or "identity")
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, "Vary": "Accept-Encoding"}
+        )
+
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cursor inválido")
+
+    async def render():
+        # Busca um item a mais só para saber se existe uma próxima página
+        santos = await saint_service.get_all_santos_async(
+            db=db, limit=limit + 1, after=after, fields=selected, filters=filters
+        )
+        headers = {}
+        if len(santos) > limit:
+            santos = santos[:limit]
+            last = santos[-1]
+            headers["X-Next-Cursor"] = encode_cursor(last.nome, last.id)
+        return _render_santos(santos, selected), headers
+
+    # Páginas grandes ficam no cache já serializadas e comprimidas, pela versão
+    response = await cached_collection_response(key, encoding, render)
+    response.headers["ETag"] = etag
+    return response
+
+class ExportFormat(str, Enum):
+    ndjson = "ndjson"
+    json = "json"
+
+@router.get("/export")
+async def export_santos_endpoint(
+    format: ExportFormat = ExportFormat.ndjson,
+    batch_size: int = Query(500, ge=1, le=5000),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Exporta o catálogo inteiro de Santos em streaming, como NDJSON (um santo por linha)
+    ou como um array JSON enviado em pedaços. Os registros são lidos do banco em lotes,
+    então o primeiro byte sai imediatamente e a memória não cresce com a tabela.
+    """
+    def serialize(santo) -> str:
+        return saint_schema.Santos.model_validate(santo).model_dump_json()
+
+    async def ndjson_rows():
+        async for batch in saint_service.iter_santos_batches_async(db, batch_size=batch_size):
+            yield "".join(serialize(santo) + "\n" for santo in batch)
+
+    async def json_array_rows():
+        yield "["
+        first = True
+        async for batch in saint_service.iter_santos_batches_async(db, batch_size=batch_size):
+            chunk = ",".join(serialize(santo) for santo in batch)
+            yield chunk if first else "," + chunk
+            first = False
+        yield "]"
+
+    if format is ExportFormat.ndjson:
+        return StreamingResponse(ndjson_rows(), media_type="application/x-ndjson")
+    return StreamingResponse(json_array_rows(), media_type="application/json")
+
+@router.get("/search", response_model=List[saint_schema.SantosSearchResult])
+async def search_santos_endpoint(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_read_db)
+):
     """
-    Recupera todos os Santos cadastrados no banco de dados.
+    Busca textual na história, proteção, atribuições e nome dos Santos.
+    Os resultados vêm ordenados por relevância, com um trecho destacado.
     """
-    return saint_service.get_all_santos(db=db)
+    return await saint_service.search_santos_async(db=db, q=q, limit=limit, offset=offset)
+
+@router.get("/suggest", response_model=List[saint_schema.SantosSuggestion])
+async def suggest_santos_endpoint(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(10, ge=1, le=50),
+):
+    """
+    Sugestões de nomes enquanto o usuário digita: casa cada palavra como prefixo
+    (ignorando acentos e maiúsculas) e tolera erros de digitação. Respondida por um
+    índice em memória, sem consultar o banco.
+    """
+    return saint_service.suggest_santos(q, limit)
+
+def _parse_mes_dia(valor: str, parametro: str) -> int:
+    """Converte 'MM-DD' em MMDD (inteiro), validando o dia (29 de fevereiro é aceito)."""
+    try:
+        mes, dia = (int(parte) for parte in valor.split("-"))
+        date(2000, mes, dia)  # ano bissexto, para aceitar 02-29
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"'{parametro}' deve estar no formato MM-DD"
+        )
+    return mes * 100 + dia
+
+@router.get("/calendar", response_model=List[saint_schema.Santos])
+async def get_santos_calendar_endpoint(
+    response: Response,
+    from_: Optional[str] = Query(None, alias="from", description="Início (MM-DD); padrão: hoje"),
+    to: Optional[str] = Query(None, description="Fim (MM-DD, inclusive); padrão: igual ao início"),
+    limit: int = Query(500, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Santos celebrados entre dois dias do ano, em ordem de calendário.
+    O intervalo pode atravessar a virada do ano (ex.: from=12-28&to=01-03).
+    """
+    selected = _parse_fields(fields)
+    hoje = date.today()
+    inicio = _parse_mes_dia(from_, "from") if from_ else hoje.month * 100 + hoje.day
+    fim = _parse_mes_dia(to, "to") if to else inicio
+    santos = await saint_service.get_santos_calendar_async(
+        db=db, from_mes_dia=inicio, to_mes_dia=fim, limit=limit, fields=selected
+    )
+    return _santos_response(santos, response, {}, selected)
+
+@router.get("/facets", response_model=saint_schema.SantosFacets)
+async def get_santos_facets_endpoint(
+    filters: saint_schema.SantosFilters = Depends(santos_filters),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Quantos santos atendem aos filtros (os mesmos da listagem), no total e por
+    veneração e proteção. Todas as contagens saem de uma única consulta agregada.
+    """
+    return await saint_service.get_santos_facets_async(db, filters)
+
+@router.get("/stats", response_model=saint_schema.SantosStats)
+async def get_santos_stats_endpoint(db: AsyncSession = Depends(get_read_db)):
+    """
+    Estatísticas do catálogo: total de santos e contagens por veneração, por século
+    da morte e por região de nascimento. Vêm de uma tabela agregada mantida a cada
+    escrita, então o custo não cresce com o número de santos.
+    """
+    return await stats_service.get_stats_async(db)
+
+@router.get("/changes", response_model=saint_schema.SantosChanges)
+async def get_santos_changes_endpoint(
+    since: int = Query(0, ge=0, description="Última seq já sincronizada (0 = desde o início)"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Feed de alterações para sincronização incremental: santos criados ou alterados
+    (estado atual) e lápides dos deletados, em ordem de seq, a partir de 'since'.
+    Cada santo aparece uma vez, na sua alteração mais recente. O cliente guarda
+    'next_since' e repete enquanto 'has_more' for verdadeiro.
+    """
+    return await saint_service.get_changes_async(db, since=since, limit=limit)
+
+@router.get("/snapshot", response_model=List[saint_schema.Santos])
+async def get_santos_snapshot_endpoint(
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+):
+    """
+    O catálogo inteiro (mesmo formato da listagem, ordenado por nome) servido de um
+    arquivo estático, regerado em segundo plano alguns segundos depois das escritas.
+    Não consulta o banco: o arquivo (já comprimido, se o cliente aceitar) vai direto
+    do disco, com ETag, GET condicional e requisições parciais (Range).
+    """
+    encoding = negotiate(accept_encoding, snapshot_service.encodings())
+    path = snapshot_service.current_file(encoding)
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Snapshot do catálogo ainda não gerado",
+            headers={"Retry-After": str(max(1, round(settings.snapshot_debounce_seconds)))},
+        )
+
+    etag = make_etag("snapshot", snapshot_service.generation_of(path), encoding or "identity")
+    headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return FileResponse(path, media_type="application/json", headers=headers)
 
 @router.get("/{id_or_name}", response_model=saint_schema.Santos)
-def get_santo_by_id_or_name_endpoint(id_or_name: str, db: Session = Depends(get_db)):
+async def get_santo_by_id_or_name_endpoint(
+    id_or_name: str,
+    response: Response,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db)
+):
     """
     Busca um Santo específico pelo seu ID numérico ou pelo seu Nome.
-    A busca por nome é case-insensitive.
+    A busca por nome ignora maiúsculas/minúsculas e acentos.
+    Com If-None-Match igual ao ETag atual, responde 304 consultando só a versão.
     """
-    db_santo = saint_service.get_santo_by_id_or_name(db=db, id_or_name=id_or_name)
+    selected = _parse_fields(fields)
+    if if_none_match:
+        version = await saint_service.get_santo_version_async(db=db, id_or_name=id_or_name)
+        if version is not None and etag_matches(if_none_match, make_etag(*version)):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": make_etag(*version)})
+
+    if selected is not None:
+        db_santo = await saint_service.get_santo_fields_async(db=db, id_or_name=id_or_name, fields=selected)
+    else:
+        db_santo = await saint_service.get_santo_cached_async(db=db, id_or_name=id_or_name)
     
     # Se o serviço retornar None, significa que o santo não foi encontrado.
     if db_santo is None:
@@ -44,42 +334,94 @@ def get_santo_by_id_or_name_endpoint(id_or_name: str, db: Session = Depends(get_
             detail="Santo não encontrado"
             #detail="Santo encontrado"
         )
-    
+
+    headers = {"ETag": make_etag(db_santo.id, db_santo.versao)}
+    if selected is not None:
+        return FastJSONResponse(saint_service.santo_fields_as_dict(db_santo, selected), headers=headers)
+    if settings.fast_json:
+        return FastJSONResponse(saint_service.santo_as_dict(db_santo), headers=headers)
+    response.headers.update(headers)
     return db_santo
 
 @router.post("/", response_model=saint_schema.Santos, status_code=status.HTTP_201_CREATED)
-def create_santo_endpoint(
+async def create_santo_endpoint(
     santo: saint_schema.SantosCreate, # O corpo (body) da requisição
-    db: Session = Depends(get_db)      # A dependência do banco de dados
+    db: AsyncSession = Depends(get_async_db) # A dependência do banco de dados
 ):
     """
     Cria um novo Santo no banco de dados com as informações fornecidas.
     """
-    return saint_service.create_santo(db=db, santo=santo)
+    return await saint_service.create_santo_async(db=db, santo=santo)
+
+@router.post("/import", response_model=saint_schema.SantosImportReport)
+async def import_santos_endpoint(
+    file: UploadFile = File(...),
+    format: Optional[import_service.ImportFormat] = None,
+    chunk_size: int = Query(500, ge=1, le=10000),
+    commit_every: int = Query(5000, ge=1),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Importa Santos em lote a partir de um arquivo JSONL ou CSV (cabeçalho com os nomes
+    dos campos). O formato vem do parâmetro 'format' ou da extensão do arquivo.
+    Linhas inválidas são reportadas sem abortar a importação.
+    """
+    if format is None:
+        is_csv = (file.filename or "").lower().endswith(".csv")
+        format = import_service.ImportFormat.csv if is_csv else import_service.ImportFormat.jsonl
+
+    # Linhas em bytes, decodificadas uma a uma pelo serviço (no threadpool)
+    return await import_service.import_santos_async(
+        db, file.file, fmt=format, chunk_size=chunk_size, commit_every=commit_every
+    )
+
+@router.patch("/batch", response_model=saint_schema.SantosBatchResult)
+async def batch_update_santos_endpoint(
+    items: List[saint_schema.SantosBatchUpdateItem],
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Atualiza parcialmente vários Santos de uma vez, numa única transação.
+    Cada item traz o 'id' e os campos a alterar. Ids inexistentes são listados em 'missing'.
+    """
+    updated, missing = await saint_service.batch_update_santos_async(db=db, items=items)
+    return saint_schema.SantosBatchResult(affected=updated, missing=missing)
+
+@router.delete("/batch", response_model=saint_schema.SantosBatchResult)
+async def batch_delete_santos_endpoint(
+    body: saint_schema.SantosBatchDelete,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Deleta vários Santos de uma vez, numa única transação.
+    Ids inexistentes são listados em 'missing'.
+    """
+    deleted, missing = await saint_service.batch_delete_santos_async(db=db, ids=body.ids)
+    return saint_schema.SantosBatchResult(affected=deleted, missing=missing)
 
 @router.patch("/{santo_id}", response_model=saint_schema.Santos)
-def update_santo_endpoint(
+async def update_santo_endpoint(
     santo_id: int,
     santo_data: saint_schema.SantosUpdate, # Usa o novo schema de update
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Atualiza parcialmente um Santo existente
     """
-    updated_santo = saint_service.update_santo(db=db, santo_id=santo_id, santo_update=santo_data)
+    updated_santo = await saint_service.update_santo_async(db=db, santo_id=santo_id, santo_update=santo_data)
     if updated_santo is None:
         raise HTTPException(status_code=404, detail="Santo não encontrado")
     return updated_santo
 
 @router.delete("/{santo_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_santo_endpoint(
+async def delete_santo_endpoint(
     santo_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Deleta um Santo existente
     """
-    deleted_santo = saint_service.delete_santo(db=db, santo_id=santo_id)
+    deleted_santo = await saint_service.delete_santo_async(db=db, santo_id=santo_id)
     if deleted_santo is None:
         raise HTTPException(status_code=404, detail="Santo não encontrado")
     
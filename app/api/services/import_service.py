@@ -0,0 +1,171 @@
+# app/api/services/import_service.py
+
+import csv
+import json
+from enum import Enum
+from typing import Any, Iterable, Iterator, List, Tuple, Union
+
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+from starlette.concurrency import iterate_in_threadpool
+
+from app.api.services import saint_service
+from app.db.database import run_sync
+from app.schemas import saint_schema
+
+# Quantos erros por linha entram no relatório (o total continua sendo contado em 'failed')
+MAX_REPORTED_ERRORS = 1000
+
+
+class ImportFormat(str, Enum):
+    jsonl = "jsonl"
+    csv = "csv"
+
+
+def _decode(line: Union[str, bytes]) -> str:
+    """Linhas em bytes (upload lido direto do arquivo) são decodificadas uma a uma."""
+    return line.decode("utf-8-sig") if isinstance(line, bytes) else line
+
+
+def iter_records(lines: Iterable[Union[str, bytes]], fmt: ImportFormat) -> Iterator[Tuple[int, Any]]:
+    """
+    Lê os registros brutos, um por vez, sem carregar o arquivo inteiro.
+    Gera (número da linha, registro) ou (número da linha, exceção) para linhas ilegíveis.
+    As linhas podem vir em bytes (UTF-8): no JSONL, uma linha fora do UTF-8 é só mais
+    uma linha rejeitada. No CSV (registros podem ocupar várias linhas) e em erros do
+    leitor CSV (ex.: campo acima de csv.field_size_limit), a exceção vai para a linha
+    em que a leitura parou e o restante do arquivo é ignorado; as linhas anteriores
+    continuam valendo.
+    """
+    reader = None
+    line_no = 0
+    try:
+        if fmt is ImportFormat.csv:
+            reader = csv.DictReader(_decode(line) for line in lines)
+            for row in reader:
+                yield reader.line_num, row
+            return
+
+        for line_no, line in enumerate(lines, start=1):
+            try:
+                line = _decode(line)
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+            except ValueError as exc:  # inclui UnicodeDecodeError
+                yield line_no, exc
+                continue
+            yield line_no, record
+    except (UnicodeDecodeError, csv.Error) as exc:
+        # A linha com problema ainda não foi contada pelo leitor
+        line_no = (reader.line_num if reader is not None else line_no) + 1
+        reason = f"fora do UTF-8: {exc.reason}" if isinstance(exc, UnicodeDecodeError) else f"CSV inválido: {exc}"
+        yield line_no, ValueError(f"arquivo ilegível ({reason}); o restante não foi lido")
+
+
+def _describe(exc: Exception) -> str:
+    if isinstance(exc, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(part) for part in err['loc']) or 'registro'}: {err['msg']}" for err in exc.errors()
+        )
+    return str(exc)
+
+
+def iter_validated_chunks(
+    lines: Iterable[Union[str, bytes]], fmt: ImportFormat, chunk_size: int = 500
+) -> Iterator[Tuple[List[saint_schema.SantosCreate], List[saint_schema.SantosImportError]]]:
+    """
+    Valida os registros contra SantosCreate e os agrupa em lotes de até 'chunk_size'
+    santos válidos, junto com os erros das linhas rejeitadas desde o lote anterior.
+    """
+    valid: List[saint_schema.SantosCreate] = []
+    errors: List[saint_schema.SantosImportError] = []
+    for line_no, record in iter_records(lines, fmt):
+        try:
+            if isinstance(record, Exception):
+                raise record
+            valid.append(saint_schema.SantosCreate.model_validate(record))
+        except (ValueError, ValidationError) as exc:
+            errors.append(saint_schema.SantosImportError(line=line_no, error=_describe(exc)))
+
+        if len(valid) >= chunk_size:
+            yield valid, errors
+            valid, errors = [], []
+
+    if valid or errors:
+        yield valid, errors
+
+
+def _record_errors(report: saint_schema.SantosImportReport, errors: List[saint_schema.SantosImportError]) -> None:
+    report.failed += len(errors)
+    room = MAX_REPORTED_ERRORS - len(report.errors)
+    if room > 0:
+        report.errors.extend(errors[:room])
+
+
+def _commit(db: Session) -> None:
+    db.commit()
+
+
+def import_santos(
+    db: Session,
+    lines: Iterable[Union[str, bytes]],
+    fmt: ImportFormat = ImportFormat.jsonl,
+    chunk_size: int = 500,
+    commit_every: int = 5000,
+) -> saint_schema.SantosImportReport:
+    """
+    Importa Santos a partir de linhas JSONL ou CSV, em streaming.
+    Cada lote válido é inserido com um único executemany, e a transação é commitada
+    a cada 'commit_every' linhas inseridas. Linhas inválidas são reportadas e puladas,
+    sem abortar o restante da carga.
+    """
+    report = saint_schema.SantosImportReport()
+    pending: List[Tuple[int, str]] = []
+
+    for valid, errors in iter_validated_chunks(lines, fmt, chunk_size):
+        _record_errors(report, errors)
+        pending.extend(saint_service.bulk_insert_santos(db, valid))
+        if len(pending) >= commit_every:
+            _commit(db)
+            report.inserted += len(pending)
+            saint_service.invalidate_santos(pending)
+            saint_service.index_santos(pending)
+            pending = []
+
+    _commit(db)
+    report.inserted += len(pending)
+    saint_service.invalidate_santos(pending)
+    saint_service.index_santos(pending)
+    return report
+
+
+async def import_santos_async(
+    db,
+    lines: Iterable[Union[str, bytes]],
+    fmt: ImportFormat = ImportFormat.jsonl,
+    chunk_size: int = 500,
+    commit_every: int = 5000,
+) -> saint_schema.SantosImportReport:
+    """
+    Versão assíncrona de import_santos: a leitura, a decodificação e a validação de
+    cada lote rodam no threadpool, e só as escritas voltam ao event loop.
+    """
+    report = saint_schema.SantosImportReport()
+    pending: List[Tuple[int, str]] = []
+
+    async for valid, errors in iterate_in_threadpool(iter_validated_chunks(lines, fmt, chunk_size)):
+        _record_errors(report, errors)
+        pending.extend(await run_sync(db, saint_service.bulk_insert_santos, valid))
+        if len(pending) >= commit_every:
+            await run_sync(db, _commit)
+            report.inserted += len(pending)
+            saint_service.invalidate_santos(pending)
+            saint_service.index_santos(pending)
+            pending = []
+
+    await run_sync(db, _commit)
+    report.inserted += len(pending)
+    saint_service.invalidate_santos(pending)
+    saint_service.index_santos(pending)
+    return report
@@ -1,33 +1,414 @@
 # app/api/services/santos_service.py
 
+import re
+
+from functools import lru_cache
+
+from sqlalchemy import Row, bindparam, delete, func, insert, literal, select, text, tuple_, union_all, update
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from app.db.database import run_sync
 from app.models import saint_model
 from app.schemas import saint_schema
+from app.api.core.cache import LRUCache, MISSING
+from app.api.core.suggest import SuggestionIndex
+from app.api.core.config import settings
+from app.api.services import stats_service
+
+# Cache de leitura dos santos, por id e por nome. Guarda o schema Pydantic
+# (desacoplado da sessão) e também os "não encontrados" (None).
+santo_cache = LRUCache(maxsize=settings.santo_cache_maxsize, ttl=settings.santo_cache_ttl)
+
+# Índice em memória das sugestões de nome (type-ahead): carregado na inicialização
+# e atualizado pelas escritas deste processo (ver sync_name_index para os demais)
+name_index = SuggestionIndex(normalize=saint_model.normalize_nome)
+
+# Funções avisadas após as escritas (ver add_change_listener)
+_change_listeners: List[Callable[[], None]] = []
+
+# Campos da resposta pública de um santo (schema Santos), na ordem do schema
+SANTOS_FIELDS = tuple(saint_schema.Santos.model_fields)
+
+def santo_as_dict(santo) -> dict:
+    """
+    Converte uma linha confiável do banco (ou um schema Santos) no dicionário da resposta,
+    sem revalidação. Usado pelo caminho rápido de serialização (FastJSONResponse).
+    """
+    return {field: getattr(santo, field) for field in SANTOS_FIELDS}
+
+def parse_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """
+    Interpreta o parâmetro 'fields' (nomes separados por vírgula) de um sparse fieldset.
+    Retorna None quando não informado (todos os campos). O 'id' sempre é incluído.
+    Levanta ValueError para campos desconhecidos.
+    """
+    if not fields:
+        return None
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in requested if field not in SANTOS_FIELDS]
+    if unknown:
+        raise ValueError(f"Campos desconhecidos: {', '.join(unknown)}")
+    return tuple(dict.fromkeys(["id", *requested]))
+
+def santo_fields_as_dict(santo, fields: Sequence[str]) -> dict:
+    """Dicionário só com os campos pedidos (os demais nem foram carregados do banco)."""
+    return {field: getattr(santo, field) for field in fields}
+
+# --- Caminho de leitura em Core ---
+# As leituras mais frequentes não passam pelo ORM: os statements select() são montados
+# uma vez por formato (colunas pedidas, filtros presentes), com os valores em
+# bindparams, e executados direto na conexão da sessão. O SQL compilado fica no cache
+# de compilação da engine; o resultado são Rows (tuplas leves com acesso por atributo,
+# ex.: row.nome), sem instâncias do modelo nem identity map.
+
+# Colunas da tabela pelo nome do atributo (no banco, os nomes têm acentos)
+_COLUMNS = {attr: saint_model.Santos.__mapper__.columns[attr] for attr in saint_model.Santos.__mapper__.columns.keys()}
+
+# Predicado de cada filtro da listagem (campos de SantosFilters), a partir do valor
+# ou de um bindparam com o nome do filtro
+_FILTER_PREDICATES = {
+    "veneracao": lambda value: _COLUMNS["veneracao"].in_(value),
+    "protecao": lambda value: _COLUMNS["protecao"].in_(value),
+    "morte_de": lambda value: _COLUMNS["data_de_morte"] >= value,
+    "morte_ate": lambda value: _COLUMNS["data_de_morte"] <= value,
+    "nascimento_de": lambda value: _COLUMNS["data_de_nascimento"] >= value,
+    "nascimento_ate": lambda value: _COLUMNS["data_de_nascimento"] <= value,
+}
+# Filtros de lista (IN): o bindparam se expande no número de valores da requisição
+_LIST_FILTERS = ("veneracao", "protecao")
+
+def _read_columns(fields: Optional[Sequence[str]], *required: str) -> list:
+    """
+    Colunas do SELECT, rotuladas com os nomes dos atributos: as pedidas (ou todas as
+    do schema Santos) mais as exigidas internamente (ex.: a chave de ordenação).
+    As demais nunca são lidas do SQLite.
+    """
+    columns = dict.fromkeys([*(fields if fields is not None else SANTOS_FIELDS), *required])
+    return [_COLUMNS[column].label(column) for column in columns]
+
+def _bound_filter(name: str):
+    return _FILTER_PREDICATES[name](bindparam(name, expanding=name in _LIST_FILTERS))
+
+def _active_filters(filters: Optional[saint_schema.SantosFilters]) -> Dict[str, object]:
+    """Filtros informados na requisição (nome -> valor), na ordem de SantosFilters."""
+    if filters is None:
+        return {}
+    return {name: getattr(filters, name) for name in _FILTER_PREDICATES if getattr(filters, name)}
+
+@lru_cache(maxsize=256)
+def _list_statement(fields: Optional[Tuple[str, ...]], keyset: bool, limited: bool, filters: Tuple[str, ...]):
+    """SELECT da listagem por (nome, id) para um formato de requisição (ver get_all_santos)."""
+    nome, santo_id = _COLUMNS["nome"], _COLUMNS["id"]
+    query = select(*_read_columns(fields, "nome", "id")).where(*(_bound_filter(name) for name in filters))
+    if keyset:
+        query = query.where(tuple_(nome, santo_id) > tuple_(bindparam("after_nome"), bindparam("after_id")))
+    query = query.order_by(nome, santo_id)
+    if limited:
+        query = query.limit(bindparam("limit"))
+    return query
+
+@lru_cache(maxsize=64)
+def _lookup_statement(fields: Optional[Tuple[str, ...]], by_id: bool):
+    """SELECT de um santo por id ou por nome normalizado (ver get_santo_by_id_or_name)."""
+    column = _COLUMNS["id"] if by_id else _COLUMNS["nome_normalizado"]
+    return select(*_read_columns(fields, "id", "versao")).where(column == bindparam("chave")).limit(1)
+
+@lru_cache(maxsize=64)
+def _calendar_statement(fields: Optional[Tuple[str, ...]]):
+    """SELECT de uma faixa de dias de festa, em ordem de calendário (ver get_santos_calendar)."""
+    festa = _COLUMNS["festa_mes_dia"]
+    return (
+        select(*_read_columns(fields))
+        .where(festa.between(bindparam("inicio"), bindparam("fim")))
+        .order_by(festa, _COLUMNS["nome"])
+        .limit(bindparam("limit"))
+    )
+
+def _read(db: Session, statement, params: dict):
+    """Executa um statement do caminho de leitura na conexão da sessão (sem o ORM)."""
+    return db.connection().execute(statement, params)
+
+@lru_cache(maxsize=2)
+def _version_statement(by_id: bool):
+    """SELECT só de (id, versão) de um santo (ver get_santo_version)."""
+    column = _COLUMNS["id"] if by_id else _COLUMNS["nome_normalizado"]
+    return select(_COLUMNS["id"], _COLUMNS["versao"]).where(column == bindparam("chave")).limit(1)
+
+@lru_cache(maxsize=1)
+def _collection_version_statement():
+    """SELECT de (contador de versões, total) da coleção (ver get_collection_version)."""
+    Stats = saint_model.SantosStats
+    dimensao, valor = stats_service.TOTAL
+    # O contador é uma linha só, e a contagem vem das estatísticas mantidas a cada
+    # escrita: custo constante, sem varrer a tabela
+    return select(
+        _current_version(),
+        func.coalesce(
+            select(Stats.total).where(Stats.dimensao == dimensao, Stats.valor == valor).scalar_subquery(), 0
+        ),
+    )
+
+def _lookup_key(id_or_name: str) -> Tuple[bool, object]:
+    """(busca por id?, valor) de um identificador recebido na rota."""
+    if id_or_name.isdigit():
+        return True, int(id_or_name)
+    return False, saint_model.normalize_nome(id_or_name)
+
+def _cache_key(id_or_name: str) -> Tuple[str, object]:
+    """Chave do cache para um identificador recebido na rota (id numérico ou nome)."""
+    if id_or_name.isdigit():
+        return ("id", int(id_or_name))
+    return ("nome", saint_model.normalize_nome(id_or_name))
+
+def add_change_listener(listener: Callable[[], None]) -> None:
+    """
+    Registra uma função chamada após cada escrita commitada nos santos (ex.: para
+    regerar o snapshot). Pode ser chamada de qualquer thread: deve ser barata.
+    """
+    _change_listeners.append(listener)
+
+def remove_change_listener(listener: Callable[[], None]) -> None:
+    if listener in _change_listeners:
+        _change_listeners.remove(listener)
 
-def get_all_santos(db: Session) -> List[saint_model.Santos]:
+def _notify_change() -> None:
+    for listener in _change_listeners:
+        listener()
+
+def _evict_santo(santo_id: int, *nomes: Optional[str]) -> None:
+    santo_cache.pop(("id", santo_id))
+    for nome in nomes:
+        if nome is not None:
+            santo_cache.pop(("nome", saint_model.normalize_nome(nome)))
+
+def _invalidate_santo(santo_id: int, *nomes: Optional[str]) -> None:
+    """Remove do cache as entradas de um santo: a do id e as dos nomes informados."""
+    _evict_santo(santo_id, *nomes)
+    _notify_change()
+
+def invalidate_santos(santos: Iterable[Tuple[int, str]]) -> None:
+    """Invalida o cache para vários pares (id, nome), após escritas em lote."""
+    for santo_id, nome in santos:
+        _evict_santo(santo_id, nome)
+    _notify_change()
+
+def index_santos(santos: Iterable[Tuple[int, str]]) -> None:
+    """Atualiza o índice de sugestões com pares (id, nome) já commitados."""
+    for santo_id, nome in santos:
+        name_index.add(santo_id, nome)
+
+def load_name_index(db: Session) -> int:
+    """Carrega o índice de sugestões com todos os nomes do banco. Retorna quantos foram indexados."""
+    version, _ = get_collection_version(db)
+    Santos = saint_model.Santos
+    rows = db.execute(select(Santos.id, Santos.nome, Santos.nome_normalizado))
+    return name_index.load(rows, version=version)
+
+def sync_name_index(db: Session) -> bool:
+    """
+    Traz para o índice de sugestões as escritas feitas por outros processos (workers).
+    Com a mesma versão e contagem da tabela não há nada a fazer; senão, reindexa só os
+    santos com versão maior que a do índice (criados/alterados) e, se a contagem ainda
+    não bater (houve deleções), recarrega tudo. Retorna True se o índice mudou.
+    """
+    version, total = get_collection_version(db)
+    if version == name_index.version and total == len(name_index):
+        return False
+    Santos = saint_model.Santos
+    rows = db.execute(select(Santos.id, Santos.nome, Santos.nome_normalizado).where(Santos.versao > name_index.version))
+    for santo_id, nome, normalized in rows:
+        name_index.add(santo_id, nome, normalized)
+    name_index.version = version
+    if len(name_index) != total:
+        load_name_index(db)
+    return True
+
+def suggest_santos(q: str, limit: int = 10) -> List[saint_schema.SantosSuggestion]:
+    """Sugestões de nomes para 'q' (prefixos e erros de digitação), só da memória."""
+    return [saint_schema.SantosSuggestion(id=santo_id, nome=nome) for santo_id, nome in name_index.suggest(q, limit)]
+
+def _current_version():
     """
-    Recupera todos os Santos do banco de dados, ordenados por nome.
-    Retorna uma lista de objetos do modelo SQLAlchemy.
+    Contador de versões (ver SantosVersao), como subconsulta SQL. Toda escrita em
+    'santos' (inclusive delete) o incrementa, então ele só cresce.
     """
-    return db.query(saint_model.Santos).order_by(saint_model.Santos.nome).all()
+    return select(func.coalesce(func.max(saint_model.SantosVersao.valor), 0)).scalar_subquery()
 
-def get_santo_by_id_or_name(db: Session, id_or_name: str) -> Optional[saint_model.Santos]:
+def _next_version():
+    """
+    Próxima versão (contador + 1), como subconsulta SQL. Avaliada no próprio
+    INSERT/UPDATE, dentro da transação de escrita.
+    """
+    return select(func.coalesce(func.max(saint_model.SantosVersao.valor), 0) + 1).scalar_subquery()
+
+def get_santo_version(db: Session, id_or_name: str) -> Optional[Tuple[int, int]]:
+    """
+    Retorna (id, versão) de um Santo sem carregar o registro, para GETs condicionais.
+    Usa os mesmos critérios de get_santo_by_id_or_name (id ou nome normalizado).
+    """
+    by_id, chave = _lookup_key(id_or_name)
+    row = _read(db, _version_statement(by_id), {"chave": chave}).first()
+    return (row[0], row[1]) if row is not None else None
+
+def get_collection_version(db: Session) -> Tuple[int, int]:
+    """
+    Retorna (contador de versões, quantidade de linhas) da tabela: o contador
+    cresce a cada create, update ou delete e serve de base para o ETag da coleção.
+    """
+    row = _read(db, _collection_version_statement(), {}).one()
+    return row[0], row[1]
+
+def filter_clauses(filters: Optional[saint_schema.SantosFilters]) -> list:
+    """
+    Predicados SQL dos filtros da listagem: igualdade (IN) na veneração e na proteção
+    e intervalos nas datas, todos sobre colunas indexadas (ver os índices de Santos).
+    """
+    return [_FILTER_PREDICATES[name](value) for name, value in _active_filters(filters).items()]
+
+def get_all_santos(
+    db: Session,
+    limit: Optional[int] = None,
+    after: Optional[Tuple[str, int]] = None,
+    fields: Optional[Sequence[str]] = None,
+    filters: Optional[saint_schema.SantosFilters] = None,
+) -> List[Row]:
+    """
+    Recupera os Santos do banco de dados, ordenados por (nome, id).
+    Retorna uma lista de Rows com os campos do schema Santos (acesso por atributo,
+    ex.: row.nome); com 'fields', só essas colunas (e nome e id, usados no cursor)
+    são lidas. 'filters' restringe a listagem (ver filter_clauses).
+
+    Paginação por keyset: 'after' é a chave (nome, id) do último item da página
+    anterior. A consulta parte direto desse ponto no índice de 'nome', então o
+    custo de uma página não depende de quão fundo o cliente já paginou.
+    """
+    active = _active_filters(filters)
+    statement = _list_statement(
+        tuple(fields) if fields is not None else None, after is not None, limit is not None, tuple(active)
+    )
+    params = dict(active)
+    if after is not None:
+        params["after_nome"], params["after_id"] = after
+    if limit is not None:
+        params["limit"] = limit
+    return _read(db, statement, params).all()
+
+# Facetas da listagem: campos do schema SantosFacets
+FACETS = ("veneracao", "protecao")
+
+def get_santos_facets(db: Session, filters: Optional[saint_schema.SantosFilters] = None) -> saint_schema.SantosFacets:
+    """
+    Contagens por valor de cada faceta entre os santos que atendem aos filtros.
+    Todas as facetas saem de uma única consulta (um GROUP BY por faceta, unidos com
+    UNION ALL); o total é a soma da primeira faceta, sem um COUNT separado.
+    """
+    clauses = filter_clauses(filters)
+    query = union_all(*(
+        select(literal(facet).label("faceta"), column, func.count())
+        .where(*clauses)
+        .group_by(column)
+        for facet in FACETS
+        for column in [getattr(saint_model.Santos, facet)]
+    ))
+    facets = saint_schema.SantosFacets()
+    for facet, valor, total in db.execute(query):
+        getattr(facets, facet)[valor if valor is not None else stats_service.DESCONHECIDO] = total
+    facets.total = sum(getattr(facets, FACETS[0]).values())
+    return facets
+
+def iter_santos_batches(db: Session, batch_size: int = 500) -> Iterator[List[Row]]:
+    """
+    Percorre a tabela inteira de Santos em lotes de tamanho fixo, na ordem (nome, id).
+    Cada lote é uma consulta por keyset a partir do último item do lote anterior;
+    as linhas não ficam na sessão, então a memória fica constante independente do
+    tamanho da tabela.
+    """
+    after = None
+    while True:
+        batch = get_all_santos(db, limit=batch_size, after=after)
+        if not batch:
+            return
+        after = (batch[-1].nome, batch[-1].id)
+        yield batch
+        if len(batch) < batch_size:
+            return
+
+def get_santo_by_id_or_name(
+    db: Session, id_or_name: str, fields: Optional[Sequence[str]] = None
+) -> Optional[Row]:
     """
     Busca um Santo específico por ID (se o input for um número) 
     ou por nome (se for texto).
-    Retorna um único objeto do modelo SQLAlchemy ou None se não encontrar.
+    Retorna uma Row com os campos do schema Santos, ou None se não encontrar.
+    Com 'fields', só essas colunas (e id e versão, usados no ETag) são lidas.
     """
-    query = db.query(saint_model.Santos)
-    
-    # Verifica se o identificador é composto apenas por dígitos
-    if id_or_name.isdigit():
-        # Se for um número, busca EXCLUSIVAMENTE pelo ID.
-        return query.filter(saint_model.Santos.id == int(id_or_name)).first()
-    else:
-        # Se não for um número, busca EXCLUSIVAMENTE pelo nome (case-insensitive).
-        # Usamos 'ilike' para busca case-insensitive.
-        return query.filter(saint_model.Santos.nome.ilike(id_or_name)).first()
+    # Só dígitos: busca EXCLUSIVAMENTE pelo ID. Senão, EXCLUSIVAMENTE pelo nome,
+    # ignorando caixa e acentos (comparado com a coluna normalizada, que é indexada).
+    by_id, chave = _lookup_key(id_or_name)
+    statement = _lookup_statement(tuple(fields) if fields is not None else None, by_id)
+    return _read(db, statement, {"chave": chave}).first()
+
+def get_santo_cached(db: Session, id_or_name: str) -> Optional[saint_schema.Santos]:
+    """
+    Versão com cache de get_santo_by_id_or_name.
+    Retorna o schema Pydantic do santo, ou None se não existir.
+    """
+    key = _cache_key(id_or_name)
+    cached = santo_cache.get(key)
+    if cached is not MISSING and (not settings.santo_cache_validate or _is_current(db, id_or_name, cached)):
+        return cached
+
+    return _cache_santo(key, get_santo_by_id_or_name(db, id_or_name))
+
+def _is_current(db: Session, id_or_name: str, cached: Optional[saint_schema.Santos]) -> bool:
+    """
+    Se uma entrada do cache ainda corresponde ao banco: mesmo (id, versão), ou o santo
+    continua não existindo. As escritas de outros workers não passam por este cache.
+    """
+    expected = (cached.id, cached.versao) if cached is not None else None
+    return get_santo_version(db, id_or_name) == expected
+
+def _cache_santo(key: Tuple[str, object], db_santo: Optional[Row]) -> Optional[saint_schema.Santos]:
+    """Converte o resultado da consulta para o schema e o guarda no cache (inclusive None)."""
+    santo = saint_schema.Santos.model_validate(db_santo) if db_santo is not None else None
+    santo_cache.set(key, santo)
+    return santo
+
+# Pesos do bm25 por coluna da santos_fts: nome, proteção, historia, atribuições
+_SEARCH_SQL = text("""
+    SELECT s.id AS id, s.nome AS nome,
+           bm25(santos_fts, 10.0, 5.0, 1.0, 2.0) AS score,
+           snippet(santos_fts, -1, '<mark>', '</mark>', '…', 16) AS snippet
+    FROM santos_fts
+    JOIN santos AS s ON s.id = santos_fts.rowid
+    WHERE santos_fts MATCH :q
+    ORDER BY score, s.id
+    LIMIT :limit OFFSET :offset
+""")
+
+def _fts_query(q: str) -> Optional[str]:
+    """
+    Converte o texto digitado pelo usuário numa consulta FTS5 segura:
+    cada palavra vira um termo entre aspas (todas obrigatórias) e a última
+    também casa como prefixo, para a busca funcionar enquanto se digita.
+    """
+    termos = re.findall(r"\w+", q)
+    if not termos:
+        return None
+    partes = [f'"{termo}"' for termo in termos]
+    partes[-1] += "*"
+    return " ".join(partes)
+
+def search_santos(db: Session, q: str, limit: int = 20, offset: int = 0) -> List[dict]:
+    """
+    Busca textual em nome, proteção, história e atribuições dos Santos,
+    ordenada por relevância (bm25) e com trechos destacados.
+    """
+    fts_query = _fts_query(q)
+    if fts_query is None:
+        return []
+    rows = db.execute(_SEARCH_SQL, {"q": fts_query, "limit": limit, "offset": offset})
+    return [dict(row._mapping) for row in rows]
 
 def create_santo(db: Session, santo: saint_schema.SantosCreate) -> saint_model.Santos:
     """
@@ -39,18 +420,45 @@ def create_santo(db: Session, santo: saint_schema.SantosCreate) -> saint_model.S
     
     # Cria uma instância do modelo SQLAlchemy usando o dicionário desempacotado (**)
     db_santo = saint_model.Santos(**santo_data)
+    db_santo.versao = _next_version()
     
     # Adiciona o novo objeto à sessão do banco de dados
     db.add(db_santo)
+    # Estatísticas atualizadas na mesma transação
+    stats_service.apply_deltas(db, stats_service.deltas(added=[stats_service.values_of(santo_data)]))
     
     # Commita (salva) a transação no banco de dados
     db.commit()
     
     # Atualiza o objeto para obter os dados gerados pelo banco (como o ID)
     db.refresh(db_santo)
+
+    # Remove eventuais "não encontrado" guardados no cache para este id/nome
+    _invalidate_santo(db_santo.id, db_santo.nome)
+    name_index.add(db_santo.id, db_santo.nome)
     
     return db_santo
 
+def bulk_insert_santos(db: Session, santos: List[saint_schema.SantosCreate]) -> List[Tuple[int, str]]:
+    """
+    Insere vários Santos de uma vez (executemany), SEM commitar: quem chama decide
+    o tamanho da transação. Retorna os pares (id, nome) inseridos, para invalidar
+    o cache depois do commit (ver invalidate_santos).
+    """
+    if not santos:
+        return []
+    # A versão sai do próprio INSERT (subconsulta), dentro da transação de escrita
+    rows = [saint_model.derive_columns(santo.model_dump()) for santo in santos]
+    result = db.execute(
+        insert(saint_model.Santos)
+        .values(versao=_next_version())
+        .returning(saint_model.Santos.id, saint_model.Santos.nome),
+        rows,
+    )
+    inserted = [(row.id, row.nome) for row in result]
+    stats_service.apply_deltas(db, stats_service.deltas(added=map(stats_service.values_of, rows)))
+    return inserted
+
 def update_santo(db: Session, santo_id: int, santo_update: saint_schema.SantosUpdate) -> Optional[saint_model.Santos]:
     """
     Atualiza um registro de Santo no banco de dados.
@@ -66,14 +474,24 @@ def update_santo(db: Session, santo_id: int, santo_update: saint_schema.SantosUp
     #    'exclude_unset=True' é importante: garante que apenas os campos
     #    que o usuário REALMENTE enviou sejam incluídos no dicionário.
     update_data = santo_update.model_dump(exclude_unset=True)
+    nome_antigo = db_santo.nome
+    stats_antigos = stats_service.values_of(db_santo)
 
     # 3. Atualiza os campos do objeto do banco com os dados recebidos
     for key, value in update_data.items():
         setattr(db_santo, key, value)
+    db_santo.versao = _next_version()
+    stats_service.apply_deltas(
+        db, stats_service.deltas(added=[stats_service.values_of(db_santo)], removed=[stats_antigos])
+    )
 
     # 4. Commita a transação e atualiza o objeto
     db.commit()
     db.refresh(db_santo)
+
+    _invalidate_santo(db_santo.id, nome_antigo, db_santo.nome)
+    if db_santo.nome != nome_antigo:
+        name_index.add(db_santo.id, db_santo.nome)
     
     return db_santo
 
@@ -89,6 +507,243 @@ def delete_santo(db: Session, santo_id: int) -> Optional[saint_model.Santos]:
     
     # 2. Deleta o objeto da sessão e commita a transação
     db.delete(db_santo)
+    stats_service.apply_deltas(db, stats_service.deltas(removed=[stats_service.values_of(db_santo)]))
+    db.commit()
+
+    _invalidate_santo(db_santo.id, db_santo.nome)
+    name_index.remove(db_santo.id)
+
+    return db_santo # Retorna o objeto deletado para confirmação
+
+# Tamanho dos blocos de ids nas cláusulas IN (limite de parâmetros do SQLite)
+_IN_CHUNK_SIZE = 500
+
+def _existing_rows(db: Session, ids: List[int]) -> Dict[int, dict]:
+    """
+    Retorna {id: {nome e campos das estatísticas}} dos ids que existem, consultando em blocos.
+    O nome serve para invalidar o cache e os demais campos, para atualizar as estatísticas.
+    """
+    columns = [saint_model.Santos.nome] + [getattr(saint_model.Santos, f) for f in stats_service.STATS_FIELDS]
+    found: Dict[int, dict] = {}
+    for start in range(0, len(ids), _IN_CHUNK_SIZE):
+        chunk = ids[start:start + _IN_CHUNK_SIZE]
+        rows = db.execute(select(saint_model.Santos.id, *columns).where(saint_model.Santos.id.in_(chunk)))
+        found.update((row.id, dict(row._mapping)) for row in rows)
+    return found
+
+def batch_update_santos(
+    db: Session, items: List[saint_schema.SantosBatchUpdateItem]
+) -> Tuple[List[int], List[int]]:
+    """
+    Atualiza vários Santos numa única transação. As alterações são aplicadas com
+    UPDATE por chave primária em executemany (agrupadas pelos campos alterados),
+    sem carregar os objetos. Retorna (ids atualizados, ids inexistentes); itens sem
+    nenhum campo a alterar não contam como atualizados.
+    """
+    # Vários itens para o mesmo id são combinados; o último valor de cada campo vence
+    changes: Dict[int, dict] = {}
+    for item in items:
+        changes.setdefault(item.id, {}).update(item.model_dump(exclude_unset=True, exclude={"id"}))
+
+    ids = list(changes)
+    old_rows = _existing_rows(db, ids)
+    missing = [santo_id for santo_id in ids if santo_id not in old_rows]
+
+    rows = [
+        saint_model.derive_columns({"id": santo_id, **values})
+        for santo_id, values in changes.items()
+        if santo_id in old_rows and values
+    ]
+    if rows:
+        # A versão sai do próprio UPDATE (subconsulta), dentro da transação de escrita
+        db.execute(update(saint_model.Santos).values(versao=_next_version()), rows)
+        stats_service.apply_deltas(db, stats_service.deltas(
+            added=[stats_service.values_of({**old_rows[row["id"]], **row}) for row in rows],
+            removed=[stats_service.values_of(old_rows[row["id"]]) for row in rows],
+        ))
+    db.commit()
+
+    updated = [santo_id for santo_id in ids if santo_id in old_rows and changes[santo_id]]
+    for santo_id in updated:
+        _invalidate_santo(santo_id, old_rows[santo_id]["nome"], changes[santo_id].get("nome"))
+        if "nome" in changes[santo_id]:
+            name_index.add(santo_id, changes[santo_id]["nome"])
+    return updated, missing
+
+def batch_delete_santos(db: Session, ids: List[int]) -> Tuple[List[int], List[int]]:
+    """
+    Deleta vários Santos com DELETE ... WHERE id IN (...) numa única transação.
+    Retorna (ids deletados, ids inexistentes).
+    """
+    ids = list(dict.fromkeys(ids))
+    old_rows = _existing_rows(db, ids)
+    deleted = [santo_id for santo_id in ids if santo_id in old_rows]
+    missing = [santo_id for santo_id in ids if santo_id not in old_rows]
+
+    for start in range(0, len(deleted), _IN_CHUNK_SIZE):
+        chunk = deleted[start:start + _IN_CHUNK_SIZE]
+        db.execute(
+            delete(saint_model.Santos).where(saint_model.Santos.id.in_(chunk)),
+            execution_options={"synchronize_session": False},
+        )
+    stats_service.apply_deltas(
+        db, stats_service.deltas(removed=[stats_service.values_of(old_rows[santo_id]) for santo_id in deleted])
+    )
     db.commit()
 
-    return db_santo # Retorna o objeto deletado para confirmação
\ No newline at end of file
+    invalidate_santos((santo_id, old_rows[santo_id]["nome"]) for santo_id in deleted)
+    for santo_id in deleted:
+        name_index.remove(santo_id)
+    return deleted, missing
+
+
+def get_changes(db: Session, since: int = 0, limit: int = 100) -> saint_schema.SantosChanges:
+    """
+    Alterações com seq maior que 'since', em ordem de seq: o estado atual dos santos
+    criados/alterados e lápides dos deletados. É um range scan na chave primária do
+    feed (uma linha por santo alterado), com o santo buscado pela chave: o custo é
+    proporcional ao número de alterações, não ao tamanho do catálogo.
+    """
+    Change = saint_model.SantosChange
+    rows = (
+        db.query(Change, saint_model.Santos)
+        .outerjoin(saint_model.Santos, saint_model.Santos.id == Change.santo_id)
+        .filter(Change.seq > since)
+        .order_by(Change.seq)
+        .limit(limit + 1)
+        .all()
+    )
+    has_more = len(rows) > limit
+    changes = [
+        saint_schema.SantosChange(
+            seq=change.seq,
+            id=change.santo_id,
+            deleted=change.deleted,
+            santo=saint_schema.Santos.model_validate(santo) if santo is not None and not change.deleted else None,
+        )
+        for change, santo in rows[:limit]
+    ]
+    return saint_schema.SantosChanges(
+        changes=changes, next_since=changes[-1].seq if changes else since, has_more=has_more
+    )
+
+def get_santos_calendar(
+    db: Session,
+    from_mes_dia: int,
+    to_mes_dia: int,
+    limit: int = 500,
+    fields: Optional[Sequence[str]] = None,
+) -> List[Row]:
+    """
+    Santos cuja festa litúrgica cai entre dois dias do ano (MMDD, inclusive),
+    em ordem de calendário. Se 'from' > 'to' o intervalo atravessa a virada do ano
+    (ex.: 12-25 a 01-06) e vira duas faixas: cada uma é um range scan no índice.
+    """
+    if from_mes_dia <= to_mes_dia:
+        faixas = [(from_mes_dia, to_mes_dia)]
+    else:
+        faixas = [(from_mes_dia, 1231), (101, to_mes_dia)]
+
+    statement = _calendar_statement(tuple(fields) if fields is not None else None)
+    santos: List[Row] = []
+    for inicio, fim in faixas:
+        santos.extend(_read(db, statement, {"inicio": inicio, "fim": fim, "limit": limit - len(santos)}))
+        if len(santos) >= limit:
+            break
+    return santos
+
+
+# --- Versões assíncronas ---
+# Recebem uma AsyncSession (ou uma Session comum, nos testes) e executam as funções
+# síncronas acima no event loop, via run_sync.
+
+async def get_all_santos_async(
+    db,
+    limit: Optional[int] = None,
+    after: Optional[Tuple[str, int]] = None,
+    fields: Optional[Sequence[str]] = None,
+    filters: Optional[saint_schema.SantosFilters] = None,
+) -> List[Row]:
+    return await run_sync(db, get_all_santos, limit=limit, after=after, fields=fields, filters=filters)
+
+async def sync_name_index_async(db) -> bool:
+    return await run_sync(db, sync_name_index)
+
+async def get_santos_facets_async(db, filters: Optional[saint_schema.SantosFilters] = None) -> saint_schema.SantosFacets:
+    return await run_sync(db, get_santos_facets, filters)
+
+async def iter_santos_batches_async(db, batch_size: int = 500) -> AsyncIterator[List[Row]]:
+    """Versão assíncrona de iter_santos_batches: um lote por consulta, com memória constante."""
+    after = None
+    while True:
+        batch = await get_all_santos_async(db, limit=batch_size, after=after)
+        if not batch:
+            return
+        after = (batch[-1].nome, batch[-1].id)
+        yield batch
+        if len(batch) < batch_size:
+            return
+
+async def get_santo_by_id_or_name_async(
+    db, id_or_name: str, fields: Optional[Sequence[str]] = None
+) -> Optional[Row]:
+    return await run_sync(db, get_santo_by_id_or_name, id_or_name, fields=fields)
+
+async def get_santo_cached_async(db, id_or_name: str) -> Optional[saint_schema.Santos]:
+    # Acertos no cache nem chegam a tocar a sessão (com validação, só a versão é lida)
+    key = _cache_key(id_or_name)
+    cached = santo_cache.get(key)
+    if cached is not MISSING and await _is_current_async(db, id_or_name, cached):
+        return cached
+    return _cache_santo(key, await get_santo_by_id_or_name_async(db, id_or_name))
+
+async def _is_current_async(db, id_or_name: str, cached: Optional[saint_schema.Santos]) -> bool:
+    if not settings.santo_cache_validate:
+        return True
+    return await run_sync(db, _is_current, id_or_name, cached)
+
+async def get_santo_fields_async(db, id_or_name: str, fields: Sequence[str]):
+    """
+    Busca um Santo para um sparse fieldset: se o santo completo estiver no cache ele é
+    usado; senão, só as colunas pedidas são lidas (e o resultado parcial não vai ao cache).
+    """
+    cached = santo_cache.get(_cache_key(id_or_name))
+    if cached is not MISSING and await _is_current_async(db, id_or_name, cached):
+        return cached
+    return await get_santo_by_id_or_name_async(db, id_or_name, fields=fields)
+
+async def search_santos_async(db, q: str, limit: int = 20, offset: int = 0) -> List[dict]:
+    return await run_sync(db, search_santos, q, limit=limit, offset=offset)
+
+async def create_santo_async(db, santo: saint_schema.SantosCreate) -> saint_model.Santos:
+    return await run_sync(db, create_santo, santo)
+
+async def update_santo_async(
+    db, santo_id: int, santo_update: saint_schema.SantosUpdate
+) -> Optional[saint_model.Santos]:
+    return await run_sync(db, update_santo, santo_id, santo_update)
+
+async def delete_santo_async(db, santo_id: int) -> Optional[saint_model.Santos]:
+    return await run_sync(db, delete_santo, santo_id)
+
+async def batch_update_santos_async(
+    db, items: List[saint_schema.SantosBatchUpdateItem]
+) -> Tuple[List[int], List[int]]:
+    return await run_sync(db, batch_update_santos, items)
+
+async def batch_delete_santos_async(db, ids: List[int]) -> Tuple[List[int], List[int]]:
+    return await run_sync(db, batch_delete_santos, ids)
+
+async def get_santos_calendar_async(
+    db, from_mes_dia: int, to_mes_dia: int, limit: int = 500, fields: Optional[Sequence[str]] = None
+) -> List[Row]:
+    return await run_sync(db, get_santos_calendar, from_mes_dia, to_mes_dia, limit=limit, fields=fields)
+
+async def get_changes_async(db, since: int = 0, limit: int = 100) -> saint_schema.SantosChanges:
+    return await run_sync(db, get_changes, since=since, limit=limit)
+
+async def get_santo_version_async(db, id_or_name: str) -> Optional[Tuple[int, int]]:
+    return await run_sync(db, get_santo_version, id_or_name)
+
+async def get_collection_version_async(db) -> Tuple[int, int]:
+    return await run_sync(db, get_collection_version)
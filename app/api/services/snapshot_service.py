@@ -0,0 +1,249 @@
+# app/api/services/snapshot_service.py
+#
+# Snapshot estático do catálogo: a tabela de santos inteira renderizada num arquivo
+# JSON (o mesmo formato de GET /santos) mais cópias pré-comprimidas (.gz, e .br se o
+# brotli estiver instalado). A rota GET /santos/snapshot só resolve um link simbólico
+# e entrega o arquivo: nenhuma consulta ao banco nem serialização por requisição.
+#
+# Cada geração é gravada em arquivos imutáveis com a versão dos dados no nome
+# (santos-<versão>.json[.gz|.br], com o contador de versões dos santos, que muda a
+# cada escrita e nunca se repete); os links 'santos.json[.gz|.br]' apontam
+# para a geração atual e são trocados atomicamente (os.replace). A geração anterior
+# é mantida, para as requisições que já resolveram o link terminarem de ler.
+
+import asyncio
+import gzip
+import logging
+import os
+import tempfile
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.api.core.config import settings
+from app.api.core.responses import dumps
+from app.api.services import saint_service
+from app.db import database
+
+try:
+    import brotli
+except ImportError:  # brotli é opcional: sem ele, só a cópia .gz
+    brotli = None
+
+try:
+    import fcntl
+except ImportError:  # fora do POSIX, sem trava entre processos
+    fcntl = None
+
+logger = logging.getLogger("app")
+
+SNAPSHOT_NAME = "santos.json"
+BATCH_SIZE = 2000
+
+# Sufixo de arquivo de cada codificação (None = JSON sem compressão)
+SUFFIXES: Dict[Optional[str], str] = {None: "", "gzip": ".gz", "br": ".br"}
+
+
+def encodings() -> Tuple[str, ...]:
+    """Codificações pré-comprimidas geradas, em ordem de preferência."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def snapshot_dir() -> Path:
+    return Path(settings.snapshot_dir)
+
+
+def current_file(encoding: Optional[str] = None, directory: Optional[Path] = None) -> Optional[Path]:
+    """
+    Arquivo da geração atual numa codificação, resolvendo o link (uma chamada de sistema).
+    None se o snapshot ainda não foi gerado.
+    """
+    directory = directory or snapshot_dir()
+    try:
+        return directory / os.readlink(directory / (SNAPSHOT_NAME + SUFFIXES[encoding]))
+    except (FileNotFoundError, OSError):
+        return None
+
+
+def generation_of(path: Path) -> str:
+    """Identificador da geração (a versão) a partir do nome do arquivo."""
+    return path.name.split(".", 1)[0].removeprefix("santos-")
+
+
+class _Writer:
+    """Grava o mesmo conteúdo num arquivo temporário por codificação, numa passada só."""
+
+    def __init__(self, stack: ExitStack, directory: Path):
+        self.files: Dict[Optional[str], str] = {}
+        self._sinks = []
+        for encoding in (None, *encodings()):
+            fd, name = tempfile.mkstemp(dir=directory, prefix=".santos-", suffix=".tmp")
+            self.files[encoding] = name
+            raw = stack.enter_context(os.fdopen(fd, "wb"))
+            if encoding is None:
+                self._sinks.append((raw.write, None))
+            elif encoding == "gzip":
+                compressed = stack.enter_context(
+                    gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=settings.snapshot_gzip_level, mtime=0)
+                )
+                self._sinks.append((compressed.write, None))
+            else:
+                compressor = brotli.Compressor(quality=settings.snapshot_brotli_quality)
+                self._sinks.append((lambda chunk, c=compressor, f=raw: f.write(c.process(chunk)),
+                                    lambda c=compressor, f=raw: f.write(c.finish())))
+
+    def write(self, chunk: bytes) -> None:
+        for write, _ in self._sinks:
+            write(chunk)
+
+    def finish(self) -> None:
+        for _, finish in self._sinks:
+            if finish is not None:
+                finish()
+
+
+@contextmanager
+def _build_lock(directory: Path) -> Iterator[None]:
+    """Uma geração por vez entre os workers (trava de arquivo, quando disponível)."""
+    if fcntl is None:
+        yield
+        return
+    with open(directory / ".lock", "wb") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _swap_link(directory: Path, link: str, target: str) -> None:
+    """Aponta 'link' para 'target' atomicamente (cria um link temporário e renomeia)."""
+    temporary = directory / f".{link}.{os.getpid()}.tmp"
+    temporary.unlink(missing_ok=True)
+    os.symlink(target, temporary)
+    os.replace(temporary, directory / link)
+
+
+def _remove_old_generations(directory: Path, keep: set) -> None:
+    for path in directory.glob("santos-*.json*"):
+        if generation_of(path) not in keep:
+            path.unlink(missing_ok=True)
+
+
+def build_snapshot(db: Session, directory: Optional[Path] = None, force: bool = False) -> bool:
+    """
+    Gera o snapshot se a versão da coleção mudou desde a geração atual. Os santos são
+    lidos em lotes (memória constante) e gravados de uma vez no JSON e nas cópias
+    comprimidas; só então os links passam a apontar para os arquivos novos.
+    Retorna True se uma geração nova foi publicada.
+    """
+    directory = directory or snapshot_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    with _build_lock(directory):
+        # A versão é lida dentro da trava: um worker que esperava outro terminar
+        # vê a geração nova e não refaz o trabalho (nem publica uma mais antiga)
+        versao, total = saint_service.get_collection_version(db)
+        generation = str(versao)
+        previous = current_file(directory=directory)
+        previous_generation = generation_of(previous) if previous is not None else None
+        if (
+            not force
+            and previous_generation == generation
+            and all(current_file(encoding, directory) is not None for encoding in encodings())
+        ):
+            return False
+
+        with ExitStack() as stack:
+            writer = _Writer(stack, directory)
+            try:
+                writer.write(b"[")
+                first = True
+                for batch in saint_service.iter_santos_batches(db, batch_size=BATCH_SIZE):
+                    body = dumps([saint_service.santo_as_dict(santo) for santo in batch])[1:-1]
+                    writer.write(body if first else b"," + body)
+                    first = False
+                writer.write(b"]")
+                writer.finish()
+            except BaseException:
+                stack.close()
+                for name in writer.files.values():
+                    Path(name).unlink(missing_ok=True)
+                raise
+
+        # Arquivos completos: renomeia para os nomes finais e troca os links
+        for encoding, name in writer.files.items():
+            final = f"santos-{generation}.json{SUFFIXES[encoding]}"
+            os.chmod(name, 0o644)
+            os.replace(name, directory / final)
+            _swap_link(directory, SNAPSHOT_NAME + SUFFIXES[encoding], final)
+        _remove_old_generations(directory, {generation, previous_generation})
+        logger.info("Snapshot do catálogo gerado: %d santos (versão %d)", total, versao)
+        return True
+
+
+def rebuild_snapshot() -> bool:
+    """Gera o snapshot numa sessão só de leitura própria (chamado fora das requisições)."""
+    with database.ReadSessionLocal() as db:
+        return build_snapshot(db)
+
+
+class SnapshotScheduler:
+    """
+    Regera o snapshot em segundo plano, com debounce: as escritas avisam (notify, de
+    qualquer thread) e a geração roda quando as escritas param por 'debounce' segundos,
+    ou no máximo 'max_delay' segundos depois do primeiro aviso (escritas contínuas não
+    adiam o snapshot para sempre). Avisos durante uma geração disparam outra em seguida.
+    """
+
+    def __init__(self, build: Callable[[], bool], debounce: float, max_delay: float):
+        self.build = build
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.builds = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._event: Optional[asyncio.Event] = None
+
+    def notify(self) -> None:
+        """Avisa que houve uma escrita. Sem o agendador rodando, não faz nada."""
+        loop, event = self._loop, self._event
+        if loop is None or event is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(event.set)
+
+    async def _build(self) -> None:
+        try:
+            if await asyncio.to_thread(self.build):
+                self.builds += 1
+        except Exception:
+            logger.exception("Falha ao gerar o snapshot do catálogo")
+
+    async def run(self) -> None:
+        """Gera o snapshot (se desatualizado) e depois a cada rajada de escritas."""
+        self._loop = asyncio.get_running_loop()
+        self._event = asyncio.Event()
+        try:
+            await self._build()
+            while True:
+                await self._event.wait()
+                deadline = self._loop.time() + self.max_delay
+                while True:
+                    self._event.clear()
+                    remaining = deadline - self._loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        await asyncio.wait_for(self._event.wait(), timeout=min(self.debounce, remaining))
+                    except asyncio.TimeoutError:
+                        break
+                await self._build()
+        finally:
+            self._loop = self._event = None
+
+
+scheduler = SnapshotScheduler(
+    rebuild_snapshot,
+    debounce=settings.snapshot_debounce_seconds,
+    max_delay=settings.snapshot_max_delay_seconds,
+)
@@ -0,0 +1,129 @@
+# app/api/services/stats_service.py
+
+from collections import Counter
+from datetime import date
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.db.database import run_sync
+from app.models import saint_model
+from app.schemas import saint_schema
+
+# Dimensões das estatísticas (os nomes são os campos do schema SantosStats)
+DIMENSOES = ("veneracao", "seculo_morte", "regiao_nascimento")
+# Linha que guarda a contagem total de santos
+TOTAL = ("total", "")
+# Valor usado quando o campo de origem está vazio
+DESCONHECIDO = "desconhecido"
+# Colunas de Santos de que as estatísticas dependem
+STATS_FIELDS = ("veneracao", "data_de_morte", "local_de_nascimento")
+
+REBUILD_BATCH_SIZE = 5000
+
+StatValues = Tuple[Optional[str], Optional[date], Optional[str]]
+
+
+def seculo(data: Optional[date]) -> Optional[int]:
+    """Século de uma data (1226 -> 13; 1300 -> 13; 1301 -> 14)."""
+    if data is None:
+        return None
+    return (data.year - 1) // 100 + 1
+
+
+def regiao(local: Optional[str]) -> Optional[str]:
+    """Região de um local de nascimento: a última parte ('Assis, Itália' -> 'Itália')."""
+    if not local:
+        return None
+    return local.rsplit(",", 1)[-1].strip() or None
+
+
+def stat_keys(values: StatValues) -> List[Tuple[str, str]]:
+    """Chaves (dimensão, valor) em que um santo é contado."""
+    veneracao, data_de_morte, local_de_nascimento = values
+    numero = seculo(data_de_morte)
+    return [
+        TOTAL,
+        ("veneracao", veneracao or DESCONHECIDO),
+        ("seculo_morte", str(numero) if numero is not None else DESCONHECIDO),
+        ("regiao_nascimento", regiao(local_de_nascimento) or DESCONHECIDO),
+    ]
+
+
+def values_of(santo) -> StatValues:
+    """Valores dos campos das estatísticas de um santo (objeto do modelo, Row ou dicionário)."""
+    if isinstance(santo, dict):
+        return tuple(santo.get(field) for field in STATS_FIELDS)
+    return tuple(getattr(santo, field) for field in STATS_FIELDS)
+
+
+def deltas(added: Iterable[StatValues] = (), removed: Iterable[StatValues] = ()) -> Counter:
+    """Variação das contagens ao incluir 'added' e remover 'removed'."""
+    result: Counter = Counter()
+    for values in added:
+        result.update(stat_keys(values))
+    for values in removed:
+        result.subtract(stat_keys(values))
+    return result
+
+
+def apply_deltas(db: Session, changes: Counter) -> None:
+    """
+    Aplica as variações na tabela de estatísticas (UPSERT total = total + delta),
+    SEM commitar: roda na mesma transação da escrita que as originou.
+    """
+    rows = [
+        {"dimensao": dimensao, "valor": valor, "total": total}
+        for (dimensao, valor), total in changes.items()
+        if total
+    ]
+    if not rows:
+        return
+    Stats = saint_model.SantosStats
+    stmt = sqlite_insert(Stats)
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[Stats.dimensao, Stats.valor],
+            set_={"total": Stats.total + stmt.excluded.total},
+        ),
+        rows,
+    )
+    if any(row["total"] < 0 for row in rows):
+        db.execute(delete(Stats).where(Stats.total <= 0))
+
+
+def get_stats(db: Session) -> saint_schema.SantosStats:
+    """Estatísticas do catálogo, lidas da tabela agregada (uma linha por valor distinto)."""
+    stats = saint_schema.SantosStats()
+    rows = db.execute(select(saint_model.SantosStats.dimensao, saint_model.SantosStats.valor, saint_model.SantosStats.total))
+    for dimensao, valor, total in rows:
+        if (dimensao, valor) == TOTAL:
+            stats.total = total
+        elif dimensao in DIMENSOES:
+            getattr(stats, dimensao)[valor] = total
+    return stats
+
+
+def rebuild_stats(db: Session) -> int:
+    """
+    Recalcula todas as estatísticas a partir da tabela santos (reparo), lendo só as
+    colunas necessárias, em lotes. Commita e retorna o número de santos contados.
+    """
+    columns = [getattr(saint_model.Santos, field) for field in STATS_FIELDS]
+    counts: Counter = Counter()
+    rows = db.execute(select(*columns).execution_options(yield_per=REBUILD_BATCH_SIZE))
+    for values in rows:
+        counts.update(stat_keys(tuple(values)))
+
+    db.execute(delete(saint_model.SantosStats))
+    apply_deltas(db, counts)
+    db.commit()
+    return counts[TOTAL]
+
+
+# --- Versões assíncronas ---
+
+async def get_stats_async(db) -> saint_schema.SantosStats:
+    return await run_sync(db, get_stats)
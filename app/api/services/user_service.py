@@ -2,9 +2,11 @@
 
 from sqlalchemy.orm import Session
 from typing import Optional
+from app.db.database import run_sync
 from app.models import user_model
 from app.schemas import user_schema
-from app.api.core.security import get_password_hash 
+from app.api.core.cache import principal_cache
+from app.api.core.security import get_password_hash, get_password_hash_async
 
 def get_user_by_username(db: Session, username: str) -> Optional[user_model.User]:
     """Busca um usuário pelo nome."""
@@ -14,8 +16,12 @@ def get_user_by_email(db: Session, email: str) -> Optional[user_model.User]:
     """Busca um usuário pelo e-mail."""
     return db.query(user_model.User).filter(user_model.User.email == email).first()
 
-def create_user(db: Session, user: user_schema.UserCreate) -> user_model.User:
-    hashed_password = get_password_hash(user.password)
+def create_user(
+    db: Session, user: user_schema.UserCreate, hashed_password: Optional[str] = None
+) -> user_model.User:
+    """Cria um usuário. Se 'hashed_password' vier pronto, o hash não é recalculado aqui."""
+    if hashed_password is None:
+        hashed_password = get_password_hash(user.password)
     db_user = user_model.User(
         username=user.username,
         email=user.email,
@@ -26,8 +32,13 @@ def create_user(db: Session, user: user_schema.UserCreate) -> user_model.User:
     db.refresh(db_user)
     return db_user
 
-def update_user(db: Session, user_id: int, user_update: user_schema.UserUpdate) -> Optional[user_model.User]:
-    """Atualiza um usuário."""
+def update_user(
+    db: Session,
+    user_id: int,
+    user_update: user_schema.UserUpdate,
+    hashed_password: Optional[str] = None,
+) -> Optional[user_model.User]:
+    """Atualiza um usuário. Se 'hashed_password' vier pronto, o hash não é recalculado aqui."""
     db_user = db.query(user_model.User).filter(user_model.User.id == user_id).first()
     if not db_user:
         return None
@@ -36,7 +47,7 @@ def update_user(db: Session, user_id: int, user_update: user_schema.UserUpdate)
 
     # Se a senha estiver sendo atualizada, ela precisa passar por hash
     if "password" in update_data:
-        db_user.hashed_password = get_password_hash(update_data["password"])
+        db_user.hashed_password = hashed_password or get_password_hash(update_data["password"])
         del update_data["password"] # Remove para não tentar atribuir duas vezes
 
     for key, value in update_data.items():
@@ -44,6 +55,9 @@ def update_user(db: Session, user_id: int, user_update: user_schema.UserUpdate)
 
     db.commit()
     db.refresh(db_user)
+
+    # Tokens em cache deste usuário carregam os dados antigos
+    principal_cache.invalidate_user(user_id)
     return db_user
 
 
@@ -55,4 +69,29 @@ def delete_user(db: Session, user_id: int) -> Optional[user_model.User]:
 
     db.delete(db_user)
     db.commit()
-    return db_user
\ No newline at end of file
+
+    principal_cache.invalidate_user(user_id)
+    return db_user
+
+# --- Versões assíncronas ---
+# Mesmo padrão de saint_service: executam as funções acima no event loop via run_sync.
+
+async def get_user_by_username_async(db, username: str) -> Optional[user_model.User]:
+    return await run_sync(db, get_user_by_username, username)
+
+async def get_user_by_email_async(db, email: str) -> Optional[user_model.User]:
+    return await run_sync(db, get_user_by_email, email)
+
+async def create_user_async(db, user: user_schema.UserCreate) -> user_model.User:
+    # O hash é calculado no pool de hashing antes, fora do event loop
+    hashed_password = await get_password_hash_async(user.password)
+    return await run_sync(db, create_user, user, hashed_password=hashed_password)
+
+async def update_user_async(db, user_id: int, user_update: user_schema.UserUpdate) -> Optional[user_model.User]:
+    hashed_password = None
+    if user_update.password is not None:
+        hashed_password = await get_password_hash_async(user_update.password)
+    return await run_sync(db, update_user, user_id, user_update, hashed_password=hashed_password)
+
+async def delete_user_async(db, user_id: int) -> Optional[user_model.User]:
+    return await run_sync(db, delete_user, user_id)
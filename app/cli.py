@@ -0,0 +1,73 @@
+# app/cli.py
+#
+# Comandos de linha de comando da aplicação. Uso:
+#   python -m app.cli import-santos santos.jsonl [--format csv] [--chunk-size 500] [--commit-every 5000]
+#   python -m app.cli rebuild-stats
+
+import argparse
+import sys
+
+from app.db import database, schema
+
+
+def _import_santos(args: argparse.Namespace) -> int:
+    from app.api.services import import_service
+
+    fmt = args.format
+    if fmt is None:
+        fmt = "csv" if args.path.lower().endswith(".csv") else "jsonl"
+
+    schema.setup_database(database.engine)
+
+    db = database.SessionLocal()
+    try:
+        with open(args.path, encoding="utf-8-sig", newline="") as lines:
+            report = import_service.import_santos(
+                db,
+                lines,
+                fmt=import_service.ImportFormat(fmt),
+                chunk_size=args.chunk_size,
+                commit_every=args.commit_every,
+            )
+    finally:
+        db.close()
+
+    for error in report.errors:
+        print(f"linha {error.line}: {error.error}", file=sys.stderr)
+    print(f"{report.inserted} santos importados, {report.failed} linhas rejeitadas")
+    return 1 if report.failed else 0
+
+
+def _rebuild_stats(args: argparse.Namespace) -> int:
+    from app.api.services import stats_service
+
+    schema.setup_database(database.engine)
+    db = database.SessionLocal()
+    try:
+        total = stats_service.rebuild_stats(db)
+    finally:
+        db.close()
+    print(f"Estatísticas recalculadas: {total} santos")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_cmd = commands.add_parser("import-santos", help="Importa santos de um arquivo JSONL ou CSV")
+    import_cmd.add_argument("path")
+    import_cmd.add_argument("--format", choices=["jsonl", "csv"])
+    import_cmd.add_argument("--chunk-size", type=int, default=500)
+    import_cmd.add_argument("--commit-every", type=int, default=5000)
+    import_cmd.set_defaults(handler=_import_santos)
+
+    stats_cmd = commands.add_parser("rebuild-stats", help="Recalcula as estatísticas agregadas dos santos")
+    stats_cmd.set_defaults(handler=_rebuild_stats)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
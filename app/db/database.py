@@ -1,22 +1,178 @@
 # app/db/database.py
 
-from sqlalchemy import create_engine
+import os
+import weakref
+from typing import Any, Dict, Union
+from urllib.parse import quote
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.pool import StaticPool
+
+from app.api.core.config import Settings, settings
+from app.api.core.sql_tracker import instrument_engine
+
+# URL atualizada (configurável pela variável de ambiente DATABASE_URL)
+DATABASE_URL = settings.database_url
+# Mesmo banco, acessado pelo driver assíncrono (aiosqlite)
+ASYNC_DATABASE_URL = settings.async_database_url
+
+# PRAGMAs reportados por describe_engine
+_REPORTED_PRAGMAS = ("journal_mode", "synchronous", "busy_timeout", "cache_size", "mmap_size", "temp_store")
+
+
+# Engines criadas pela fábrica, para descartar as conexões herdadas após um fork
+_engines: "weakref.WeakSet[Engine]" = weakref.WeakSet()
+
+
+def _is_memory_sqlite(url) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def read_only_url(url: Union[str, URL]) -> Union[str, URL]:
+    """
+    URL de um arquivo SQLite aberto só para leitura (URI 'file:...?mode=ro'): qualquer
+    escrita falha no próprio SQLite. Bancos em memória e outros bancos ficam como estão.
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "sqlite" or _is_memory_sqlite(parsed):
+        return url
+    database = parsed.database
+    if not database.startswith("file:"):
+        database = "file:" + quote(database)
+    return parsed.set(database=database, query={**parsed.query, "mode": "ro", "uri": "true"})
+
+
+def _engine_options(url: str, config: Settings, read_only: bool = False) -> Dict[str, Any]:
+    """Argumentos de create_engine/create_async_engine conforme o banco e as configurações."""
+    parsed = make_url(url)
+    options: Dict[str, Any] = {}
+    if parsed.get_backend_name() == "sqlite":
+        # Este argumento é essencial para o SQLite em aplicações com múltiplas threads.
+        options["connect_args"] = {"check_same_thread": False}
+        if _is_memory_sqlite(parsed):
+            # Banco em memória só existe dentro de uma conexão: todas compartilham a mesma
+            options["poolclass"] = StaticPool
+            return options
+    options.update(
+        pool_size=config.db_read_pool_size if read_only else config.db_pool_size,
+        max_overflow=config.db_read_max_overflow if read_only else config.db_max_overflow,
+        pool_timeout=config.db_pool_timeout,
+    )
+    return options
+
+
+def _apply_sqlite_pragmas(engine: Engine, config: Settings, read_only: bool = False) -> None:
+    """
+    Registra um listener 'connect' que aplica os PRAGMAs em cada nova conexão:
+    WAL (leitores não bloqueiam o escritor), synchronous=NORMAL (seguro com WAL),
+    busy_timeout (espera o lock em vez de falhar com "database is locked"),
+    cache de páginas, mmap e tabelas temporárias em memória. Nas conexões só de
+    leitura, o modo do journal (que é do arquivo) fica como o escritor definiu, e
+    query_only recusa qualquer escrita.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    pragmas = [
+        f"PRAGMA busy_timeout={int(config.sqlite_busy_timeout_ms)}",
+        f"PRAGMA cache_size={int(config.sqlite_cache_size)}",
+        f"PRAGMA mmap_size={int(config.sqlite_mmap_size)}",
+        f"PRAGMA temp_store={config.sqlite_temp_store}",
+    ]
+    if read_only:
+        pragmas.append("PRAGMA query_only=1")
+    else:
+        pragmas[:0] = [
+            f"PRAGMA journal_mode={config.sqlite_journal_mode}",
+            f"PRAGMA synchronous={config.sqlite_synchronous}",
+        ]
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def create_db_engine(url: str = DATABASE_URL, config: Settings = settings, read_only: bool = False) -> Engine:
+    """
+    Cria a engine síncrona a partir das configurações (pool, PRAGMAs e medição do SQL).
+    Com 'read_only', o arquivo é aberto só para leitura e o pool é o das leituras.
+    """
+    if read_only:
+        url = read_only_url(url)
+    engine = create_engine(url, **_engine_options(url, config, read_only))
+    _apply_sqlite_pragmas(engine, config, read_only)
+    _engines.add(engine)
+    return instrument_engine(engine)
+
+
+def create_async_db_engine(
+    url: str = ASYNC_DATABASE_URL, config: Settings = settings, read_only: bool = False
+) -> AsyncEngine:
+    """Cria a engine assíncrona (aiosqlite) com as mesmas regras de pool, PRAGMAs e medição do SQL."""
+    if read_only:
+        url = read_only_url(url)
+    engine = create_async_engine(url, **_engine_options(url, config, read_only))
+    _apply_sqlite_pragmas(engine.sync_engine, config, read_only)
+    instrument_engine(engine.sync_engine)
+    _engines.add(engine.sync_engine)
+    return engine
+
+
+def dispose_engines_after_fork() -> None:
+    """
+    Roda no processo filho logo após um fork: as conexões do pool herdadas pertencem
+    ao pai, então cada engine abandona as suas sem fechá-las (dispose(close=False))
+    e o worker abre conexões próprias na primeira consulta.
+    """
+    for engine in list(_engines):
+        engine.dispose(close=False)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=dispose_engines_after_fork)
+
+
+def describe_engine(engine: Engine) -> Dict[str, Any]:
+    """Configuração efetiva de uma engine (URL sem senha, pool e PRAGMAs), para log na inicialização."""
+    info: Dict[str, Any] = {
+        "url": engine.url.render_as_string(hide_password=True),
+        "pool": engine.pool.status(),
+    }
+    if engine.dialect.name == "sqlite":
+        with engine.connect() as conn:
+            for pragma in _REPORTED_PRAGMAS:
+                info[pragma] = conn.exec_driver_sql(f"PRAGMA {pragma}").scalar()
+    return info
 
-# URL atualizada
-DATABASE_URL = "sqlite:///./app/db/saintdoom.db"
 
 # 'engine'
-engine = create_engine(
-    DATABASE_URL,
-    # Este argumento é essencial para o SQLite em aplicações com múltiplas threads.
-    connect_args={"check_same_thread": False} 
-)
+engine = create_db_engine()
 
 # Criando a classe "fábrica" de sessões. A convenção é chamá-la de SessionLocal.
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Engine e sessões assíncronas, usadas pelas rotas (rodam direto no event loop).
+# 'expire_on_commit=False' evita recarregar atributos (I/O) fora do event loop ao serializar.
+async_engine = create_async_db_engine()
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+# Engines só de leitura, usadas pelos GETs: pool próprio (as leituras não disputam
+# conexões com as escritas) e o SQLite recusa qualquer escrita nessas conexões. Com
+# READ_DATABASE_URL, leem uma cópia do banco (réplica) em vez do arquivo principal.
+read_engine = create_db_engine(settings.read_database_url, read_only=True)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+async_read_engine = create_async_db_engine(settings.async_read_database_url, read_only=True)
+AsyncReadSessionLocal = async_sessionmaker(bind=async_read_engine, autoflush=False, expire_on_commit=False)
+
 # Crie a Base para os seus modelos declarativos.
 Base = declarative_base()
 
@@ -27,4 +183,15 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+async def run_sync(db, fn, *args, **kwargs):
+    """
+    Executa uma função de service síncrona (que recebe a sessão como primeiro argumento)
+    a partir de código assíncrono. Com uma AsyncSession, a função roda no próprio event
+    loop (via greenlet), sem ocupar o threadpool; com uma Session comum (testes),
+    é chamada diretamente.
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return fn(db, *args, **kwargs)
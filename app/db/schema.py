@@ -0,0 +1,235 @@
+# app/db/schema.py
+
+from typing import Optional
+
+from sqlalchemy import bindparam, inspect, select, text, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from app.api.services import stats_service
+from app.db.database import Base
+from app.models import saint_model, user_model  # noqa: F401 (registra as tabelas no Base)
+
+BACKFILL_BATCH_SIZE = 1000
+
+# Versão do schema gerenciado pela aplicação. Incremente sempre que os modelos mudarem
+# (tabelas, colunas, índices, FTS): bancos com outra versão passam pelo upgrade completo.
+SCHEMA_VERSION = 4
+SCHEMA_VERSION_TABLE = "schema_version"
+
+
+def get_schema_version(engine: Engine) -> Optional[int]:
+    """Versão gravada no banco, ou None se o banco ainda não tem a tabela de versão."""
+    with engine.connect() as conn:
+        try:
+            return conn.exec_driver_sql(f"SELECT version FROM {SCHEMA_VERSION_TABLE}").scalar()
+        except DBAPIError:
+            return None
+
+
+def setup_database(engine: Engine) -> bool:
+    """
+    Prepara o banco na inicialização. No caso comum (banco já na versão atual) custa
+    uma única consulta; só quando a versão difere roda create_all e ensure_schema
+    e grava a nova versão. Retorna True se o schema foi criado/atualizado.
+    """
+    if get_schema_version(engine) == SCHEMA_VERSION:
+        return False
+    Base.metadata.create_all(bind=engine)
+    ensure_schema(engine)
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f"CREATE TABLE IF NOT EXISTS {SCHEMA_VERSION_TABLE} (version INTEGER NOT NULL)")
+        conn.exec_driver_sql(f"DELETE FROM {SCHEMA_VERSION_TABLE}")
+        conn.exec_driver_sql(f"INSERT INTO {SCHEMA_VERSION_TABLE} (version) VALUES ({SCHEMA_VERSION})")
+    return True
+
+
+def ensure_schema(engine: Engine) -> None:
+    """
+    Atualiza um banco já existente para o schema atual dos modelos.
+    Todas as etapas são idempotentes e podem rodar a cada inicialização.
+    """
+    add_missing_columns(engine)
+    ensure_santos_autoincrement(engine)
+    ensure_search_index(engine)
+    ensure_version_counter(engine)
+    backfill_nome_normalizado(engine)
+    backfill_festa_mes_dia(engine)
+    ensure_stats(engine)
+    ensure_changes_feed(engine)
+
+
+def add_missing_columns(engine: Engine) -> None:
+    """
+    Adiciona (ALTER TABLE ... ADD COLUMN) as colunas declaradas nos modelos que
+    ainda não existem no banco, e cria os índices que estiverem faltando.
+    """
+    with engine.begin() as conn:
+        inspector = inspect(conn)
+        existing_tables = set(inspector.get_table_names())
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing = {col["name"] for col in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                ddl = f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" '
+                ddl += column.type.compile(dialect=engine.dialect)
+                if column.server_default is not None:
+                    # Sem default o SQLite não aceita adicionar uma coluna NOT NULL
+                    default = column.server_default.arg
+                    if not column.nullable:
+                        ddl += " NOT NULL"
+                    ddl += f" DEFAULT {getattr(default, 'text', default)}"
+                conn.exec_driver_sql(ddl)
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+
+
+def ensure_santos_autoincrement(engine: Engine) -> None:
+    """
+    Recria a tabela 'santos' com AUTOINCREMENT em bancos criados antes dele, para que
+    o id de um santo deletado não volte a ser usado. O SQLite não altera isso com
+    ALTER TABLE: a tabela é renomeada, recriada e os dados copiados, com os ids.
+    Os triggers são removidos antes (a cópia não passa pela FTS nem pelo contador de
+    versões) e recriados pelas etapas seguintes de ensure_schema.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    table = saint_model.Santos.__table__
+    with engine.begin() as conn:
+        ddl = conn.exec_driver_sql(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'santos'"
+        ).scalar()
+        if ddl is None or "AUTOINCREMENT" in ddl.upper():
+            return
+        for kind, name in conn.exec_driver_sql(
+            "SELECT type, name FROM sqlite_master "
+            "WHERE type IN ('trigger', 'index') AND tbl_name = 'santos' AND sql IS NOT NULL"
+        ).all():
+            conn.exec_driver_sql(f'DROP {kind.upper()} "{name}"')
+        conn.exec_driver_sql('ALTER TABLE santos RENAME TO "santos_antiga"')
+        conn.execute(CreateTable(table))
+        for index in table.indexes:
+            conn.execute(CreateIndex(index))
+        columns = ", ".join(f'"{column.name}"' for column in table.columns)
+        conn.exec_driver_sql(f'INSERT INTO santos ({columns}) SELECT {columns} FROM "santos_antiga"')
+        conn.exec_driver_sql('DROP TABLE "santos_antiga"')
+
+
+def ensure_version_counter(engine: Engine) -> None:
+    """
+    Garante a linha e os triggers do contador de versões (ver SantosVersao). Num banco
+    antigo, o contador começa na maior versão já gravada, para que nenhuma versão
+    nova repita uma antiga.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    with engine.begin() as conn:
+        for ddl in saint_model.SANTOS_VERSAO_DDL:
+            conn.exec_driver_sql(ddl)
+        conn.exec_driver_sql(
+            'UPDATE santos_versao SET valor = max(valor, (SELECT coalesce(max("versão"), 0) FROM santos))'
+        )
+
+
+def ensure_search_index(engine: Engine) -> None:
+    """
+    Garante que a tabela FTS5 de busca e seus triggers existam.
+    Em bancos novos eles já são criados junto com a tabela 'santos' (create_all);
+    aqui cobrimos bancos antigos, criando o índice e populando-o a partir da tabela.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    with engine.begin() as conn:
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'santos_fts'")
+        ).first()
+        for ddl in saint_model.SANTOS_FTS_DDL:
+            conn.exec_driver_sql(ddl)
+        if not exists:
+            conn.exec_driver_sql("INSERT INTO santos_fts(santos_fts) VALUES ('rebuild')")
+
+
+def ensure_changes_feed(engine: Engine) -> None:
+    """
+    Garante os triggers do feed de alterações. Num banco antigo, o feed começa
+    com todos os santos existentes (em ordem de versão), para que um cliente que
+    sincroniza do zero (since=0) receba o catálogo inteiro.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    with engine.begin() as conn:
+        for ddl in saint_model.SANTOS_CHANGES_DDL:
+            conn.exec_driver_sql(ddl)
+        empty = conn.exec_driver_sql("SELECT 1 FROM santos_changes LIMIT 1").first() is None
+        if empty:
+            conn.exec_driver_sql(
+                'INSERT INTO santos_changes(santo_id, deleted) SELECT id, 0 FROM santos ORDER BY "versão", id'
+            )
+
+
+def backfill_nome_normalizado(engine: Engine) -> int:
+    """
+    Preenche 'nome normalizado' nas linhas antigas que ainda não o têm, em lotes.
+    Retorna quantas linhas foram atualizadas.
+    """
+    Santos = saint_model.Santos
+    total = 0
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(
+                select(Santos.id, Santos.nome)
+                .where(Santos.nome_normalizado.is_(None), Santos.nome.is_not(None))
+                .limit(BACKFILL_BATCH_SIZE)
+            ).all()
+            if not rows:
+                return total
+            conn.execute(
+                update(Santos)
+                .where(Santos.id == bindparam("b_id"))
+                .values(nome_normalizado=bindparam("b_nome")),
+                [{"b_id": row.id, "b_nome": saint_model.normalize_nome(row.nome)} for row in rows],
+            )
+            total += len(rows)
+
+
+def backfill_festa_mes_dia(engine: Engine) -> int:
+    """
+    Preenche 'festa mês-dia' (MMDD) nas linhas antigas a partir da festa litúrgica.
+    As datas ficam no SQLite como texto 'AAAA-MM-DD', então basta um UPDATE.
+    Retorna quantas linhas foram atualizadas.
+    """
+    with engine.begin() as conn:
+        result = conn.exec_driver_sql(
+            """
+            UPDATE santos
+            SET "festa mês-dia" = CAST(substr("festa litúrgica", 6, 2) AS INTEGER) * 100
+                                + CAST(substr("festa litúrgica", 9, 2) AS INTEGER)
+            WHERE "festa mês-dia" IS NULL AND "festa litúrgica" IS NOT NULL
+            """
+        )
+        return result.rowcount
+
+
+def ensure_stats(engine: Engine) -> None:
+    """
+    Calcula as estatísticas agregadas de bancos que ainda não as têm (tabela recém-criada).
+    Daí em diante elas são mantidas pelas próprias escritas.
+    """
+    with Session(bind=engine) as db:
+        dimensao, valor = stats_service.TOTAL
+        exists = db.execute(
+            select(saint_model.SantosStats.total).where(
+                saint_model.SantosStats.dimensao == dimensao, saint_model.SantosStats.valor == valor
+            )
+        ).first()
+        if exists is None:
+            stats_service.rebuild_stats(db)
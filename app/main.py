@@ -1,28 +1,117 @@
 # app/main.py
 
-from fastapi import FastAPI
-from app.db import database
+import time
+
+# Início da importação do app, para medir o tempo de inicialização do worker
+_IMPORT_STARTED = time.perf_counter()
 
-from app.models import saint_model, user_model
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+
+from fastapi import FastAPI
+from app.db import database, schema
 
 from app.api.routes import saint
 from app.api.routes import auth
+from app.api.routes import metrics
+from app.api.core import metrics as app_metrics
+from app.api.core.config import settings
+from app.api.core.metrics import MetricsMiddleware
+from app.api.core.compression import CompressionMiddleware
+from app.api.core.security import hashing_pool
+from app.api.services import saint_service, snapshot_service
+
+logger = logging.getLogger("app")
+
+# Importar este módulo não toca no banco: o schema é preparado no lifespan,
+# antes da primeira requisição, com uma verificação barata da versão.
+_IMPORT_SECONDS = time.perf_counter() - _IMPORT_STARTED
+
+
+async def _sync_name_index_periodically(interval: float) -> None:
+    """Traz para o índice de sugestões as escritas feitas pelos outros workers."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with database.AsyncReadSessionLocal() as db:
+                await saint_service.sync_name_index_async(db)
+        except Exception:
+            logger.exception("Falha ao sincronizar o índice de sugestões")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    started = time.perf_counter()
+    upgraded = schema.setup_database(database.engine)
+    schema_seconds = time.perf_counter() - started
+
+    # Índice de sugestões (type-ahead) carregado uma vez, em memória
+    with database.ReadSessionLocal() as db:
+        indexed = saint_service.load_name_index(db)
+    suggest_seconds = time.perf_counter() - started - schema_seconds
+
+    # Registra a configuração efetiva do banco (pool e PRAGMAs) na inicialização
+    logger.info("Banco de dados: %s", database.describe_engine(database.engine))
+    logger.info("Banco de dados (leitura): %s", database.describe_engine(database.read_engine))
+
+    startup = {
+        "import": _IMPORT_SECONDS,
+        "schema": schema_seconds,
+        "suggest_index": suggest_seconds,
+        "total": _IMPORT_SECONDS + time.perf_counter() - started,
+    }
+    for phase, seconds in startup.items():
+        app_metrics.app_startup_seconds.set(seconds, phase=phase)
+    app.state.startup_seconds = startup
+    logger.info(
+        "Pronto em %.0f ms (importação: %.0f ms, schema: %.0f ms%s, índice de sugestões: %d nomes em %.0f ms)",
+        startup["total"] * 1000, startup["import"] * 1000, schema_seconds * 1000,
+        ", schema criado/atualizado" if upgraded else "", indexed, suggest_seconds * 1000,
+    )
+
+    tasks = []
+    if settings.suggest_refresh_seconds > 0:
+        tasks.append(asyncio.create_task(_sync_name_index_periodically(settings.suggest_refresh_seconds)))
+    # Snapshot estático do catálogo: gerado agora (se desatualizado) e após as escritas
+    if settings.snapshot_enabled:
+        saint_service.add_change_listener(snapshot_service.scheduler.notify)
+        tasks.append(asyncio.create_task(snapshot_service.scheduler.run()))
+
+    yield
+
+    saint_service.remove_change_listener(snapshot_service.scheduler.notify)
+    for task in tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    hashing_pool.shutdown()
+    await database.async_engine.dispose()
+    await database.async_read_engine.dispose()
+    database.engine.dispose()
+    database.read_engine.dispose()
 
-saint_model.Base.metadata.create_all(bind=database.engine)
-user_model.Base.metadata.create_all(bind=database.engine)
 
 app = FastAPI(
     title="Enciclopédia de Santos",
     description="Uma API para obter informações sobre Santos Católicos",
-    version="1.1.0"
+    version="1.1.0",
+    lifespan=lifespan,
 )
 
+# Compressão gzip/brotli das respostas grandes
+app.add_middleware(CompressionMiddleware)
+# Latência por rota, status e tempo gasto no SQLite (exportados em /metrics).
+# Adicionado por último, é o mais externo: mede também a compressão.
+app.add_middleware(MetricsMiddleware)
+
 app.include_router(saint.router)
 app.include_router(auth.router)
+app.include_router(metrics.router)
 
 @app.get("/", tags=["Root"])
 async def read_root():
     """
     Endpoint que retorna mensagem de boas-vindas.
     """
-    return {"message": "Bem-vindo à Enciclopédia de Santos!"}
\ No newline at end of file
+    return {"message": "Bem-vindo à Enciclopédia de Santos!"}
@@ -1,11 +1,46 @@
-from sqlalchemy import Column, String, Integer, Date
+import unicodedata
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import Boolean, Column, DDL, Index, String, Integer, Date, event
+from sqlalchemy.orm import validates
 from app.db.database import Base
+
+
+def normalize_nome(nome: str) -> str:
+    """
+    Forma canônica de um nome para buscas: casefold Unicode, sem acentos e
+    com espaços colapsados. "São José" e "sao  jose" viram "sao jose".
+    """
+    decomposed = unicodedata.normalize("NFKD", nome.casefold())
+    sem_acentos = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(sem_acentos.split())
+
+
+def mes_dia(data: Optional[date]) -> Optional[int]:
+    """Dia do ano de uma data no formato MMDD (ex.: 4 de outubro -> 1004), sem o ano."""
+    return data.month * 100 + data.day if data is not None else None
+
+
+def derive_columns(santo_data: dict) -> dict:
+    """
+    Completa um dicionário de colunas com as colunas derivadas (nome normalizado,
+    mês/dia da festa). Usado nas escritas em lote, que não passam pelos validadores.
+    """
+    if "nome" in santo_data:
+        nome = santo_data["nome"]
+        santo_data["nome_normalizado"] = normalize_nome(nome) if nome is not None else None
+    if "festa_liturgica" in santo_data:
+        santo_data["festa_mes_dia"] = mes_dia(santo_data["festa_liturgica"])
+    return santo_data
+
+
 class Santos(Base):
 
     __tablename__ = "santos"
 
     id = Column("id", Integer,primary_key=True, autoincrement = True)
-    nome = Column("nome", String)
+    nome = Column("nome", String, index=True)
     protecao = Column("proteção", String)
     festa_liturgica = Column("festa litúrgica", Date)
     veneracao = Column("veneração", String)
@@ -14,6 +49,170 @@ class Santos(Base):
     data_de_morte = Column("data de morte", Date)
     historia = Column("historia", String)
     atribuicoes = Column("atribuições", String)
+    # Nome normalizado (ver normalize_nome), indexado para a busca por nome
+    nome_normalizado = Column("nome normalizado", String, index=True)
+    # Mês/dia da festa litúrgica (MMDD, ver mes_dia), indexado para o calendário
+    festa_mes_dia = Column("festa mês-dia", Integer, index=True)
+    # Versão do registro, usada nos ETags. Vem do contador de versões (ver
+    # SantosVersao), que só cresce: nem um delete seguido de create repete uma versão.
+    versao = Column("versão", Integer, nullable=False, server_default="1", index=True)
     # imagem = Column("imagem", )
 
-    # Sqlalchemy geralmente cuida do init
\ No newline at end of file
+    # Índices compostos dos filtros da listagem (ver saint_service.filter_clauses).
+    # Igualdade + (nome, id): o filtro e a ordenação/paginação por keyset saem do
+    # mesmo índice, sem ordenar o resultado. As datas de morte e de nascimento são
+    # range scans; com a veneração junto, o índice cobre também as facetas.
+    # AUTOINCREMENT: o id de um santo deletado nunca é reutilizado (os ETags usam o id)
+    __table_args__ = (
+        Index("ix_santos_veneracao_nome", "veneração", "nome", "id"),
+        Index("ix_santos_protecao_nome", "proteção", "nome", "id"),
+        Index("ix_santos_morte_veneracao", "data de morte", "veneração"),
+        Index("ix_santos_nascimento", "data de nascimento"),
+        {"sqlite_autoincrement": True},
+    )
+
+    @validates("nome")
+    def _sync_nome_normalizado(self, key, nome):
+        # Mantém a coluna normalizada em dia sempre que o nome é atribuído via ORM
+        self.nome_normalizado = normalize_nome(nome) if nome is not None else None
+        return nome
+
+    @validates("festa_liturgica")
+    def _sync_festa_mes_dia(self, key, festa_liturgica):
+        self.festa_mes_dia = mes_dia(festa_liturgica)
+        return festa_liturgica
+
+    # Sqlalchemy geralmente cuida do init
+
+# --- Busca textual (SQLite FTS5) ---
+# Tabela virtual que espelha as colunas de texto de 'santos' (external content),
+# mantida em sincronia por triggers. 'remove_diacritics 2' deixa a busca
+# insensível a acentos ("padroeiro" casa com "padroeiro", "sao" com "são").
+SANTOS_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS santos_fts USING fts5(
+        nome, "proteção", historia, "atribuições",
+        content='santos', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS santos_fts_ai AFTER INSERT ON santos BEGIN
+        INSERT INTO santos_fts(rowid, nome, "proteção", historia, "atribuições")
+        VALUES (new.id, new.nome, new."proteção", new.historia, new."atribuições");
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS santos_fts_ad AFTER DELETE ON santos BEGIN
+        INSERT INTO santos_fts(santos_fts, rowid, nome, "proteção", historia, "atribuições")
+        VALUES ('delete', old.id, old.nome, old."proteção", old.historia, old."atribuições");
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS santos_fts_au AFTER UPDATE OF nome, "proteção", historia, "atribuições" ON santos BEGIN
+        INSERT INTO santos_fts(santos_fts, rowid, nome, "proteção", historia, "atribuições")
+        VALUES ('delete', old.id, old.nome, old."proteção", old.historia, old."atribuições");
+        INSERT INTO santos_fts(rowid, nome, "proteção", historia, "atribuições")
+        VALUES (new.id, new.nome, new."proteção", new.historia, new."atribuições");
+    END
+    """,
+]
+
+for _ddl in SANTOS_FTS_DDL:
+    event.listen(Santos.__table__, "after_create", DDL(_ddl).execute_if(dialect="sqlite"))
+event.listen(
+    Santos.__table__, "before_drop", DDL("DROP TABLE IF EXISTS santos_fts").execute_if(dialect="sqlite")
+)
+
+
+# --- Contador de versões (ETags) ---
+class SantosVersao(Base):
+    """
+    Contador de versões dos santos, numa única linha. Cada insert, update ou delete
+    em 'santos' o incrementa (triggers, na mesma transação da escrita), então ele só
+    cresce: é a versão da coleção, e o próximo valor é a versão de cada escrita.
+    """
+    __tablename__ = "santos_versao"
+
+    id = Column("id", Integer, primary_key=True)
+    valor = Column("valor", Integer, nullable=False, default=0)
+
+
+SANTOS_VERSAO_DDL = [
+    "INSERT OR IGNORE INTO santos_versao (id, valor) VALUES (1, 0)",
+    """
+    CREATE TRIGGER IF NOT EXISTS santos_versao_ai AFTER INSERT ON santos BEGIN
+        UPDATE santos_versao SET valor = valor + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS santos_versao_au AFTER UPDATE ON santos BEGIN
+        UPDATE santos_versao SET valor = valor + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS santos_versao_ad AFTER DELETE ON santos BEGIN
+        UPDATE santos_versao SET valor = valor + 1;
+    END
+    """,
+]
+
+# Criados depois de todas as tabelas (os triggers ficam em 'santos' e escrevem em 'santos_versao')
+for _ddl in SANTOS_VERSAO_DDL:
+    event.listen(Base.metadata, "after_create", DDL(_ddl).execute_if(dialect="sqlite"))
+
+
+# --- Estatísticas do catálogo ---
+class SantosStats(Base):
+    """
+    Contagens agregadas dos santos por dimensão (veneração, século da morte, região de
+    nascimento, além do total), atualizadas incrementalmente a cada escrita: ler as
+    estatísticas não exige um GROUP BY na tabela inteira.
+    """
+    __tablename__ = "santos_stats"
+
+    dimensao = Column("dimensão", String, primary_key=True)
+    valor = Column("valor", String, primary_key=True)
+    total = Column("total", Integer, nullable=False, default=0)
+
+
+# --- Feed de alterações (sincronização incremental) ---
+class SantosChange(Base):
+    """
+    Última alteração de cada santo, numa sequência crescente ('seq'): o feed de
+    GET /santos/changes lista as alterações com seq maior que a última vista pelo
+    cliente. Uma linha por santo (a mais recente substitui as anteriores); santos
+    deletados ficam como lápides ('deleted').
+    Mantida por triggers em 'santos', na mesma transação de cada escrita.
+    """
+    __tablename__ = "santos_changes"
+    # AUTOINCREMENT: uma seq nunca é reutilizada, mesmo após substituir a linha
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    seq = Column("seq", Integer, primary_key=True, autoincrement=True)
+    santo_id = Column("santo_id", Integer, nullable=False, unique=True)
+    deleted = Column("deleted", Boolean, nullable=False, default=False)
+
+
+# INSERT OR REPLACE: a nova linha (com uma seq nova) substitui a alteração anterior do santo
+SANTOS_CHANGES_DDL = [
+    """
+    CREATE TRIGGER IF NOT EXISTS santos_changes_ai AFTER INSERT ON santos BEGIN
+        INSERT OR REPLACE INTO santos_changes(santo_id, deleted) VALUES (new.id, 0);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS santos_changes_au AFTER UPDATE ON santos BEGIN
+        INSERT OR REPLACE INTO santos_changes(santo_id, deleted) VALUES (new.id, 0);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS santos_changes_ad AFTER DELETE ON santos BEGIN
+        INSERT OR REPLACE INTO santos_changes(santo_id, deleted) VALUES (old.id, 1);
+    END
+    """,
+]
+
+# Criados depois de todas as tabelas (os triggers ficam em 'santos' e escrevem em 'santos_changes')
+for _ddl in SANTOS_CHANGES_DDL:
+    event.listen(Base.metadata, "after_create", DDL(_ddl).execute_if(dialect="sqlite"))
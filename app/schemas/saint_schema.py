@@ -1,6 +1,6 @@
 from datetime import date
 from pydantic import BaseModel, ConfigDict
-from typing import Optional
+from typing import Dict, List, Optional
 
 # Entrada e saída dos objetos que representarão o objeto santo
 
@@ -24,6 +24,8 @@ class SantosCreate(SantosBase):
 class Santos(SantosBase):
     # Adiciona o campo 'id' que não está no schema base
     id: int
+    # Versão do registro (muda a cada alteração); é a base do ETag
+    versao: int = 1
 
     # Agregação do pydantic ao sqlalchemy
     # No caso estamos convertendo o objeto retornado pelo sql a um dicionario tipo dados['chave']
@@ -42,4 +44,97 @@ class SantosUpdate(BaseModel):
     data_de_nascimento: Optional[date] = None
     data_de_morte: Optional[date] = None
     historia: Optional[str] = None
-    atribuicoes: Optional[str] = None
\ No newline at end of file
+    atribuicoes: Optional[str] = None
+
+
+class SantosSearchResult(BaseModel):
+    """
+    Resultado da busca textual: o santo encontrado, a relevância (bm25, menor é melhor)
+    e um trecho do texto com os termos encontrados destacados.
+    """
+    id: int
+    nome: str
+    score: float
+    snippet: str
+
+
+class SantosSuggestion(BaseModel):
+    """Sugestão de nome para o campo de busca (type-ahead)."""
+    id: int
+    nome: str
+
+
+class SantosImportError(BaseModel):
+    """Linha rejeitada numa importação em lote, com o motivo."""
+    line: int
+    error: str
+
+
+class SantosImportReport(BaseModel):
+    """Resumo de uma importação em lote: inseridos, rejeitados e os erros por linha."""
+    inserted: int = 0
+    failed: int = 0
+    errors: List[SantosImportError] = []
+
+
+
+class SantosBatchUpdateItem(SantosUpdate):
+    """Item de uma atualização em lote: o id do santo e os campos a alterar."""
+    id: int
+
+
+class SantosBatchDelete(BaseModel):
+    """Corpo da deleção em lote: os ids dos santos a remover."""
+    ids: List[int]
+
+
+class SantosBatchResult(BaseModel):
+    """Resultado de uma operação em lote: ids processados e ids que não existiam."""
+    affected: List[int]
+    missing: List[int]
+
+
+class SantosStats(BaseModel):
+    """Estatísticas do catálogo: total de santos e contagens por dimensão."""
+    total: int = 0
+    veneracao: Dict[str, int] = {}
+    seculo_morte: Dict[str, int] = {}
+    regiao_nascimento: Dict[str, int] = {}
+
+
+class SantosFilters(BaseModel):
+    """
+    Filtros da listagem de santos. Listas valem como "qualquer um destes valores";
+    as datas formam intervalos fechados (de/até, inclusive).
+    """
+    veneracao: Optional[List[str]] = None
+    protecao: Optional[List[str]] = None
+    morte_de: Optional[date] = None
+    morte_ate: Optional[date] = None
+    nascimento_de: Optional[date] = None
+    nascimento_ate: Optional[date] = None
+
+
+class SantosFacets(BaseModel):
+    """Contagens dos santos que atendem aos filtros, no total e por valor de cada faceta."""
+    total: int = 0
+    veneracao: Dict[str, int] = {}
+    protecao: Dict[str, int] = {}
+
+
+class SantosChange(BaseModel):
+    """
+    Uma alteração do feed: o santo criado/alterado (estado atual) ou, se 'deleted',
+    só o id do santo removido (lápide).
+    """
+    seq: int
+    id: int
+    deleted: bool = False
+    santo: Optional[Santos] = None
+
+
+class SantosChanges(BaseModel):
+    """Página do feed de alterações; a próxima começa em 'next_since'."""
+    changes: List[SantosChange] = []
+    next_since: int
+    has_more: bool = False
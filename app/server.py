@@ -0,0 +1,92 @@
+# app/server.py
+#
+# Servidor de produção: um supervisor (uvicorn) com N workers, um por núcleo.
+# Uso: python -m app.server
+#
+# Configuração por variáveis de ambiente (ver app/api/core/config.py):
+#   WEB_CONCURRENCY      número de workers (padrão: número de núcleos)
+#   HOST / PORT          endereço de escuta (padrão: 0.0.0.0:8000)
+#   MAX_REQUESTS         recicla cada worker após N requisições (0 = nunca)
+#   MAX_REQUESTS_JITTER  variação aleatória de MAX_REQUESTS, para os workers não
+#                        reiniciarem todos ao mesmo tempo
+#   GRACEFUL_TIMEOUT     segundos para terminar as requisições em andamento ao parar
+#   READ_DATABASE_URL    banco das leituras (GETs), ex.: uma cópia do arquivo num nó
+#                        só de leitura (padrão: o próprio DATABASE_URL, só leitura)
+#   DB_READ_POOL_SIZE    conexões do pool de leitura, independente do de escrita
+#   SNAPSHOT_DIR         diretório do snapshot estático do catálogo (GET /santos/snapshot)
+#
+# Sinais para o processo supervisor:
+#   SIGHUP          recarga graciosa: sobe workers novos (código e configuração
+#                   relidos) e encerra os antigos depois das requisições em andamento
+#   SIGTTIN/SIGTTOU adiciona/remove um worker
+#   SIGTERM/SIGINT  parada graciosa
+#
+# Os workers são processos novos (uvicorn usa 'spawn'), cada um com as próprias
+# engines; se o app for servido por um supervisor que usa fork, as conexões herdadas
+# são descartadas no filho (ver database.dispose_engines_after_fork).
+#
+# O estado em memória também é de cada worker:
+#   - cache de santos: só as escritas do próprio worker o invalidam; com vários
+#     workers, cada acerto é conferido com a versão no banco (SANTO_CACHE_VALIDATE=1);
+#   - cache de usuários autenticados: TTL curto com vários workers
+#     (PRINCIPAL_CACHE_TTL=5), limite de quanto um usuário alterado/deletado em outro
+#     worker continua aceito;
+#   - limites de tentativas (rate limit): cada worker conta as suas, então o limite
+#     efetivo chega a WEB_CONCURRENCY vezes o configurado;
+#   - /metrics: contadores e histogramas do worker que atendeu a requisição; some
+#     as séries dos workers (ou raspe cada um) para ter o total.
+# Os ETags, o cache de coleções e o snapshot usam o contador de versões do banco,
+# comum a todos os workers.
+
+import logging
+import os
+
+import uvicorn
+
+from app.api.core.config import settings
+from app.api.services import snapshot_service
+from app.db import database, schema
+
+logger = logging.getLogger("app")
+
+
+def hash_workers_per_process(workers: int) -> int:
+    """Processos de hashing por worker, para que o total não passe do número de núcleos."""
+    return max(1, (os.cpu_count() or 1) // max(1, workers))
+
+
+def main() -> None:
+    workers = max(1, settings.web_workers)
+
+    # Cria/atualiza o schema uma vez, no supervisor, antes de subir os workers:
+    # no lifespan de cada worker sobra só a verificação (barata) da versão.
+    schema.setup_database(database.engine)
+    # O snapshot do catálogo já fica pronto antes da primeira requisição (nos workers,
+    # a geração inicial só confere a versão)
+    if settings.snapshot_enabled:
+        snapshot_service.rebuild_snapshot()
+    database.engine.dispose()
+    database.read_engine.dispose()
+
+    # Os workers herdam o ambiente: divide os núcleos entre os pools de hashing
+    os.environ.setdefault("HASH_POOL_WORKERS", str(hash_workers_per_process(workers)))
+    if workers > 1:
+        # Caches de cada worker, sem invalidação entre eles (ver o cabeçalho)
+        os.environ.setdefault("SANTO_CACHE_VALIDATE", "1")
+        os.environ.setdefault("PRINCIPAL_CACHE_TTL", "5")
+
+    logger.info("Iniciando %d worker(s) em %s:%d", workers, settings.web_host, settings.web_port)
+    uvicorn.run(
+        "app.main:app",
+        host=settings.web_host,
+        port=settings.web_port,
+        workers=workers,
+        limit_max_requests=settings.web_max_requests or None,
+        limit_max_requests_jitter=settings.web_max_requests_jitter,
+        timeout_graceful_shutdown=settings.web_graceful_timeout,
+        proxy_headers=True,
+    )
+
+
+if __name__ == "__main__":
+    main()
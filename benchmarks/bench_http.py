@@ -0,0 +1,146 @@
+# benchmarks/bench_http.py
+#
+# Latência e vazão de ponta a ponta: requisições HTTP contra o app ASGI (em processo,
+# via httpx.ASGITransport), com N requisições simultâneas, sobre um banco sintético
+# gerado por benchmarks.datagen. Resultado (p50/p95/p99 e req/s por cenário) em JSON.
+# Uso: python -m benchmarks.bench_http [--size 1k] [--requests 2000] [--concurrency 32]
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Callable, Dict, List
+
+import httpx
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import Session
+
+from app.api import dependencies
+from app.api.core.config import settings
+from app.api.services import saint_service, snapshot_service
+from app.db import database
+from app.main import app
+
+from benchmarks import datagen
+from benchmarks.common import summarize, write_results
+
+
+def _scenarios(total: int, seed: int) -> Dict[str, Callable[[int], str]]:
+    """Cenários: cada um gera a URL da i-ésima requisição."""
+    rng = random.Random(seed)
+    ids = [rng.randint(1, total) for _ in range(1000)]
+    termos = ["milagres", "mosteiros", "martirizado", "doentes", "evangelho"]
+    termos_nome = ["s", "sao fr", "santa teres", "beato joao de", "fransisco"]
+    return {
+        "GET /santos/": lambda i: "/santos/?limit=100",
+        "GET /santos/snapshot": lambda i: "/santos/snapshot",
+        "GET /santos/?fields=id,nome": lambda i: "/santos/?limit=100&fields=id,nome",
+        "GET /santos/{id} (ids aleatórios)": lambda i: f"/santos/{ids[i % len(ids)]}",
+        "GET /santos/{id} (poucos ids, cache)": lambda i: f"/santos/{ids[i % 10]}",
+        "GET /santos/search": lambda i: f"/santos/search?q={termos[i % len(termos)]}",
+        "GET /santos/suggest": lambda i: f"/santos/suggest?q={termos_nome[i % len(termos_nome)]}",
+        "GET /santos/calendar": lambda i: f"/santos/calendar?from={1 + i % 12:02d}-01&to={1 + i % 12:02d}-07",
+    }
+
+
+async def _run_scenario(client, url_for: Callable[[int], str], requests: int, concurrency: int) -> dict:
+    """Dispara 'requests' requisições com no máximo 'concurrency' simultâneas."""
+    samples: List[float] = []
+    errors = 0
+    next_index = 0
+
+    async def worker():
+        nonlocal next_index, errors
+        while next_index < requests:
+            i = next_index
+            next_index += 1
+            started = time.perf_counter()
+            response = await client.get(url_for(i))
+            samples.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {**summarize(samples), "errors": errors, "requests_per_second": requests / elapsed}
+
+
+async def _run(args, path, total: int) -> dict:
+    # As rotas passam a usar o banco sintético (mesma engine/PRAGMAs da aplicação)
+    engine = database.create_async_db_engine(f"sqlite+aiosqlite:///{path}")
+    sessions = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    read_engine = database.create_async_db_engine(f"sqlite+aiosqlite:///{path}", read_only=True)
+    read_sessions = async_sessionmaker(bind=read_engine, autoflush=False, expire_on_commit=False)
+
+    async def get_benchmark_db():
+        async with sessions() as db:
+            yield db
+
+    async def get_benchmark_read_db():
+        async with read_sessions() as db:
+            yield db
+
+    app.dependency_overrides[dependencies.get_async_db] = get_benchmark_db
+    app.dependency_overrides[dependencies.get_read_db] = get_benchmark_read_db
+    # O índice de sugestões vem do banco sintético (sem a sincronização periódica com o banco da app)
+    settings.suggest_refresh_seconds = 0
+    # O snapshot também é gerado do banco sintético, uma vez, num diretório próprio
+    settings.snapshot_enabled = False
+    settings.snapshot_dir = str(path.parent / f"{path.stem}-snapshot")
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with app.router.lifespan_context(app):
+            sync_engine = database.create_db_engine(f"sqlite:///{path}")
+            with Session(sync_engine) as db:
+                saint_service.load_name_index(db)
+                snapshot_service.build_snapshot(db)
+            sync_engine.dispose()
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                for name, url_for in _scenarios(total, args.seed).items():
+                    if args.only and args.only not in name:
+                        continue
+                    # Aquecimento (conexões do pool, caches do SQLite)
+                    await _run_scenario(client, url_for, min(50, args.requests), args.concurrency)
+                    results[name] = await _run_scenario(client, url_for, args.requests, args.concurrency)
+    finally:
+        app.dependency_overrides.clear()
+        await engine.dispose()
+        await read_engine.dispose()
+    return results
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(description="Benchmark de ponta a ponta do app ASGI.")
+    parser.add_argument("--size", default="1k", help="1k, 100k, 1m ou um número de linhas")
+    parser.add_argument("--seed", type=int, default=datagen.DEFAULT_SEED)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--only", default=None, help="Roda só os cenários cujo nome contém este texto")
+    parser.add_argument("--output", default=None, help="Arquivo JSON de saída")
+    args = parser.parse_args(argv)
+
+    path = datagen.ensure_dataset(args.size, args.seed)
+    total = datagen.parse_size(args.size)
+
+    results = asyncio.run(_run(args, path, total))
+    output = write_results(
+        "http",
+        {
+            "dataset": {"size": args.size, "seed": args.seed, "santos": total},
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "fast_json": settings.fast_json,
+            "results": results,
+        },
+        args.output,
+    )
+    print(json.dumps(results, indent=2))
+    print(f"Resultados gravados em {output}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
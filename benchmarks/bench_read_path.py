@@ -0,0 +1,119 @@
+# benchmarks/bench_read_path.py
+#
+# Compara o custo por linha das leituras de santos:
+#   - ORM: db.query(Santos) (instâncias do modelo no identity map) convertidas no schema
+#     Santos, como era o caminho de leitura antes;
+#   - Core: saint_service.get_all_santos / get_santo_by_id_or_name (statements select()
+#     montados uma vez, Rows fora da sessão) convertidas em dicionários.
+# Mede o tempo por linha (melhor de N) e o pico de memória alocada por chamada
+# (tracemalloc), sobre um banco sintético gerado por benchmarks.datagen.
+# Uso: python -m benchmarks.bench_read_path [--size 100k] [--repeat 20]
+
+import argparse
+import json
+import random
+import time
+import tracemalloc
+from typing import Callable, Dict
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.api.services import saint_service
+from app.db import database
+from app.models import saint_model
+from app.schemas import saint_schema
+
+from benchmarks import datagen
+from benchmarks.common import write_results
+
+
+def orm_page(db: Session, limit: int):
+    Santos = saint_model.Santos
+    rows = db.query(Santos).order_by(Santos.nome, Santos.id).limit(limit).all()
+    return [saint_schema.Santos.model_validate(row) for row in rows]
+
+
+def core_page(db: Session, limit: int):
+    return [saint_service.santo_as_dict(row) for row in saint_service.get_all_santos(db, limit=limit)]
+
+
+def orm_lookup(db: Session, santo_id: int):
+    santo = db.query(saint_model.Santos).filter(saint_model.Santos.id == santo_id).first()
+    return saint_schema.Santos.model_validate(santo)
+
+
+def core_lookup(db: Session, santo_id: int):
+    return saint_service.santo_as_dict(saint_service.get_santo_by_id_or_name(db, str(santo_id)))
+
+
+def _measure(db: Session, fn: Callable[[int], object], rows: int, repeat: int) -> Dict[str, float]:
+    """Melhor tempo por linha e pico de memória de uma chamada (sessão limpa a cada chamada)."""
+    fn(0)
+    db.expunge_all()
+    best = float("inf")
+    for i in range(repeat):
+        started = time.perf_counter()
+        fn(i)
+        best = min(best, time.perf_counter() - started)
+        db.expunge_all()
+
+    tracemalloc.start()
+    fn(repeat)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    db.expunge_all()
+    return {
+        "us_per_row": best / rows * 1e6,
+        "ms_per_call": best * 1000,
+        "peak_kib_per_call": peak / 1024,
+        "peak_bytes_per_row": peak / rows,
+    }
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(description="Custo por linha das leituras: ORM x Core.")
+    parser.add_argument("--size", default="1k", help="1k, 100k, 1m ou um número de linhas")
+    parser.add_argument("--seed", type=int, default=datagen.DEFAULT_SEED)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", default=None, help="Arquivo JSON de saída")
+    args = parser.parse_args(argv)
+
+    path = datagen.ensure_dataset(args.size, args.seed)
+    engine = database.create_db_engine(f"sqlite:///{path}", read_only=True)
+    db = Session(bind=engine, autoflush=False)
+    results = {}
+    try:
+        total = db.query(func.count(saint_model.Santos.id)).scalar()
+        rng = random.Random(args.seed)
+        ids = [rng.randint(1, total) for _ in range(args.repeat + 1)]
+        cases = {
+            "list_100": (100, lambda i: orm_page(db, 100), lambda i: core_page(db, 100)),
+            "list_1000": (1000, lambda i: orm_page(db, 1000), lambda i: core_page(db, 1000)),
+            "lookup_id": (1, lambda i: orm_lookup(db, ids[i]), lambda i: core_lookup(db, ids[i])),
+        }
+        for name, (rows, orm, core) in cases.items():
+            orm_result = _measure(db, orm, rows, args.repeat)
+            core_result = _measure(db, core, rows, args.repeat)
+            results[name] = {
+                "orm": orm_result,
+                "core": core_result,
+                "speedup": orm_result["us_per_row"] / core_result["us_per_row"],
+                "memory_ratio": orm_result["peak_kib_per_call"] / core_result["peak_kib_per_call"],
+            }
+    finally:
+        db.close()
+        engine.dispose()
+
+    output = write_results(
+        "read_path",
+        {"dataset": {"size": args.size, "seed": args.seed}, "repeat": args.repeat, "results": results},
+        args.output,
+    )
+    print(json.dumps(results, indent=2))
+    print(f"Resultados gravados em {output}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# benchmarks/bench_serialization.py
+#
+# Compara o custo por linha de serializar santos:
+#   - caminho padrão: revalida cada linha no schema Santos (response_model) e usa o json da stdlib;
+#   - caminho rápido: dicionário direto das colunas + orjson (FastJSONResponse).
+# Uso: python -m benchmarks.bench_serialization [--rows 10000] [--repeat 5]
+
+import argparse
+import json
+import time
+from datetime import date
+
+from fastapi.encoders import jsonable_encoder
+
+from app.api.core.responses import FastJSONResponse
+from app.api.services import saint_service
+from app.models.saint_model import Santos
+from app.schemas import saint_schema
+
+
+def make_rows(n: int):
+    """Objetos Santos transitórios (sem banco), com textos de tamanho realista."""
+    historia = "Viveu em oração e caridade, fundou mosteiros e converteu multidões. " * 20
+    return [
+        Santos(
+            id=i, nome=f"São Exemplo {i}", protecao="Padroeiro dos marinheiros",
+            festa_liturgica=date(2025, 1 + i % 12, 1 + i % 28), veneracao="Igreja Católica",
+            local_de_nascimento="Assis, Itália", data_de_nascimento=date(1182, 1, 1),
+            data_de_morte=date(1226, 10, 3), historia=historia, atribuicoes="Cálice, Corvo", versao=1,
+        )
+        for i in range(n)
+    ]
+
+
+def default_path(rows) -> bytes:
+    validated = [saint_schema.Santos.model_validate(row) for row in rows]
+    return json.dumps(jsonable_encoder(validated), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def fast_path(rows) -> bytes:
+    return FastJSONResponse([saint_service.santo_as_dict(row) for row in rows]).body
+
+
+def best_of(fn, rows, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(rows)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    rows = make_rows(args.rows)
+    assert json.loads(default_path(rows[:10])) == json.loads(fast_path(rows[:10]))
+
+    default_s = best_of(default_path, rows, args.repeat)
+    fast_s = best_of(fast_path, rows, args.repeat)
+    result = {
+        "rows": args.rows,
+        "default_us_per_row": default_s / args.rows * 1e6,
+        "fast_us_per_row": fast_s / args.rows * 1e6,
+        "speedup": default_s / fast_s,
+    }
+    print(json.dumps(result, indent=2))
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# benchmarks/bench_services.py
+#
+# Microbenchmarks das funções de service (saint_service, user_service) sobre um banco
+# sintético gerado por benchmarks.datagen. Cada caso é medido chamada a chamada e o
+# resultado (p50/p95/p99 por caso) vai para um JSON em benchmarks/results/.
+# Uso: python -m benchmarks.bench_services [--size 1k] [--iterations 200] [--only search]
+#
+# Os casos de escrita fazem commit: criam, alteram e apagam os próprios registros,
+# deixando o conjunto de dados como estava.
+
+import argparse
+import json
+import random
+from typing import Callable, Dict, List, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.api.core.pagination import decode_cursor, encode_cursor
+from app.api.services import saint_service, user_service
+from app.db import database
+from app.models import saint_model, user_model
+from app.schemas import saint_schema, user_schema
+
+from benchmarks import datagen
+from benchmarks.common import measure, summarize, write_results
+
+
+def _cases(db: Session, seed: int) -> Tuple[Dict[str, Callable[[int], object]], Dict[str, int]]:
+    """Casos de benchmark: cada um recebe o número da iteração e faz uma chamada de service."""
+    total = db.query(func.count(saint_model.Santos.id)).scalar()
+    users = db.query(func.count(user_model.User.id)).scalar()
+    rng = random.Random(seed)
+    ids = [rng.randint(1, total) for _ in range(1000)]
+    nomes = [nome for (nome,) in db.query(saint_model.Santos.nome).filter(saint_model.Santos.id.in_(ids[:100]))]
+    usernames = [u for (u,) in db.query(user_model.User.username).filter(user_model.User.id.in_(ids[:100]))] or ["-"]
+    middle = db.query(saint_model.Santos).order_by(saint_model.Santos.nome).offset(total // 2).first()
+    middle_cursor = decode_cursor(encode_cursor(middle.nome, middle.id))
+    termos = ["milagres", "mosteiros", "martirizado", "doentes", "evangelho", "teólogos"]
+    novo = saint_schema.SantosCreate(**next(datagen.generate_santos(1, seed + 99)))
+    created: List[int] = []
+
+    def pick(i: int) -> int:
+        return ids[i % len(ids)]
+
+    def create(i: int):
+        santo = saint_service.create_santo(db, novo.model_copy(update={"nome": f"Benchmark {i}"}))
+        created.append(santo.id)
+
+    # update e delete usam os santos criados pelo caso create (que roda antes deles)
+    def update(i: int):
+        if not created:
+            create(i)
+        saint_service.update_santo(db, created[i % len(created)], saint_schema.SantosUpdate(protecao=f"Benchmark {i}"))
+
+    def delete(i: int):
+        if not created:
+            create(i)
+        saint_service.delete_santo(db, created.pop())
+
+    def create_and_delete_user(i: int):
+        user = user_service.create_user(
+            db,
+            user_schema.UserCreate(username=f"bench{i}", email=f"bench{i}@exemplo.com", password="x"),
+            hashed_password=datagen.BENCHMARK_PASSWORD_HASH,
+        )
+        user_service.delete_user(db, user.id)
+
+    cases = {
+        "saint.get_all_santos.first_page": lambda i: saint_service.get_all_santos(db, limit=100),
+        "saint.get_all_santos.middle_page": lambda i: saint_service.get_all_santos(db, limit=100, after=middle_cursor),
+        "saint.get_all_santos.fields_id_nome": lambda i: saint_service.get_all_santos(db, limit=100, fields=("id", "nome")),
+        "saint.get_santo_by_id_or_name.id": lambda i: saint_service.get_santo_by_id_or_name(db, str(pick(i))),
+        "saint.get_santo_by_id_or_name.nome": lambda i: saint_service.get_santo_by_id_or_name(db, nomes[i % len(nomes)].lower()),
+        "saint.get_santo_cached": lambda i: saint_service.get_santo_cached(db, str(pick(i % 10))),
+        "saint.get_santo_version": lambda i: saint_service.get_santo_version(db, str(pick(i))),
+        "saint.get_collection_version": lambda i: saint_service.get_collection_version(db),
+        "saint.search_santos": lambda i: saint_service.search_santos(db, termos[i % len(termos)], limit=20),
+        "saint.get_santos_calendar.month": lambda i: saint_service.get_santos_calendar(db, 101 + (i % 12) * 100, 131 + (i % 12) * 100),
+        "saint.iter_santos_batches.first": lambda i: next(saint_service.iter_santos_batches(db, batch_size=500)),
+        "saint.create_santo": create,
+        "saint.update_santo": update,
+        "saint.delete_santo": delete,
+        "user.get_user_by_username": lambda i: user_service.get_user_by_username(db, usernames[i % len(usernames)]),
+        "user.get_user_by_email": lambda i: user_service.get_user_by_email(db, f"{usernames[i % len(usernames)]}@exemplo.com"),
+        "user.create_and_delete_user": create_and_delete_user,
+    }
+    return cases, {"santos": total, "users": users}
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(description="Microbenchmarks dos services.")
+    parser.add_argument("--size", default="1k", help="1k, 100k, 1m ou um número de linhas")
+    parser.add_argument("--seed", type=int, default=datagen.DEFAULT_SEED)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--only", default=None, help="Roda só os casos cujo nome contém este texto")
+    parser.add_argument("--output", default=None, help="Arquivo JSON de saída")
+    args = parser.parse_args(argv)
+
+    path = datagen.ensure_dataset(args.size, args.seed)
+    engine = database.create_db_engine(f"sqlite:///{path}")
+    session = Session(bind=engine, autoflush=False)
+    saint_service.santo_cache.clear()
+
+    results = {}
+    try:
+        cases, rows = _cases(session, args.seed)
+        for name, fn in cases.items():
+            if args.only and args.only not in name:
+                continue
+            results[name] = summarize(measure(fn, args.iterations, args.warmup))
+            session.expunge_all()
+    finally:
+        session.close()
+        engine.dispose()
+
+    output = write_results(
+        "services",
+        {"dataset": {"size": args.size, "seed": args.seed, **rows}, "iterations": args.iterations, "results": results},
+        args.output,
+    )
+    print(json.dumps(results, indent=2))
+    print(f"Resultados gravados em {output}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# benchmarks/bench_startup.py
+#
+# Tempo de inicialização (cold start) de um worker: cada execução sobe um processo Python
+# novo que importa app.main, roda o lifespan e atende a primeira requisição.
+# A primeira execução usa um banco vazio (cria o schema); as demais, o banco já pronto
+# (só a verificação de versão), como num worker reiniciado pelo autoscaling.
+# Uso: python -m benchmarks.bench_startup [--runs 10]
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.common import summarize, write_results
+
+# Executado em cada processo filho; imprime os tempos (em segundos) como JSON
+_CHILD = """
+import time
+started = time.perf_counter()
+import asyncio, json, sys
+from app.main import app
+imported = time.perf_counter()
+auth_modules = [m for m in ("jose", "passlib", "bcrypt") if m in sys.modules]
+import httpx
+
+async def first_request():
+    async with app.router.lifespan_context(app):
+        ready = time.perf_counter()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            response = await client.get("/santos/?limit=1")
+        return ready, time.perf_counter(), response.status_code
+
+ready, answered, status = asyncio.run(first_request())
+print(json.dumps({
+    "import": imported - started,
+    "ready": ready - started,
+    "first_response": answered - started,
+    "status": status,
+    "auth_modules_loaded": auth_modules,
+}))
+"""
+
+
+def _run_child(database_url: str, snapshot_dir: str) -> dict:
+    env = {**os.environ, "DATABASE_URL": database_url, "SNAPSHOT_DIR": snapshot_dir}
+    env.pop("ASYNC_DATABASE_URL", None)
+    started = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", _CHILD], env=env, check=True, capture_output=True, text=True,
+        cwd=Path(__file__).resolve().parent.parent,
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    # Inclui a subida do interpretador
+    result["process"] = time.perf_counter() - started
+    return result
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(description="Mede o cold start de um worker.")
+    parser.add_argument("--runs", type=int, default=10, help="Reinícios com o banco já pronto")
+    parser.add_argument("--output", default=None, help="Arquivo JSON de saída")
+    args = parser.parse_args(argv)
+
+    phases = ("import", "ready", "first_response", "process")
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{Path(tmp) / 'startup.db'}"
+        snapshot_dir = str(Path(tmp) / "snapshot")
+        first = _run_child(url, snapshot_dir)
+        restarts = [_run_child(url, snapshot_dir) for _ in range(args.runs)]
+
+    results = {
+        "first_start_ms": {phase: first[phase] * 1000 for phase in phases},
+        "restart": {phase: summarize([run[phase] for run in restarts]) for phase in phases},
+        "auth_modules_loaded_at_import": first["auth_modules_loaded"],
+    }
+    output = write_results("startup", {"runs": args.runs, "results": results}, args.output)
+    print(json.dumps(results, indent=2))
+    print(f"Resultados gravados em {output}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# benchmarks/common.py
+#
+# Utilitários compartilhados pelos benchmarks: medição, percentis e saída em JSON.
+
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Diretório padrão dos resultados (JSON) e dos bancos gerados
+RESULTS_DIR = Path(__file__).parent / "results"
+DATA_DIR = Path(__file__).parent / "data"
+
+
+def percentile(sorted_samples: List[float], pct: float) -> float:
+    """Percentil por interpolação linear entre as amostras (já ordenadas)."""
+    if not sorted_samples:
+        return 0.0
+    position = (len(sorted_samples) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_samples) - 1)
+    return sorted_samples[lower] + (sorted_samples[upper] - sorted_samples[lower]) * (position - lower)
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Resumo de latências (amostras em segundos; resultado em milissegundos)."""
+    ordered = sorted(samples)
+    to_ms = 1000.0
+    return {
+        "n": len(ordered),
+        "min_ms": ordered[0] * to_ms if ordered else 0.0,
+        "mean_ms": statistics.fmean(ordered) * to_ms if ordered else 0.0,
+        "p50_ms": percentile(ordered, 50) * to_ms,
+        "p95_ms": percentile(ordered, 95) * to_ms,
+        "p99_ms": percentile(ordered, 99) * to_ms,
+        "max_ms": ordered[-1] * to_ms if ordered else 0.0,
+    }
+
+
+def measure(fn: Callable[[int], object], iterations: int, warmup: int = 10) -> List[float]:
+    """Executa fn(i) 'warmup' vezes sem medir e depois 'iterations' vezes, medindo cada chamada."""
+    for i in range(warmup):
+        fn(i)
+    samples = []
+    for i in range(iterations):
+        started = time.perf_counter()
+        fn(i)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def environment() -> Dict[str, str]:
+    """Dados do ambiente, para comparar execuções feitas em máquinas diferentes."""
+    return {
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "cpus": str(os.cpu_count()),
+    }
+
+
+def write_results(name: str, results: dict, output: Optional[str] = None) -> Path:
+    """
+    Grava os resultados em JSON (padrão: benchmarks/results/<nome>-<timestamp>.json)
+    e retorna o caminho do arquivo.
+    """
+    now = datetime.now(timezone.utc)
+    path = Path(output) if output else RESULTS_DIR / f"{name}-{now.strftime('%Y%m%dT%H%M%SZ')}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"benchmark": name, "timestamp": now.isoformat(), "environment": environment(), **results}
+    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    return path
@@ -0,0 +1,172 @@
+# benchmarks/datagen.py
+#
+# Gerador determinístico de dados sintéticos (Santos e usuários) para os benchmarks.
+# A mesma semente gera sempre o mesmo banco, então execuções diferentes são comparáveis.
+# Uso: python -m benchmarks.datagen --size 100k [--seed 42] [--output benchmarks/data/santos-100k.db]
+
+import argparse
+import random
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.api.services import stats_service
+from app.db import database, schema
+from app.models import saint_model, user_model
+
+from benchmarks.common import DATA_DIR
+
+# Tamanhos pré-definidos dos conjuntos de dados
+SIZES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+DEFAULT_SEED = 42
+INSERT_BATCH_SIZE = 5_000
+# Hash bcrypt fixo de "senha-benchmark": gerar um hash por usuário levaria horas
+BENCHMARK_PASSWORD = "senha-benchmark"
+BENCHMARK_PASSWORD_HASH = "$2b$12$/TnJtkFHNGiMvqeo2vi41ewmr6ywdarvSKXQ8yjlwCDHCHfzIkvta"
+
+TITULOS = ["São", "Santa", "Santo", "Beato", "Beata", "Bem-aventurado"]
+NOMES = [
+    "Francisco", "Clara", "Antônio", "Teresa", "José", "Maria", "João", "Luzia", "Bento", "Rita",
+    "Jorge", "Inês", "Pedro", "Catarina", "Agostinho", "Mônica", "Tomás", "Cecília", "Domingos", "Ágata",
+]
+CIDADES = [
+    ("Assis", "Itália"), ("Ávila", "Espanha"), ("Lisboa", "Portugal"), ("Siena", "Itália"),
+    ("Hipona", "Argélia"), ("Núrsia", "Itália"), ("Cássia", "Itália"), ("Capadócia", "Turquia"),
+    ("Lima", "Peru"), ("Aquino", "Itália"), ("Lisieux", "França"), ("Anchieta", "Brasil"),
+]
+VENERACOES = ["Igreja Católica", "Igreja Ortodoxa", "Igreja Anglicana", "Igreja Luterana"]
+PROTECOES = [
+    "Animais e Natureza", "Soldados", "Marinheiros", "Estudantes", "Doentes", "Causas impossíveis",
+    "Viajantes", "Músicos", "Agricultores", "Médicos", "Professores", "Famílias",
+]
+ATRIBUICOES = ["Pássaros", "Lobo", "Lírio", "Chaves", "Espada", "Cálice", "Livro", "Rosa", "Corvo", "Cruz"]
+FRASES = [
+    "Viveu em oração e penitência durante muitos anos.",
+    "Fundou mosteiros e hospitais para os pobres.",
+    "Pregou o Evangelho em terras distantes.",
+    "Foi martirizado por não renunciar à sua fé.",
+    "Seus escritos influenciaram gerações de teólogos.",
+    "Dedicou a vida ao cuidado dos doentes e abandonados.",
+    "Relatam-se muitos milagres atribuídos à sua intercessão.",
+    "Renunciou à herança da família para seguir a vida religiosa.",
+]
+
+
+def generate_santos(n: int, seed: int = DEFAULT_SEED) -> Iterator[Dict]:
+    """Gera 'n' santos (dicionários no formato do modelo), sempre na mesma ordem para a mesma semente."""
+    rng = random.Random(seed)
+    for i in range(1, n + 1):
+        cidade, pais = rng.choice(CIDADES)
+        morte = date(rng.randint(100, 1950), rng.randint(1, 12), rng.randint(1, 28))
+        nascimento = morte - timedelta(days=rng.randint(20 * 365, 90 * 365))
+        yield {
+            # O número garante nomes únicos (as buscas por nome do benchmark dependem disso)
+            "nome": f"{rng.choice(TITULOS)} {rng.choice(NOMES)} de {cidade} {i}",
+            "protecao": ", ".join(rng.sample(PROTECOES, rng.randint(1, 3))),
+            "festa_liturgica": date(2025, rng.randint(1, 12), rng.randint(1, 28)),
+            "veneracao": rng.choice(VENERACOES),
+            "local_de_nascimento": f"{cidade}, {pais}",
+            "data_de_nascimento": nascimento,
+            "data_de_morte": morte,
+            "historia": " ".join(rng.choice(FRASES) for _ in range(rng.randint(3, 30))),
+            "atribuicoes": ", ".join(rng.sample(ATRIBUICOES, rng.randint(1, 4))),
+        }
+
+
+def generate_users(n: int, seed: int = DEFAULT_SEED) -> Iterator[Dict]:
+    """Gera 'n' usuários; todos têm a senha BENCHMARK_PASSWORD."""
+    rng = random.Random(seed + 1)
+    for i in range(1, n + 1):
+        nome = saint_model.normalize_nome(rng.choice(NOMES))
+        yield {
+            "username": f"{nome}{i:07d}",
+            "email": f"{nome}{i:07d}@exemplo.com",
+            "hashed_password": BENCHMARK_PASSWORD_HASH,
+        }
+
+
+def _batches(rows: Iterator[Dict], size: int) -> Iterator[List[Dict]]:
+    batch: List[Dict] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def parse_size(size: str) -> int:
+    """Aceita os nomes pré-definidos (1k, 100k, 1m) ou um número de linhas."""
+    return SIZES[size.lower()] if size.lower() in SIZES else int(size)
+
+
+def dataset_path(size: str, seed: int = DEFAULT_SEED) -> Path:
+    return DATA_DIR / f"santos-{size.lower()}-seed{seed}.db"
+
+
+def seed_database(path: Path, santos: int, users: int, seed: int = DEFAULT_SEED) -> Path:
+    """
+    Cria (do zero) um banco SQLite em 'path' com o schema da aplicação e os dados gerados.
+    Os inserts vão em lotes, com as colunas derivadas calculadas como no import em lote.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{path}{suffix}").unlink(missing_ok=True)
+
+    engine = database.create_db_engine(f"sqlite:///{path}")
+    schema.setup_database(engine)
+
+    # Insert em lote do ORM: as chaves são os atributos do modelo (as colunas têm nomes acentuados)
+    with Session(engine) as db:
+        for batch in _batches(generate_santos(santos, seed), INSERT_BATCH_SIZE):
+            db.execute(insert(saint_model.Santos), [saint_model.derive_columns(row) for row in batch])
+        for batch in _batches(generate_users(users, seed), INSERT_BATCH_SIZE):
+            db.execute(insert(user_model.User), batch)
+        db.commit()
+        # O insert direto não passa pelos services: as estatísticas são recalculadas no fim
+        stats_service.rebuild_stats(db)
+    with engine.connect() as conn:
+        conn.exec_driver_sql("ANALYZE")
+    engine.dispose()
+    return path
+
+
+def ensure_dataset(size: str, seed: int = DEFAULT_SEED, users: Optional[int] = None) -> Path:
+    """
+    Caminho do banco do tamanho pedido, gerando-o se ainda não existir. Um banco gerado
+    por uma versão anterior passa pelo mesmo upgrade de schema da aplicação.
+    """
+    path = dataset_path(size, seed)
+    if not path.exists():
+        rows = parse_size(size)
+        seed_database(path, santos=rows, users=users if users is not None else rows, seed=seed)
+    else:
+        engine = database.create_db_engine(f"sqlite:///{path}")
+        schema.setup_database(engine)
+        engine.dispose()
+    return path
+
+
+def main(argv=None) -> Path:
+    parser = argparse.ArgumentParser(description="Gera um banco sintético para os benchmarks.")
+    parser.add_argument("--size", default="1k", help="1k, 100k, 1m ou um número de linhas")
+    parser.add_argument("--users", type=int, default=None, help="Número de usuários (padrão: igual a --size)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args(argv)
+
+    rows = parse_size(args.size)
+    path = Path(args.output) if args.output else dataset_path(args.size, args.seed)
+    started = time.perf_counter()
+    seed_database(path, santos=rows, users=args.users if args.users is not None else rows, seed=args.seed)
+    print(f"{rows} santos gerados em {path} ({time.perf_counter() - started:.1f}s)")
+    return path
+
+
+if __name__ == "__main__":
+    main()
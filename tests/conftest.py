@@ -1,5 +1,7 @@
 # tests/conftest.py
 
+from contextlib import contextmanager
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
@@ -8,7 +10,13 @@ from sqlalchemy.pool import StaticPool
 
 from app.main import app
 from app.db.database import Base, get_db
+from app.api import dependencies
 from app.models import saint_model, user_model 
+from app.api.services import saint_service
+from app.api.core.cache import principal_cache
+from app.api.core.compression import collection_cache
+from app.api.core.rate_limit import reset_rate_limits
+from app.api.core.sql_tracker import instrument_engine, watch_requests
 
 # --- Configuração do Banco de Dados de Teste em Memória ---
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
@@ -18,6 +26,8 @@ engine = create_engine(
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
+# Mesma medição de SQL das engines da aplicação (para assert_max_queries)
+instrument_engine(engine)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -31,6 +41,13 @@ def db_session():
     """
     # Cria todas as tabelas ANTES de cada teste
     Base.metadata.create_all(bind=engine)
+    # Caches em memória não podem vazar entre testes (os ids se repetem)
+    saint_service.santo_cache.clear()
+    saint_service.name_index.clear()
+    principal_cache.clear()
+    collection_cache.clear()
+    # Os limites de tentativas também (todas as requisições dos testes vêm do mesmo "IP")
+    reset_rate_limits()
     db = TestingSessionLocal()
     try:
         # Fornece a sessão para o teste
@@ -50,5 +67,30 @@ def client(db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    # As rotas usam as dependências de app/api/dependencies.py. A versão assíncrona
+    # e a só de leitura também recebem a sessão síncrona: os services aceitam os dois tipos.
+    app.dependency_overrides[dependencies.get_db] = override_get_db
+    app.dependency_overrides[dependencies.get_async_db] = override_get_db
+    app.dependency_overrides[dependencies.get_read_db] = override_get_db
     yield TestClient(app)
-    app.dependency_overrides.clear()
\ No newline at end of file
+    app.dependency_overrides.clear()
+
+@pytest.fixture
+def assert_max_queries():
+    """
+    Garante que cada requisição feita dentro do bloco execute no máximo 'n' comandos SQL:
+
+        with assert_max_queries(2):
+            client.get("/santos/1")
+    """
+    @contextmanager
+    def check(n: int):
+        with watch_requests() as finished:
+            yield finished
+        for queries in finished:
+            statements = "\n".join(record.statement for record in queries.statements)
+            assert queries.count <= n, (
+                f"{queries.route} executou {queries.count} comandos SQL (máximo: {n}):\n{statements}"
+            )
+
+    return check
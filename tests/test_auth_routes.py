@@ -91,4 +91,73 @@ def test_update_other_user_forbidden(client):
     
     # 4. Verificação
     assert response.status_code == 403
-    #assert response.status_code == 200
\ No newline at end of file
+    #assert response.status_code == 200
+
+
+def test_hash_stats_after_login(client):
+    """Testa se o cadastro e o login passam pelo pool de hashing e aparecem nas métricas."""
+    from app.api.core.security import hashing_pool
+
+    before = hashing_pool.stats()["completed"]
+
+    user_data = {"username": "hashuser", "email": "hash@test.com", "password": "pwd"}
+    client.post("/users/", json=user_data)
+    client.post("/token", data={"username": "hashuser", "password": "pwd"})
+
+    stats = hashing_pool.stats()
+    assert stats["completed"] == before + 2
+    assert stats["queued"] == 0 and stats["running"] == 0
+    assert stats["max_seconds"] > 0
+
+
+def test_principal_cache_invalidated_on_update(client):
+    """Testa se o cache de usuários autenticados é invalidado quando o usuário muda."""
+    user_data = {"username": "cached_user", "email": "cached@test.com", "password": "pwd"}
+    user_id = client.post("/users/", json=user_data).json()["id"]
+    token = client.post("/token", data={"username": "cached_user", "password": "pwd"}).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    # Duas requisições com o mesmo token: a segunda é servida pelo cache
+    assert client.patch(f"/users/{user_id}", json={"email": "c1@test.com"}, headers=headers).status_code == 200
+    # O username mudou: o token antigo (sub = cached_user) não pode mais ser aceito
+    assert client.patch(f"/users/{user_id}", json={"username": "renamed"}, headers=headers).status_code == 200
+    response = client.patch(f"/users/{user_id}", json={"email": "c2@test.com"}, headers=headers)
+    assert response.status_code == 401
+
+
+def test_login_throttled_before_db_and_hash(client, assert_max_queries):
+    """Testa o limite de tentativas de login: a tentativa além do limite recebe 429 sem tocar no banco."""
+    from app.api.core.config import settings
+
+    limite, _ = settings.login_rate_limit_username
+    for _ in range(limite):
+        response = client.post("/token", data={"username": "Alvo", "password": "errada"})
+        assert response.status_code == 401
+
+    with assert_max_queries(0):
+        response = client.post("/token", data={"username": " alvo ", "password": "errada"})
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+
+    # Outro usuário, mesmo IP: ainda dentro do limite por IP
+    assert client.post("/token", data={"username": "outro", "password": "x"}).status_code == 401
+
+
+def test_token_bucket_refill_and_sweep():
+    """Testa o token bucket: reabastece com o tempo e descarta buckets ociosos."""
+    from app.api.core.rate_limit import TokenBucketLimiter
+
+    agora = [0.0]
+    limiter = TokenBucketLimiter(capacity=2, period=10, max_keys=3, clock=lambda: agora[0])
+    assert limiter.hit("a") == 0 and limiter.hit("a") == 0
+    assert limiter.hit("a") == 5.0  # uma ficha a cada 5 segundos
+
+    agora[0] = 5.0
+    assert limiter.hit("a") == 0
+    for chave in ("b", "c", "d", "e"):
+        limiter.hit(chave)
+    assert len(limiter) <= 4
+
+    agora[0] = 100.0
+    limiter.hit("f")
+    assert len(limiter) == 1
@@ -0,0 +1,120 @@
+# tests/test_compression.py
+
+import gzip
+import json
+
+import pytest
+
+from app.api.core import compression
+from tests.test_santos_routes import santo_data_exemplo
+
+
+def _criar_santos(client, n: int) -> None:
+    linhas = "\n".join(
+        json.dumps({**santo_data_exemplo, "nome": f"Santo {i}", "historia": "Viveu em oração e penitência. " * 20})
+        for i in range(n)
+    )
+    client.post("/santos/import", files={"file": ("s.jsonl", linhas.encode("utf-8"), "application/x-ndjson")})
+
+
+def test_negotiate_respects_weights_and_availability(monkeypatch):
+    """Testa a escolha da codificação a partir do Accept-Encoding."""
+    monkeypatch.setattr(compression, "brotli", object())
+    assert compression.negotiate("gzip, deflate, br") == "br"
+    assert compression.negotiate("br;q=0.5, gzip") == "gzip"
+    assert compression.negotiate("br;q=0, *") == "gzip"
+    assert compression.negotiate("identity") is None
+    assert compression.negotiate(None) is None
+    monkeypatch.setattr(compression, "brotli", None)
+    assert compression.negotiate("br, gzip;q=0.1") == "gzip"
+
+
+def test_large_collection_served_compressed_from_cache(client, assert_max_queries):
+    """Testa a listagem grande: comprimida, e repetida sem serializar nem ler as linhas de novo."""
+    _criar_santos(client, 30)
+    headers = {"Accept-Encoding": "gzip"}
+
+    first = client.get("/santos/", headers=headers)
+    assert first.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in first.headers["vary"]
+    assert len(first.content) > 10 * int(first.headers["content-length"])
+    santos = first.json()
+    assert len(santos) == 30
+
+    # Repetida: só a consulta da versão (o corpo comprimido vem do cache)
+    with assert_max_queries(1):
+        again = client.get("/santos/", headers=headers)
+    assert again.json() == santos and again.headers["etag"] == first.headers["etag"]
+
+    # Sem compressão, o mesmo corpo (também do cache), com outro ETag
+    plain = client.get("/santos/", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.json() == santos
+    assert plain.headers["etag"] != first.headers["etag"]
+
+    # O ETag do gzip não revalida a cópia sem compressão; o 304 também varia pela codificação
+    identity = client.get("/santos/", headers={"Accept-Encoding": "identity", "If-None-Match": first.headers["etag"]})
+    assert identity.status_code == 200
+    not_modified = client.get("/santos/", headers={**headers, "If-None-Match": first.headers["etag"]})
+    assert not_modified.status_code == 304 and not_modified.headers["vary"] == "Accept-Encoding"
+
+    # Uma escrita muda a versão: nova resposta
+    client.patch(f"/santos/{santos[0]['id']}", json={"nome": "Santo Renomeado"})
+    changed = client.get("/santos/", headers=headers).json()
+    assert "Santo Renomeado" in [santo["nome"] for santo in changed]
+
+
+def test_collection_cache_after_deleting_latest_and_creating(client):
+    """Testa o cache da coleção após delete do santo mais recente e create: corpo novo, sem o deletado."""
+    _criar_santos(client, 30)
+    headers = {"Accept-Encoding": "gzip"}
+    santos = client.get("/santos/", headers=headers).json()
+    ultimo = max(santos, key=lambda santo: santo["id"])
+
+    client.delete(f"/santos/{ultimo['id']}")
+    client.post("/santos/", json={**ultimo, "nome": "Santa Clara"})
+    nomes = [santo["nome"] for santo in client.get("/santos/", headers=headers).json()]
+    assert "Santa Clara" in nomes and ultimo["nome"] not in nomes
+    assert len(nomes) == 30
+
+
+def test_middleware_threshold_and_streaming(client):
+    """Testa o middleware: respostas pequenas sem compressão e streaming comprimido por pedaços."""
+    _criar_santos(client, 5)
+
+    small = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+    with client.stream("GET", "/santos/export", params={"batch_size": 2}, headers={"Accept-Encoding": "gzip"}) as response:
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        raw = b"".join(response.iter_raw())
+    linhas = gzip.decompress(raw).decode("utf-8").splitlines()
+    assert len(linhas) == 5
+
+
+def test_middleware_weakens_etag_of_compressed_santo(client):
+    """Testa o ETag de um santo comprimido pelo middleware: fraco, diferente do da resposta sem compressão."""
+    historia = "Viveu em oração e penitência. " * 60
+    santo_id = client.post("/santos/", json={**santo_data_exemplo, "historia": historia}).json()["id"]
+
+    comprimido = client.get(f"/santos/{santo_id}", headers={"Accept-Encoding": "gzip"})
+    plain = client.get(f"/santos/{santo_id}", headers={"Accept-Encoding": "identity"})
+    assert comprimido.headers["content-encoding"] == "gzip"
+    assert comprimido.headers["etag"] == "W/" + plain.headers["etag"]
+
+    # O 304 revalida a cópia comprimida com o mesmo ETag fraco
+    not_modified = client.get(
+        f"/santos/{santo_id}", headers={"Accept-Encoding": "gzip", "If-None-Match": comprimido.headers["etag"]}
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == comprimido.headers["etag"]
+
+
+@pytest.mark.skipif(compression.brotli is None, reason="brotli não instalado")
+def test_brotli_round_trip(client):
+    """Testa a resposta em brotli quando o cliente aceita."""
+    _criar_santos(client, 10)
+    response = client.get("/santos/", headers={"Accept-Encoding": "br"})
+    assert response.headers["content-encoding"] == "br"
+    assert len(response.json()) == 10
@@ -0,0 +1,128 @@
+# tests/test_database.py
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.api.core.config import Settings
+from app.db.database import create_db_engine, describe_engine
+
+
+def test_engine_factory_applies_sqlite_pragmas(tmp_path):
+    """Testa se a engine criada pela fábrica aplica os PRAGMAs configurados em cada conexão."""
+    config = Settings(sqlite_busy_timeout_ms=1234, sqlite_cache_size=-2048, db_pool_size=2)
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'test.db'}", config)
+
+    info = describe_engine(engine)
+    assert info["journal_mode"] == "wal"
+    assert info["synchronous"] == 1  # NORMAL
+    assert info["busy_timeout"] == 1234
+    assert info["cache_size"] == -2048
+    assert info["temp_store"] == 2  # MEMORY
+    assert engine.pool.size() == 2
+    engine.dispose()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requer os.fork")
+def test_forked_worker_does_not_reuse_parent_connections(tmp_path):
+    """Testa se, após um fork, o filho descarta o pool herdado e abre conexões próprias."""
+    from sqlalchemy import text
+
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'fork.db'}")
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert engine.pool.checkedin() == 1
+
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            if engine.pool.checkedin() == 0:
+                with engine.connect() as conn:
+                    code = 0 if conn.execute(text("SELECT 1")).scalar() == 1 else 1
+        finally:
+            os._exit(code)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    # A conexão do pai continua no pool, intacta
+    assert engine.pool.checkedin() == 1
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT 1")).scalar() == 1
+    engine.dispose()
+
+
+def test_setup_database_only_upgrades_when_version_changes(tmp_path, monkeypatch):
+    """Testa a verificação de versão: o upgrade completo só roda em banco novo ou desatualizado."""
+    from sqlalchemy import inspect
+
+    from app.db import schema
+
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'schema.db'}")
+    assert schema.get_schema_version(engine) is None
+    assert schema.setup_database(engine) is True
+    assert {"santos", "users", "santos_fts"} <= set(inspect(engine).get_table_names())
+    assert schema.get_schema_version(engine) == schema.SCHEMA_VERSION
+
+    # Mesma versão: nenhuma etapa do upgrade roda
+    monkeypatch.setattr(schema, "ensure_schema", lambda engine: pytest.fail("upgrade desnecessário"))
+    assert schema.setup_database(engine) is False
+
+    monkeypatch.undo()
+    monkeypatch.setattr(schema, "SCHEMA_VERSION", schema.SCHEMA_VERSION + 1)
+    assert schema.setup_database(engine) is True
+    assert schema.get_schema_version(engine) == schema.SCHEMA_VERSION
+    engine.dispose()
+
+
+def test_importing_app_has_no_side_effects(tmp_path):
+    """Testa se importar app.main não toca no banco nem carrega jose/passlib."""
+    db_path = tmp_path / "nao-criado.db"
+    code = (
+        "import sys, app.main; "
+        "print([m for m in ('jose', 'passlib', 'bcrypt') if m in sys.modules])"
+    )
+    env = {**os.environ, "DATABASE_URL": f"sqlite:///{db_path}"}
+    env.pop("ASYNC_DATABASE_URL", None)
+    output = subprocess.run(
+        [sys.executable, "-c", code], env=env, check=True, capture_output=True, text=True,
+        cwd=Path(__file__).resolve().parent.parent,
+    ).stdout
+    assert output.strip() == "[]"
+    assert not db_path.exists()
+
+
+def test_read_engine_is_read_only_with_its_own_pool(tmp_path):
+    """Testa a engine de leitura: vê os commits do escritor, recusa escritas e tem pool próprio."""
+    from sqlalchemy import text
+    from sqlalchemy.exc import OperationalError
+
+    config = Settings(db_pool_size=2, db_read_pool_size=7)
+    url = f"sqlite:///{tmp_path / 'rw.db'}"
+    writer = create_db_engine(url, config)
+    reader = create_db_engine(url, config, read_only=True)
+    with writer.begin() as conn:
+        conn.execute(text("CREATE TABLE t (x INTEGER)"))
+        conn.execute(text("INSERT INTO t VALUES (1)"))
+
+    with reader.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM t")).scalar() == 1
+        assert conn.execute(text("PRAGMA query_only")).scalar() == 1
+        with pytest.raises(OperationalError):
+            conn.execute(text("INSERT INTO t VALUES (2)"))
+    # O arquivo é aberto só para leitura, mesmo sem o PRAGMA
+    with reader.connect() as conn:
+        conn.exec_driver_sql("PRAGMA query_only=0")
+        with pytest.raises(OperationalError, match="readonly"):
+            conn.execute(text("INSERT INTO t VALUES (2)"))
+
+    with writer.begin() as conn:
+        conn.execute(text("INSERT INTO t VALUES (3)"))
+    with reader.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM t")).scalar() == 2
+    assert (writer.pool.size(), reader.pool.size()) == (2, 7)
+    writer.dispose()
+    reader.dispose()
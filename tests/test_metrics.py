@@ -0,0 +1,59 @@
+# tests/test_metrics.py
+
+import logging
+
+from app.api.core import metrics
+from app.api.core.config import settings
+from tests.test_santos_routes import santo_data_exemplo
+
+
+def test_metrics_endpoint_prometheus_format(client):
+    """Testa o /metrics: latência e status por rota, comandos SQL por requisição e caches."""
+    metrics.registry.clear()
+    client.post("/santos/", json=santo_data_exemplo)
+    client.get("/santos/1")
+    client.get("/santos/9999")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert '# TYPE http_request_duration_seconds histogram' in body
+    assert 'http_requests_total{method="GET",route="/santos/{id_or_name}",status="200"} 1' in body
+    assert 'http_requests_total{method="GET",route="/santos/{id_or_name}",status="404"} 1' in body
+    assert 'http_request_duration_seconds_count{method="POST",route="/santos/"} 1' in body
+    assert 'db_queries_total{method="POST",route="/santos/"}' in body
+    assert 'cache_misses_total{cache="santos"}' in body
+    assert "password_hash_queued" in body
+
+
+def test_slow_query_is_logged_with_plan(client, monkeypatch, caplog):
+    """Testa o detector: comandos acima do limite são registrados com o plano (parâmetros só se pedidos)."""
+    monkeypatch.setattr(settings, "slow_query_ms", 0.0)
+    with caplog.at_level(logging.WARNING, logger="app.sql"):
+        client.get("/santos/sao jorge")
+
+    slow = [r.getMessage() for r in caplog.records if r.getMessage().startswith("Consulta lenta")]
+    assert slow and "GET /santos/{id_or_name}" in slow[0]
+    assert "sao jorge" not in slow[0] and "parâmetros: (omitidos)" in slow[0]
+    assert "plano: SEARCH santos USING INDEX" in slow[0]
+
+    caplog.clear()
+    monkeypatch.setattr(settings, "log_sql_parameters", True)
+    with caplog.at_level(logging.WARNING, logger="app.sql"):
+        client.get("/santos/sao bento")  # fora do cache
+    slow = [r.getMessage() for r in caplog.records if r.getMessage().startswith("Consulta lenta")]
+    assert "sao bento" in slow[0]
+
+
+def test_query_budget_is_logged(client, monkeypatch, caplog):
+    """Testa o orçamento por rota: ao estourar, o comando e o resumo da requisição vão para o log."""
+    monkeypatch.setattr(settings, "query_budgets", {"GET /santos/": 0})
+    with caplog.at_level(logging.WARNING, logger="app.sql"):
+        client.get("/santos/")
+        client.get("/santos/calendar", params={"from": "01-01"})
+
+    messages = [r.getMessage() for r in caplog.records]
+    assert any(m.startswith("Orçamento de consultas excedido em GET /santos/ ") for m in messages)
+    assert any(m.startswith("GET /santos/ executou") for m in messages)
+    assert not any("/santos/calendar" in m for m in messages)
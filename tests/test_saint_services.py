@@ -0,0 +1,209 @@
+# tests/test_saint_services.py
+
+import asyncio
+import time
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.db.database import Base
+from app.api.core.cache import LRUCache, MISSING
+from app.api.services import saint_service
+from app.schemas.saint_schema import SantosCreate, SantosUpdate
+
+santo_exemplo = SantosCreate(
+    nome="São Bento", protecao="Contra o mal", festa_liturgica="2025-07-11",
+    veneracao="Igreja Católica", local_de_nascimento="Núrsia, Itália",
+    data_de_nascimento="0480-03-02", data_de_morte="0547-03-21",
+    historia="Pai do monaquismo ocidental.", atribuicoes="Cálice, Corvo"
+)
+
+
+def test_lru_cache_eviction_and_ttl():
+    """Testa o despejo LRU, a expiração por TTL e os contadores do cache."""
+    cache = LRUCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # 'a' passa a ser o mais recente
+    cache.set("c", 3)           # despeja 'b'
+    assert cache.get("b") is MISSING
+    assert cache.get("c") == 3
+
+    cache.set("d", 4, ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get("d") is MISSING
+
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 2
+    assert stats["evictions"] == 2
+    assert stats["expirations"] == 1
+
+
+def test_santo_cache_invalidation(db_session):
+    """Testa se create/update/delete invalidam o cache de leitura."""
+    # "Não encontrado" também fica no cache...
+    assert saint_service.get_santo_cached(db_session, "são bento") is None
+
+    # ...e precisa ser invalidado pela criação
+    santo = saint_service.create_santo(db_session, santo_exemplo)
+    assert saint_service.get_santo_cached(db_session, "são bento").id == santo.id
+    assert saint_service.get_santo_cached(db_session, str(santo.id)).nome == "São Bento"
+
+    saint_service.update_santo(db_session, santo.id, SantosUpdate(nome="São Bento de Núrsia"))
+    assert saint_service.get_santo_cached(db_session, "são bento") is None
+    assert saint_service.get_santo_cached(db_session, str(santo.id)).nome == "São Bento de Núrsia"
+
+    saint_service.delete_santo(db_session, santo.id)
+    assert saint_service.get_santo_cached(db_session, str(santo.id)) is None
+    assert saint_service.get_santo_cached(db_session, "são bento de núrsia") is None
+
+
+def test_santo_cache_validated_against_other_workers_writes(db_session, monkeypatch):
+    """Testa a validação do cache: escritas que não passaram por este processo são vistas."""
+    from sqlalchemy import update
+
+    from app.api.core.config import settings
+    from app.models import saint_model
+
+    santo = saint_service.create_santo(db_session, santo_exemplo)
+    assert saint_service.get_santo_cached(db_session, str(santo.id)).nome == "São Bento"
+    assert saint_service.get_santo_cached(db_session, "santa clara") is None
+
+    # Escritas diretas no banco, como as de outro worker (sem invalidar este cache)
+    db_session.execute(
+        update(saint_model.Santos).where(saint_model.Santos.id == santo.id)
+        .values(protecao="Europa", versao=saint_service._next_version())
+    )
+    db_session.add(saint_model.Santos(**{**santo_exemplo.model_dump(), "nome": "Santa Clara"}))
+    db_session.commit()
+    assert saint_service.get_santo_cached(db_session, str(santo.id)).protecao != "Europa"
+
+    monkeypatch.setattr(settings, "santo_cache_validate", True)
+    assert saint_service.get_santo_cached(db_session, str(santo.id)).protecao == "Europa"
+    assert saint_service.get_santo_cached(db_session, "santa clara").nome == "Santa Clara"
+
+
+def test_normalized_name_is_kept_up_to_date(db_session):
+    """Testa se a coluna de nome normalizado acompanha a criação e a atualização."""
+    santo = saint_service.create_santo(db_session, santo_exemplo)
+    assert santo.nome_normalizado == "sao bento"
+
+    saint_service.update_santo(db_session, santo.id, SantosUpdate(nome="São JOSÉ"))
+    assert santo.nome_normalizado == "sao jose"
+    assert saint_service.get_santo_by_id_or_name(db_session, "sao jose").id == santo.id
+
+
+def test_async_services_with_async_session():
+    """Testa os services assíncronos com uma AsyncSession real (aiosqlite em memória)."""
+    async def scenario():
+        async_engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with async_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        async with async_sessionmaker(async_engine, expire_on_commit=False)() as db:
+            santo = await saint_service.create_santo_async(db, santo_exemplo)
+            santos = await saint_service.get_all_santos_async(db)
+            encontrado = await saint_service.get_santo_by_id_or_name_async(db, "sao bento")
+        await async_engine.dispose()
+        return santo, santos, encontrado
+
+    santo, santos, encontrado = asyncio.run(scenario())
+    assert [s.id for s in santos] == [santo.id]
+    assert encontrado.nome == "São Bento"
+
+
+def test_schema_upgrade_rebuilds_santos_with_autoincrement(tmp_path):
+    """Testa o upgrade de um banco antigo: ids e versões preservados e nunca reutilizados."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+    from sqlalchemy.schema import CreateTable
+
+    from app.db import schema
+    from app.models import saint_model
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'antigo.db'}")
+    # Tabela como era criada antes do AUTOINCREMENT e do contador de versões
+    ddl = str(CreateTable(saint_model.Santos.__table__).compile(engine)).replace(" AUTOINCREMENT", "")
+    with engine.begin() as conn:
+        conn.exec_driver_sql(ddl)
+        conn.exec_driver_sql(
+            "INSERT INTO santos (id, nome, \"versão\") VALUES (1, 'Santa Clara', 7), (2, 'São Jorge', 9)"
+        )
+    Base.metadata.create_all(bind=engine)
+    schema.ensure_schema(engine)
+
+    with engine.connect() as conn:
+        assert "AUTOINCREMENT" in conn.exec_driver_sql("SELECT sql FROM sqlite_master WHERE name = 'santos'").scalar()
+        assert conn.exec_driver_sql('SELECT id, "versão" FROM santos ORDER BY id').all() == [(1, 7), (2, 9)]
+        # A busca textual continua ligada à tabela nova
+        assert conn.exec_driver_sql("SELECT rowid FROM santos_fts WHERE santos_fts MATCH 'jorge'").all() == [(2,)]
+
+    with Session(bind=engine) as db:
+        saint_service.delete_santo(db, 2)
+        novo = saint_service.create_santo(db, santo_exemplo)
+        assert novo.id == 3 and novo.versao > 9
+    engine.dispose()
+
+
+def test_read_path_returns_rows_outside_the_identity_map(db_session):
+    """Testa o caminho de leitura em Core: Rows com os campos do schema, fora da sessão."""
+    santo = saint_service.create_santo(db_session, santo_exemplo)
+    db_session.expunge_all()
+
+    santos = saint_service.get_all_santos(db_session, limit=10)
+    encontrado = saint_service.get_santo_by_id_or_name(db_session, str(santo.id))
+    parcial = saint_service.get_santo_by_id_or_name(db_session, "sao bento", fields=("id", "nome"))
+    assert len(db_session.identity_map) == 0
+
+    assert saint_service.santo_as_dict(santos[0]) == saint_service.santo_as_dict(encontrado)
+    assert encontrado.festa_liturgica.isoformat() == "2025-07-11"
+    assert parcial._fields == ("id", "nome", "versao")
+    # O mesmo formato de requisição (outro limite) reaproveita o statement já montado
+    misses = saint_service._list_statement.cache_info().misses
+    saint_service.get_all_santos(db_session, limit=5)
+    assert saint_service._list_statement.cache_info().misses == misses
+
+
+def test_bulk_insert_stamps_version_inside_the_insert(db_session):
+    """Testa a versão do lote: calculada no próprio INSERT (sem SELECT antes), acima do contador."""
+    from sqlalchemy import event
+
+    saint_service.create_santo(db_session, santo_exemplo)
+    antes, _ = saint_service.get_collection_version(db_session)
+
+    comandos = []
+    captura = lambda conn, cursor, statement, *args: comandos.append(statement)
+    event.listen(db_session.get_bind(), "before_cursor_execute", captura)
+    try:
+        lote = [santo_exemplo.model_copy(update={"nome": f"Santo {i}"}) for i in range(3)]
+        inseridos = saint_service.bulk_insert_santos(db_session, lote)
+    finally:
+        event.remove(db_session.get_bind(), "before_cursor_execute", captura)
+    db_session.commit()
+
+    assert comandos[0].lstrip().upper().startswith("INSERT INTO SANTOS")
+    versoes = {saint_service.get_santo_version(db_session, str(santo_id))[1] for santo_id, _ in inseridos}
+    assert min(versoes) > antes
+
+
+def test_batch_update_stamps_version_inside_the_update(db_session):
+    """Testa a versão da atualização em lote: calculada no próprio UPDATE, acima do contador."""
+    from sqlalchemy import event
+
+    from app.schemas.saint_schema import SantosBatchUpdateItem
+
+    ids = [saint_service.create_santo(db_session, santo_exemplo.model_copy(update={"nome": f"Santo {i}"})).id
+           for i in range(2)]
+    antes, _ = saint_service.get_collection_version(db_session)
+
+    comandos = []
+    captura = lambda conn, cursor, statement, *args: comandos.append(statement)
+    event.listen(db_session.get_bind(), "before_cursor_execute", captura)
+    try:
+        saint_service.batch_update_santos(db_session, [SantosBatchUpdateItem(id=i, protecao="Europa") for i in ids])
+    finally:
+        event.remove(db_session.get_bind(), "before_cursor_execute", captura)
+
+    # Nenhuma leitura do contador fora do UPDATE
+    assert not [c for c in comandos if c.lstrip().upper().startswith("SELECT") and "santos_versao" in c]
+    assert all(saint_service.get_santo_version(db_session, str(i))[1] > antes for i in ids)
@@ -1,5 +1,7 @@
 # tests/test_santos_routes.py
 
+import json
+
 santo_data_exemplo = {
     "nome": "São Francisco de Assis", "protecao": "Animais e Natureza",
     "festa_liturgica": "2025-10-04", "veneracao": "Igreja Católica",
@@ -91,4 +93,474 @@ def test_delete_santo_endpoint(client):
 def test_delete_santo_not_found(client):
     """Testa se a deleção de um santo inexistente retorna 404."""
     response = client.delete("/santos/9999")
-    assert response.status_code == 404
\ No newline at end of file
+    assert response.status_code == 404
+
+
+def test_get_all_santos_keyset_pagination(client):
+    """Testa a paginação por cursor da listagem de santos."""
+    for nome in ["São Bento", "Santa Clara", "São Jorge", "Santo Antônio", "São Pedro"]:
+        client.post("/santos/", json={**santo_data_exemplo, "nome": nome})
+
+    nomes = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/santos/", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page) <= 2
+        nomes.extend(santo["nome"] for santo in page)
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert nomes == sorted(nomes)
+    assert len(nomes) == 5
+
+def test_get_all_santos_invalid_cursor(client):
+    """Testa se um cursor malformado retorna 400."""
+    response = client.get("/santos/", params={"cursor": "nao-e-um-cursor"})
+    assert response.status_code == 400
+
+def test_export_santos_ndjson(client):
+    """Testa a exportação em NDJSON do catálogo completo."""
+    for nome in ["São Bento", "Santa Clara", "São Jorge"]:
+        client.post("/santos/", json={**santo_data_exemplo, "nome": nome})
+
+    response = client.get("/santos/export", params={"batch_size": 2})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    linhas = [json.loads(linha) for linha in response.text.splitlines()]
+    assert [santo["nome"] for santo in linhas] == ["Santa Clara", "São Bento", "São Jorge"]
+
+def test_export_santos_json_array(client):
+    """Testa a exportação como array JSON, inclusive com a tabela vazia."""
+    response = client.get("/santos/export", params={"format": "json"})
+    assert response.status_code == 200
+    assert response.json() == []
+
+    client.post("/santos/", json=santo_data_exemplo)
+    client.post("/santos/", json={**santo_data_exemplo, "nome": "São Jorge"})
+    response = client.get("/santos/export", params={"format": "json", "batch_size": 1})
+    assert len(response.json()) == 2
+
+def test_search_santos_endpoint(client):
+    """Testa a busca textual com ranking, trecho destacado e sincronia com as escritas."""
+    client.post("/santos/", json=santo_data_exemplo)
+    response_create = client.post("/santos/", json={
+        **santo_data_exemplo, "nome": "São Pedro Gonçalves",
+        "protecao": "Padroeiro dos marinheiros", "historia": "Pregador dominicano."
+    })
+    santo_id = response_create.json()["id"]
+
+    response = client.get("/santos/search", params={"q": "padroeiro dos marinheiros"})
+    assert response.status_code == 200
+    resultados = response.json()
+    assert [r["id"] for r in resultados] == [santo_id]
+    assert "<mark>" in resultados[0]["snippet"]
+
+    # Insensível a acentos e atualizado pelo PATCH
+    client.patch(f"/santos/{santo_id}", json={"protecao": "Navegantes"})
+    assert client.get("/santos/search", params={"q": "marinheiros"}).json() == []
+    assert len(client.get("/santos/search", params={"q": "goncalves"}).json()) == 1
+
+    client.delete(f"/santos/{santo_id}")
+    assert client.get("/santos/search", params={"q": "goncalves"}).json() == []
+
+def test_get_santo_by_name_ignores_accents_and_case(client):
+    """Testa a busca por nome sem acentos e com caixa diferente (inclusive fora do ASCII)."""
+    client.post("/santos/", json=santo_data_exemplo)
+    for nome in ["sao francisco de assis", "SÃO FRANCISCO DE ASSIS", "São  Francisco de Assís"]:
+        response = client.get(f"/santos/{nome}")
+        assert response.status_code == 200, nome
+        assert response.json()["nome"] == "São Francisco de Assis"
+
+def test_import_santos_jsonl_with_errors(client):
+    """Testa a importação em lote de JSONL, reportando linhas inválidas sem abortar."""
+    linhas = [
+        json.dumps({**santo_data_exemplo, "nome": "São Bento"}),
+        "isto não é json",
+        json.dumps({**santo_data_exemplo, "nome": "Santa Clara"}),
+        json.dumps({**santo_data_exemplo, "festa_liturgica": "não é data"}),
+        json.dumps({**santo_data_exemplo, "nome": "São Jorge"}),
+    ]
+    arquivo = ("santos.jsonl", "\n".join(linhas).encode("utf-8"), "application/x-ndjson")
+
+    response = client.post("/santos/import", files={"file": arquivo}, params={"chunk_size": 2, "commit_every": 2})
+    assert response.status_code == 200, response.text
+    report = response.json()
+    assert report["inserted"] == 3
+    assert report["failed"] == 2
+    assert [erro["line"] for erro in report["errors"]] == [2, 4]
+
+    # As linhas importadas ficam visíveis nas leituras (inclusive na busca por nome normalizado)
+    assert client.get("/santos/sao jorge").status_code == 200
+
+def test_import_santos_csv(client):
+    """Testa a importação em lote de CSV."""
+    campos = list(santo_data_exemplo)
+    linhas = [",".join(campos), ",".join(f'"{santo_data_exemplo[campo]}"' for campo in campos)]
+    arquivo = ("santos.csv", "\n".join(linhas).encode("utf-8"), "text/csv")
+
+    response = client.post("/santos/import", files={"file": arquivo})
+    assert response.json() == {"inserted": 1, "failed": 0, "errors": []}
+    assert client.get("/santos/são francisco de assis").status_code == 200
+
+def test_import_santos_unreadable_file_reports_error(client):
+    """Testa arquivos ilegíveis (fora do UTF-8, campo CSV grande demais): erro reportado, sem 500."""
+    import csv
+
+    linhas = [json.dumps({**santo_data_exemplo, "nome": f"Santo {i}"}).encode("utf-8") for i in range(3)]
+    linhas.insert(2, b'{"nome": "S\xe3o Jorge"}')  # Latin-1
+    response = client.post(
+        "/santos/import", params={"chunk_size": 1, "commit_every": 1},
+        files={"file": ("santos.jsonl", b"\n".join(linhas), "application/x-ndjson")},
+    )
+    assert response.status_code == 200
+    relatorio = response.json()
+    assert relatorio["inserted"] == 3 and relatorio["failed"] == 1
+    assert relatorio["errors"][0]["line"] == 3 and "utf-8" in relatorio["errors"][0]["error"]
+
+    campos = list(santo_data_exemplo)
+    linhas = [",".join(campos), ",".join(f'"{santo_data_exemplo[campo]}"' for campo in campos)]
+    linhas.append(",".join(["Santo Grande", "x" * (csv.field_size_limit() + 1)] + [""] * (len(campos) - 2)))
+    arquivo = ("santos.csv", "\n".join(linhas).encode("utf-8"), "text/csv")
+    response = client.post("/santos/import", files={"file": arquivo})
+    assert response.status_code == 200
+    assert response.json()["inserted"] == 1 and response.json()["errors"][0]["line"] == 3
+
+def test_batch_update_santos(client):
+    """Testa a atualização em lote, com ids inexistentes reportados."""
+    id_a = client.post("/santos/", json=santo_data_exemplo).json()["id"]
+    id_b = client.post("/santos/", json={**santo_data_exemplo, "nome": "São Jorge"}).json()["id"]
+    client.get(f"/santos/{id_a}")  # popula o cache
+
+    response = client.patch("/santos/batch", json=[
+        {"id": id_a, "protecao": "Ecologia"},
+        {"id": id_b, "nome": "São Jorge da Capadócia"},
+        {"id": 9999, "protecao": "Ninguém"},
+    ])
+    assert response.status_code == 200, response.text
+    assert response.json() == {"affected": [id_a, id_b], "missing": [9999]}
+
+    assert client.get(f"/santos/{id_a}").json()["protecao"] == "Ecologia"
+    assert client.get("/santos/sao jorge da capadocia").json()["id"] == id_b
+
+def test_batch_update_skips_items_without_changes(client):
+    """Testa itens sem campos na atualização em lote: nem atualizados, nem avisados como escrita."""
+    from app.api.services import saint_service
+
+    santo_id = client.post("/santos/", json=santo_data_exemplo).json()["id"]
+    avisos = []
+    avisar = lambda: avisos.append(1)
+    saint_service.add_change_listener(avisar)
+    try:
+        response = client.patch("/santos/batch", json=[{"id": santo_id}])
+    finally:
+        saint_service.remove_change_listener(avisar)
+    assert response.status_code == 200, response.text
+    assert response.json() == {"affected": [], "missing": []}
+    assert avisos == []
+
+def test_batch_delete_santos(client):
+    """Testa a deleção em lote, com ids inexistentes reportados."""
+    id_a = client.post("/santos/", json=santo_data_exemplo).json()["id"]
+    id_b = client.post("/santos/", json={**santo_data_exemplo, "nome": "São Jorge"}).json()["id"]
+    client.get(f"/santos/{id_b}")  # popula o cache
+
+    response = client.request("DELETE", "/santos/batch", json={"ids": [id_a, id_b, 9999]})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"affected": [id_a, id_b], "missing": [9999]}
+    assert client.get(f"/santos/{id_b}").status_code == 404
+    assert client.get("/santos/").json() == []
+
+def test_get_santos_calendar(client):
+    """Testa o calendário litúrgico, inclusive um intervalo que atravessa a virada do ano."""
+    festas = {"Santa Luzia": "2025-12-13", "São Silvestre": "2025-12-31",
+              "Santa Maria": "2025-01-01", "São Jorge": "2025-04-23"}
+    for nome, festa in festas.items():
+        client.post("/santos/", json={**santo_data_exemplo, "nome": nome, "festa_liturgica": festa})
+
+    response = client.get("/santos/calendar", params={"from": "04-01", "to": "04-30"})
+    assert response.status_code == 200
+    assert [s["nome"] for s in response.json()] == ["São Jorge"]
+
+    response = client.get("/santos/calendar", params={"from": "12-20", "to": "01-06"})
+    assert [s["nome"] for s in response.json()] == ["São Silvestre", "Santa Maria"]
+
+    # A data da festa pode mudar: o índice de mês/dia acompanha
+    santo_id = client.get("/santos/santa luzia").json()["id"]
+    client.patch(f"/santos/{santo_id}", json={"festa_liturgica": "2025-12-25"})
+    response = client.get("/santos/calendar", params={"from": "12-20", "to": "01-06"})
+    assert [s["nome"] for s in response.json()] == ["Santa Luzia", "São Silvestre", "Santa Maria"]
+
+    assert client.get("/santos/calendar", params={"from": "13-01"}).status_code == 400
+
+def test_get_santo_conditional_etag(client):
+    """Testa o ETag de um santo e o 304 com If-None-Match; o ETag muda após um PATCH."""
+    santo_id = client.post("/santos/", json=santo_data_exemplo).json()["id"]
+
+    response = client.get(f"/santos/{santo_id}")
+    etag = response.headers["ETag"]
+    assert client.get(f"/santos/{santo_id}", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/santos/sao francisco de assis", headers={"If-None-Match": etag}).status_code == 304
+
+    client.patch(f"/santos/{santo_id}", json={"protecao": "Ecologia"})
+    response = client.get(f"/santos/{santo_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+def test_get_all_santos_conditional_etag(client):
+    """Testa o ETag da coleção: muda com create, update e delete."""
+    santo_id = client.post("/santos/", json=santo_data_exemplo).json()["id"]
+    etag = client.get("/santos/").headers["ETag"]
+    assert client.get("/santos/", headers={"If-None-Match": etag}).status_code == 304
+    # Parâmetros diferentes, resposta diferente
+    assert client.get("/santos/", params={"limit": 1}, headers={"If-None-Match": etag}).status_code == 200
+
+    etags = {etag}
+    outro_id = client.post("/santos/", json={**santo_data_exemplo, "nome": "São Jorge"}).json()["id"]
+    etags.add(client.get("/santos/").headers["ETag"])
+    client.patch(f"/santos/{santo_id}", json={"protecao": "Ecologia"})
+    etags.add(client.get("/santos/").headers["ETag"])
+    client.delete(f"/santos/{outro_id}")
+    etags.add(client.get("/santos/").headers["ETag"])
+    assert len(etags) == 4
+
+def test_etags_change_after_deleting_latest_and_creating(client):
+    """Testa delete do santo mais recente seguido de create: nem o id nem a versão se repetem."""
+    client.post("/santos/", json=santo_data_exemplo)
+    ultimo_id = client.post("/santos/", json={**santo_data_exemplo, "nome": "São Jorge"}).json()["id"]
+    etag_colecao = client.get("/santos/").headers["ETag"]
+    etag_santo = client.get(f"/santos/{ultimo_id}").headers["ETag"]
+
+    client.delete(f"/santos/{ultimo_id}")
+    novo_id = client.post("/santos/", json={**santo_data_exemplo, "nome": "Santa Clara"}).json()["id"]
+    assert novo_id != ultimo_id
+
+    colecao = client.get("/santos/", headers={"If-None-Match": etag_colecao})
+    assert colecao.status_code == 200 and colecao.headers["ETag"] != etag_colecao
+    santo = client.get(f"/santos/{novo_id}", headers={"If-None-Match": etag_santo})
+    assert santo.status_code == 200 and santo.headers["ETag"] != etag_santo
+
+def test_fast_json_matches_default_serialization(client, monkeypatch):
+    """Testa se o caminho rápido (orjson) gera o mesmo JSON que o caminho padrão."""
+    from app.api.core.config import settings
+
+    santo_id = client.post("/santos/", json=santo_data_exemplo).json()["id"]
+    client.post("/santos/", json={**santo_data_exemplo, "nome": "São Jorge", "data_de_nascimento": "0275-01-01"})
+
+    padrao = [client.get("/santos/").json(), client.get(f"/santos/{santo_id}").json()]
+    monkeypatch.setattr(settings, "fast_json", True)
+    rapido = [client.get("/santos/"), client.get(f"/santos/{santo_id}")]
+
+    assert [r.json() for r in rapido] == padrao
+    assert all("ETag" in r.headers for r in rapido)
+
+def test_sparse_fieldsets(client):
+    """Testa o parâmetro 'fields': só os campos pedidos (e o id) voltam na resposta."""
+    santo_id = client.post("/santos/", json=santo_data_exemplo).json()["id"]
+    client.post("/santos/", json={**santo_data_exemplo, "nome": "São Jorge", "festa_liturgica": "2025-04-23"})
+
+    response = client.get("/santos/", params={"fields": "nome,festa_liturgica", "limit": 1})
+    assert response.status_code == 200, response.text
+    assert response.json() == [{"id": santo_id, "nome": "São Francisco de Assis", "festa_liturgica": "2025-10-04"}]
+    # O cursor continua funcionando mesmo sem o nome no fieldset
+    cursor = client.get("/santos/", params={"fields": "id", "limit": 1}).headers["X-Next-Cursor"]
+    assert [s["nome"] for s in client.get("/santos/", params={"fields": "nome", "cursor": cursor}).json()] == ["São Jorge"]
+
+    response = client.get(f"/santos/{santo_id}", params={"fields": "protecao"})
+    assert response.json() == {"id": santo_id, "protecao": "Animais e Natureza"}
+    assert response.headers["ETag"] == client.get(f"/santos/{santo_id}").headers["ETag"]
+    # Com o santo completo já em cache, o subconjunto sai dele
+    assert client.get(f"/santos/{santo_id}", params={"fields": "nome"}).json() == {
+        "id": santo_id, "nome": "São Francisco de Assis"
+    }
+
+    response = client.get("/santos/calendar", params={"from": "10-04", "fields": "nome"})
+    assert response.json() == [{"id": santo_id, "nome": "São Francisco de Assis"}]
+
+    assert client.get("/santos/", params={"fields": "nome,senha"}).status_code == 400
+
+def test_santos_reads_stay_within_query_budget(client, assert_max_queries):
+    """Testa o número de comandos SQL das leituras (pega N+1 e consultas extras)."""
+    for nome in ("São Jorge", "Santa Luzia", "São Bento"):
+        client.post("/santos/", json={**santo_data_exemplo, "nome": nome})
+
+    with assert_max_queries(2) as finished:
+        assert client.get("/santos/").status_code == 200
+        assert client.get("/santos/sao jorge").status_code == 200
+    assert [q.route for q in finished] == ["GET /santos/", "GET /santos/{id_or_name}"]
+
+    # Com o santo em cache, nenhuma consulta
+    with assert_max_queries(0):
+        client.get("/santos/sao jorge")
+
+def test_santos_stats_follow_every_write_path(client, db_session):
+    """Testa as estatísticas incrementais: batem com um recálculo completo após cada tipo de escrita."""
+    from app.api.services import stats_service
+
+    jorge = client.post("/santos/", json={
+        **santo_data_exemplo, "nome": "São Jorge", "veneracao": "Igreja Ortodoxa",
+        "local_de_nascimento": "Capadócia, Turquia", "data_de_morte": "0303-04-23",
+    }).json()["id"]
+    francisco = client.post("/santos/", json=santo_data_exemplo).json()["id"]
+
+    stats = client.get("/santos/stats").json()
+    assert stats == {
+        "total": 2,
+        "veneracao": {"Igreja Católica": 1, "Igreja Ortodoxa": 1},
+        "seculo_morte": {"4": 1, "13": 1},
+        "regiao_nascimento": {"Itália": 1, "Turquia": 1},
+    }
+
+    client.patch(f"/santos/{jorge}", json={"veneracao": "Igreja Católica"})
+    linhas = "\n".join(json.dumps({**santo_data_exemplo, "nome": f"Santo {i}"}) for i in range(3))
+    client.post("/santos/import", files={"file": ("s.jsonl", linhas.encode("utf-8"), "application/x-ndjson")})
+    client.patch("/santos/batch", json=[{"id": francisco, "local_de_nascimento": "Lisboa, Portugal"}])
+    client.request("DELETE", "/santos/batch", json={"ids": [jorge]})
+    client.delete(f"/santos/{francisco}")
+
+    stats = client.get("/santos/stats").json()
+    assert stats == {
+        "total": 3,
+        "veneracao": {"Igreja Católica": 3},
+        "seculo_morte": {"13": 3},
+        "regiao_nascimento": {"Itália": 3},
+    }
+    stats_service.rebuild_stats(db_session)
+    assert client.get("/santos/stats").json() == stats
+
+def test_santos_filters_and_facets(client, assert_max_queries):
+    """Testa os filtros da listagem (veneração, proteção, intervalos de datas) e as facetas."""
+    client.post("/santos/", json=santo_data_exemplo)  # morte em 1226
+    client.post("/santos/", json={
+        **santo_data_exemplo, "nome": "São Jorge", "veneracao": "Igreja Ortodoxa",
+        "protecao": "Soldados", "data_de_nascimento": "0275-01-01", "data_de_morte": "0303-04-23",
+    })
+    client.post("/santos/", json={
+        **santo_data_exemplo, "nome": "Santa Teresinha", "protecao": "Missões",
+        "data_de_nascimento": "1873-01-02", "data_de_morte": "1897-09-30",
+    })
+
+    def nomes(**params):
+        response = client.get("/santos/", params=params)
+        assert response.status_code == 200
+        return [santo["nome"] for santo in response.json()]
+
+    assert nomes(veneracao="Igreja Católica") == ["Santa Teresinha", "São Francisco de Assis"]
+    assert nomes(veneracao=["Igreja Ortodoxa", "Outra"]) == ["São Jorge"]
+    assert nomes(protecao="Missões", veneracao="Igreja Católica") == ["Santa Teresinha"]
+    assert nomes(morte_de="1000-01-01", morte_ate="1300-12-31") == ["São Francisco de Assis"]
+    assert nomes(nascimento_ate="1800-01-01", limit=1) == ["São Francisco de Assis"]
+    assert client.get("/santos/", params={"morte_de": "1900-01-01", "morte_ate": "1800-01-01"}).status_code == 400
+
+    # Todas as facetas numa única consulta
+    with assert_max_queries(1):
+        facets = client.get("/santos/facets", params={"morte_de": "1000-01-01"}).json()
+    assert facets == {
+        "total": 2,
+        "veneracao": {"Igreja Católica": 2},
+        "protecao": {"Animais e Natureza": 1, "Missões": 1},
+    }
+
+def test_santos_filters_use_composite_indexes(db_session):
+    """Testa se os filtros viram buscas nos índices compostos, sem varrer a tabela."""
+    from datetime import date
+
+    from sqlalchemy import select, text
+
+    from app.api.services import saint_service
+    from app.models import saint_model
+    from app.schemas import saint_schema
+
+    def plan(filters, ordered=True):
+        query = select(saint_model.Santos.id).where(*saint_service.filter_clauses(filters))
+        if ordered:
+            query = query.order_by(saint_model.Santos.nome, saint_model.Santos.id)
+        sql = str(query.compile(compile_kwargs={"literal_binds": True}))
+        return " ".join(row[-1] for row in db_session.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+
+    por_veneracao = plan(saint_schema.SantosFilters(veneracao=["Igreja Católica"]))
+    assert "ix_santos_veneracao_nome" in por_veneracao and "TEMP B-TREE" not in por_veneracao
+    # Intervalo de datas (como nas facetas): range scan no índice da data de morte
+    por_morte = plan(saint_schema.SantosFilters(morte_de=date(1000, 1, 1), morte_ate=date(1300, 1, 1)), ordered=False)
+    assert "ix_santos_morte_veneracao" in por_morte
+
+def test_suggest_follows_writes_without_queries(client, assert_max_queries):
+    """Testa as sugestões de nomes: prefixos, acentos, erros de digitação e escritas, sem SQL."""
+    francisco = client.post("/santos/", json=santo_data_exemplo).json()["id"]
+    client.post("/santos/", json={**santo_data_exemplo, "nome": "São Francisco Xavier"})
+    client.post("/santos/", json={**santo_data_exemplo, "nome": "Santa Teresinha"})
+
+    def sugestoes(q, **params):
+        response = client.get("/santos/suggest", params={"q": q, **params})
+        assert response.status_code == 200
+        return [item["nome"] for item in response.json()]
+
+    with assert_max_queries(0):
+        # Mais curtos primeiro; acentos e maiúsculas ignorados; cada palavra é um prefixo
+        assert sugestoes("sao fran") == ["São Francisco Xavier", "São Francisco de Assis"]
+        assert sugestoes("FRANC ASS") == ["São Francisco de Assis"]
+        assert sugestoes("s", limit=1) == ["Santa Teresinha"]
+        # Erro de digitação
+        assert sugestoes("fransisco xavier") == ["São Francisco Xavier"]
+        assert sugestoes("jorge") == []
+
+    client.patch(f"/santos/{francisco}", json={"nome": "São Jorge"})
+    assert sugestoes("jor") == ["São Jorge"]
+    assert sugestoes("francisco") == ["São Francisco Xavier"]
+    client.delete(f"/santos/{francisco}")
+    assert sugestoes("jor") == []
+
+def test_sync_name_index_picks_up_other_workers_writes(client, db_session):
+    """Testa a sincronização do índice com escritas que não passaram por este processo."""
+    from app.api.services import saint_service
+    from app.models import saint_model
+    from app.schemas import saint_schema
+
+    ids = [client.post("/santos/", json={**santo_data_exemplo, "nome": f"Santo {i}"}).json()["id"] for i in range(3)]
+    assert saint_service.load_name_index(db_session) == 3
+    assert saint_service.sync_name_index(db_session) is False
+
+    # Escritas diretas no banco, como as de outro worker
+    clara = saint_schema.SantosCreate(**{**santo_data_exemplo, "nome": "Santa Clara"})
+    db_session.add(saint_model.Santos(**clara.model_dump(), versao=100))
+    db_session.query(saint_model.Santos).filter(saint_model.Santos.id == ids[0]).delete()
+    db_session.commit()
+
+    assert saint_service.sync_name_index(db_session) is True
+    assert [s.nome for s in saint_service.suggest_santos("santa clara")] == ["Santa Clara"]
+    assert [s.nome for s in saint_service.suggest_santos("santo")] == ["Santo 1", "Santo 2"]
+
+def test_changes_feed_upserts_and_tombstones(client, assert_max_queries):
+    """Testa o feed de alterações: ordem de seq, só a alteração mais recente de cada santo e lápides."""
+    ids = [client.post("/santos/", json={**santo_data_exemplo, "nome": f"Santo {i}"}).json()["id"] for i in range(3)]
+    inicio = client.get("/santos/changes").json()
+    assert [change["id"] for change in inicio["changes"]] == ids
+    assert inicio["has_more"] is False
+    since = inicio["next_since"]
+
+    client.patch(f"/santos/{ids[0]}", json={"protecao": "Ecologia"})
+    client.delete(f"/santos/{ids[1]}")
+    client.patch("/santos/batch", json=[{"id": ids[0], "nome": "Santo Zero"}])
+
+    with assert_max_queries(1):
+        feed = client.get("/santos/changes", params={"since": since}).json()
+    assert [(change["id"], change["deleted"]) for change in feed["changes"]] == [(ids[1], True), (ids[0], False)]
+    assert feed["changes"][0]["santo"] is None
+    assert feed["changes"][1]["santo"]["nome"] == "Santo Zero"
+    assert feed["changes"][1]["santo"]["protecao"] == "Ecologia"
+
+    # Paginação: a próxima página começa em next_since
+    primeira = client.get("/santos/changes", params={"limit": 2}).json()
+    assert primeira["has_more"] is True and len(primeira["changes"]) == 2
+    resto = client.get("/santos/changes", params={"since": primeira["next_since"]}).json()
+    assert resto["has_more"] is False
+    assert [c["id"] for c in primeira["changes"] + resto["changes"]] == [ids[2], ids[1], ids[0]]
+
+    # Nada novo: next_since fica igual
+    final = client.get("/santos/changes", params={"since": resto["next_since"]}).json()
+    assert final == {"changes": [], "next_since": resto["next_since"], "has_more": False}
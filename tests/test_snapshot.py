@@ -0,0 +1,103 @@
+# tests/test_snapshot.py
+
+import asyncio
+import gzip
+
+import pytest
+
+from app.api.core.config import settings
+from app.api.services import saint_service, snapshot_service
+from tests.test_compression import _criar_santos
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "snapshot_dir", str(tmp_path))
+    return tmp_path
+
+
+def test_snapshot_served_from_disk_without_queries(client, db_session, snapshot_dir, assert_max_queries):
+    """Testa o snapshot: mesmo conteúdo da listagem, comprimido, condicional e parcial, sem SQL."""
+    assert client.get("/santos/snapshot").status_code == 503
+
+    _criar_santos(client, 20)
+    assert snapshot_service.build_snapshot(db_session) is True
+    # Sem escritas, não há geração nova
+    assert snapshot_service.build_snapshot(db_session) is False
+    listagem = client.get("/santos/", params={"limit": 100}).json()
+
+    with assert_max_queries(0):
+        plain = client.get("/santos/snapshot", headers={"Accept-Encoding": "identity"})
+        gz = client.get("/santos/snapshot", headers={"Accept-Encoding": "gzip"})
+        not_modified = client.get(
+            "/santos/snapshot", headers={"Accept-Encoding": "identity", "If-None-Match": plain.headers["etag"]}
+        )
+        partial = client.get("/santos/snapshot", headers={"Accept-Encoding": "identity", "Range": "bytes=0-9"})
+
+    assert plain.json() == listagem
+    assert gz.headers["content-encoding"] == "gzip" and gz.headers["etag"] != plain.headers["etag"]
+    assert gz.json() == listagem
+    with gzip.open(snapshot_service.current_file("gzip")) as arquivo:
+        assert arquivo.read() == plain.content
+    assert not_modified.status_code == 304
+    assert partial.status_code == 206 and partial.content == plain.content[:10]
+    assert partial.headers["content-range"] == f"bytes 0-9/{len(plain.content)}"
+
+
+def test_snapshot_regenerated_after_writes(client, db_session, snapshot_dir):
+    """Testa a troca de geração após uma escrita: link novo e só a geração anterior mantida."""
+    _criar_santos(client, 3)
+    snapshot_service.build_snapshot(db_session)
+    primeira = snapshot_service.current_file()
+    etag = client.get("/santos/snapshot").headers["etag"]
+
+    santo_id = client.get("/santos/").json()[0]["id"]
+    client.patch(f"/santos/{santo_id}", json={"nome": "Santo Renomeado"})
+    assert snapshot_service.build_snapshot(db_session) is True
+    response = client.get("/santos/snapshot", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert "Santo Renomeado" in [santo["nome"] for santo in response.json()]
+
+    client.delete(f"/santos/{santo_id}")
+    snapshot_service.build_snapshot(db_session)
+    assert len(client.get("/santos/snapshot").json()) == 2
+    geracoes = {snapshot_service.generation_of(path) for path in snapshot_dir.glob("santos-*")}
+    assert len(geracoes) == 2 and snapshot_service.generation_of(primeira) not in geracoes
+
+
+def test_snapshot_regenerated_after_deleting_latest_and_creating(client, db_session, snapshot_dir):
+    """Testa delete do santo mais recente seguido de create: mesma contagem, geração e arquivo novos."""
+    _criar_santos(client, 3)
+    snapshot_service.build_snapshot(db_session)
+    primeira = snapshot_service.current_file()
+    ultimo = max(client.get("/santos/snapshot").json(), key=lambda santo: santo["id"])
+
+    client.delete(f"/santos/{ultimo['id']}")
+    client.post("/santos/", json={**ultimo, "nome": "Santa Clara"})
+    assert snapshot_service.build_snapshot(db_session) is True
+    assert snapshot_service.current_file() != primeira
+    nomes = [santo["nome"] for santo in client.get("/santos/snapshot").json()]
+    assert "Santa Clara" in nomes and ultimo["nome"] not in nomes
+
+
+def test_scheduler_debounces_writes():
+    """Testa o agendador: uma rajada de escritas gera uma única regeneração."""
+    builds = []
+    scheduler = snapshot_service.SnapshotScheduler(lambda: builds.append(1) or True, debounce=0.05, max_delay=1.0)
+
+    async def scenario():
+        task = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(0.02)
+        assert len(builds) == 1  # geração inicial
+        saint_service.add_change_listener(scheduler.notify)
+        try:
+            for i in range(5):
+                # As escritas rodam no threadpool: o aviso vem de outra thread
+                await asyncio.to_thread(saint_service.invalidate_santos, [(i, f"Santo {i}")])
+        finally:
+            saint_service.remove_change_listener(scheduler.notify)
+        await asyncio.sleep(0.2)
+        task.cancel()
+
+    asyncio.run(scenario())
+    assert len(builds) == 2
@@ -30,4 +30,25 @@ def test_get_user_by_username_service(db_session):
     assert found_user.username == "findme"
 
     not_found_user = user_service.get_user_by_username(db=db_session, username="ghost")
-    assert not_found_user is None
\ No newline at end of file
+    assert not_found_user is None
+
+def test_principal_cache_respects_token_expiry():
+    """Testa se o cache de usuários autenticados nunca passa do 'exp' do token."""
+    import time
+    from app.api.core.cache import MISSING, PrincipalCache
+    from app.schemas.user_schema import User
+
+    cache = PrincipalCache(maxsize=10, ttl=60)
+    user = User(id=1, username="u", email="u@test.com")
+
+    cache.set("expirado", user, expires_at=time.time() - 1)
+    assert cache.get("expirado") is MISSING
+
+    cache.set("quase", user, expires_at=time.time() + 0.01)
+    time.sleep(0.02)
+    assert cache.get("quase") is MISSING
+
+    cache.set("valido", user, expires_at=time.time() + 600)
+    assert cache.get("valido") == user
+    assert cache.invalidate_user(1) == 1
+    assert cache.get("valido") is MISSING